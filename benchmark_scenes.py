@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark of every scene in scenes/.
+
+Each scene class runs on its own with the Animator, on an in-memory
+canvas that only counts what reaches it, with a seeded `random` and a
+virtual clock (time.time() and get_now() advance one frame period per
+frame, starting from --date). Results are reproducible run to run, so
+a change in the numbers is a change in the code.
+
+Per scene it reports frames/sec, SetPixel and SetImage calls per frame,
+memory allocated per frame (the peak traced by tracemalloc while a
+frame runs, averaged) and peak memory over construction and the traced
+frames.
+
+Usage:
+    python benchmark_scenes.py                       # all scenes, 3000 frames
+    python benchmark_scenes.py fireplace rain        # scenes whose module matches
+    python benchmark_scenes.py --frames=500 --json=bench.json
+    python benchmark_scenes.py --json=-              # JSON on stdout only
+    python benchmark_scenes.py --date=2026-12-24T21:00 christmas
+
+Needs RGBMatrixEmulator for graphics.DrawText on a plain canvas.
+"""
+import argparse
+import gc
+import importlib
+import json
+import pkgutil
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest import mock
+
+from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions, graphics
+
+sys.modules['rgbmatrix'] = type(sys)('rgbmatrix')
+sys.modules['rgbmatrix'].RGBMatrix = RGBMatrix
+sys.modules['rgbmatrix'].RGBMatrixOptions = RGBMatrixOptions
+sys.modules['rgbmatrix'].graphics = graphics
+
+
+# demo mode, like test_animation.py: every scene falls back to its defaults
+class FakeConfigModule:
+    def __getattr__(self, name):
+        raise ImportError("Demo mode - no config")
+
+
+sys.modules['config'] = FakeConfigModule()
+
+import numpy as np
+
+import scenes
+from setup import frames, screen
+from utilities import datenow
+from utilities.animator import Animator, PHASE_PRESENT
+from utilities.flightinfo import FlightInfo
+
+DEFAULT_FRAMES = 3000
+DEFAULT_SEED = 1
+DEFAULT_DATE = "2026-10-16T20:00"
+MEMORY_FRAMES = 100  # frames run under tracemalloc, before the timed ones
+
+# scenes that only draw with a flight on screen
+FLIGHT_SCENES = {"FlightDetailsScene", "JourneyScene", "PlaneDetailsScene", "PlaneIntroScene"}
+
+SAMPLE_FLIGHT = dict(
+    id="bench",
+    plane="Boeing 737-800",
+    origin="JFK",
+    destination="LAX",
+    vertical_speed=0,
+    altitude=5000,
+    callsign="AAL123",
+    bearing=200,
+)
+
+
+class CountingCanvas(object):
+    width = screen.WIDTH
+    height = screen.HEIGHT
+
+    def __init__(self):
+        self.set_pixel = 0
+        self.set_image = 0
+
+    def SetPixel(self, x, y, r, g, b):
+        self.set_pixel += 1
+
+    def SetImage(self, image, x=0, y=0):
+        self.set_image += 1
+
+    def Clear(self):
+        pass
+
+    def Fill(self, r, g, b):
+        pass
+
+
+class VirtualClock(object):
+    def __init__(self, start):
+        self.start = start
+        self.elapsed = 0.0
+
+    def advance(self, seconds):
+        self.elapsed += seconds
+
+    def now(self):
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def time(self):
+        return self.start.timestamp() + self.elapsed
+
+
+class MockOverhead:
+    processing = False
+    new_data = False
+    data_is_empty = True
+    data = []
+
+    def grab_data(self):
+        pass
+
+    def pause(self):
+        pass
+
+
+def discover_scenes(patterns=()):
+    """(module name, class) for every *Scene class in the scenes package."""
+    found = []
+    for info in sorted(pkgutil.iter_modules(scenes.__path__), key=lambda i: i.name):
+        if patterns and not any(p in info.name for p in patterns):
+            continue
+        try:
+            module = importlib.import_module(f"scenes.{info.name}")
+        except Exception as e:
+            found.append((info.name, e))
+            continue
+        for name, obj in sorted(vars(module).items()):
+            if (
+                isinstance(obj, type)
+                and name.endswith("Scene")
+                and obj.__module__ == module.__name__
+            ):
+                found.append((info.name, obj))
+    return found
+
+
+def build_display(scene_class, canvas):
+    class BenchDisplay(scene_class, Animator):
+        def __init__(self):
+            self.canvas = canvas
+            self._data = []
+            if scene_class.__name__ in FLIGHT_SCENES:
+                self._data = [FlightInfo(**SAMPLE_FLIGHT)]
+            self._data_index = 0
+            self._data_all_looped = False
+            self.overhead = MockOverhead()
+            super().__init__()
+            self.delay = frames.PERIOD
+
+        def draw_square(self, x0, y0, x1, y1, colour):
+            for x in range(x0, x1):
+                graphics.DrawLine(self.canvas, x, y0, x, y1, colour)
+
+        def _register_special_occasion(self, scene_name):
+            # always this scene's turn
+            self._idle_drawn_this_frame = True
+            return True
+
+        def _register_quiet_ambient(self, scene_name):
+            self._idle_drawn_this_frame = True
+            return True
+
+        @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+        def sync(self, count):
+            self._present_tracked()
+
+    return BenchDisplay()
+
+
+def run_frames(display, clock, count):
+    for _ in range(count):
+        display._run_frame()
+        display.frame += 1
+        clock.advance(frames.PERIOD)
+
+
+def benchmark(scene_class, frame_count, seed, start):
+    clock = VirtualClock(start)
+    canvas = CountingCanvas()
+    random.seed(seed)
+    np.random.seed(seed)
+
+    with mock.patch("time.time", clock.time), \
+            mock.patch.object(datenow, "_read_clock", clock.now):
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        display = build_display(scene_class, canvas)
+
+        allocated = 0
+        memory_frames = min(MEMORY_FRAMES, frame_count)
+        for _ in range(memory_frames):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run_frames(display, clock, 1)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+        canvas.set_pixel = canvas.set_image = 0
+        started = time.perf_counter()
+        run_frames(display, clock, frame_count)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "frames": frame_count,
+        "fps": round(frame_count / elapsed, 1) if elapsed else None,
+        "ms_per_frame": round(elapsed / frame_count * 1000, 4),
+        "set_pixel_per_frame": round(canvas.set_pixel / frame_count, 2),
+        "set_image_per_frame": round(canvas.set_image / frame_count, 3),
+        "alloc_kb_per_frame": round(allocated / max(1, memory_frames) / 1024, 2),
+        "peak_kb": round(max(0, peak) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every scene headlessly.")
+    parser.add_argument("scenes", nargs="*", help="only scenes whose module name contains one of these")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--date", default=DEFAULT_DATE, help="virtual start time, ISO format")
+    parser.add_argument("--json", help="write results as JSON to this file ('-' for stdout)")
+    args = parser.parse_args()
+
+    start = datetime.fromisoformat(args.date)
+    results = {}
+    for module_name, scene_class in discover_scenes(args.scenes):
+        if isinstance(scene_class, Exception):
+            results[module_name] = {"error": f"import failed: {scene_class}"}
+            continue
+        try:
+            results[scene_class.__name__] = benchmark(scene_class, args.frames, args.seed, start)
+        except Exception as e:
+            results[scene_class.__name__] = {"error": f"{type(e).__name__}: {e}"}
+
+    report = {
+        "frames": args.frames,
+        "seed": args.seed,
+        "date": args.date,
+        "python": sys.version.split()[0],
+        "scenes": results,
+    }
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    print(
+        f"{'scene':<24}{'fps':>10}{'ms/frame':>10}{'SetPixel':>10}"
+        f"{'SetImage':>10}{'alloc kB':>10}{'peak kB':>10}"
+    )
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<24}  {result['error']}")
+            continue
+        print(
+            f"{name:<24}{result['fps']:>10}{result['ms_per_frame']:>10.3f}"
+            f"{result['set_pixel_per_frame']:>10.1f}{result['set_image_per_frame']:>10.2f}"
+            f"{result['alloc_kb_per_frame']:>10.2f}{result['peak_kb']:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,10 @@
 usage: python calc_bearing.py <lat> <lon>
 example: python calc_bearing.py 45.614 -72.162
 """
-import math
 import sys
 
+from utilities.geo import HomeGeometry
+
 LANDMARKS = {
     "Brooklyn Bridge (tower)":  (40.7058, -73.9969),
     "Manhattan Bridge":         (40.7074, -73.9908),
@@ -22,11 +23,7 @@ LANDMARKS = {
 
 
 def bearing(lat1, lon1, lat2, lon2):
-    lat1, lat2 = math.radians(lat1), math.radians(lat2)
-    dlon = math.radians(lon2 - lon1)
-    x = math.sin(dlon) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-    return math.degrees(math.atan2(x, y)) % 360
+    return HomeGeometry((lat1, lon1)).bearing(lat2, lon2)
 
 
 def compass(deg):
@@ -47,9 +44,10 @@ def main():
     print(f"{'landmark':<30} {'bearing':>8} {'compass':>8}")
     print("-" * 50)
 
+    home = HomeGeometry((lat, lon))
     results = []
     for name, (lt, ln) in LANDMARKS.items():
-        b = bearing(lat, lon, lt, ln)
+        b = home.bearing(lt, ln)
         results.append((b, name))
 
     for b, name in sorted(results):
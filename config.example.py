@@ -37,6 +37,10 @@ JOURNEY_CODE_SELECTED = "DEN"  # nearby airport to highlight
 WINDOW_BEARING = 250  # WSW (example: facing Manhattan from Brooklyn)
 WINDOW_FOV = 120      # degrees of visible sky
 
+# Optional: ignore flights further than this from home (km along the ground).
+# Together with the window view this shrinks the box requested from the API.
+# MAX_DISTANCE = 30
+
 # =============================================================================
 # DISPLAY SETTINGS
 # =============================================================================
@@ -44,11 +48,16 @@ WINDOW_FOV = 120      # degrees of visible sky
 BRIGHTNESS = 80
 GPIO_SLOWDOWN = 4
 MIN_ALTITUDE = 5000  # feet - filters out high-altitude cruising flights
+FLIGHT_LOOKUP_RATE = 1  # flight detail requests per second
+FLIGHT_LOOKUP_WORKERS = 3  # detail requests in flight at once
+DETAIL_CACHE_PATH = "flight_details.sqlite"  # aircraft details kept across restarts
+DETAIL_CACHE_TTL = 6 * 60 * 60  # seconds before a cached aircraft is looked up again
 TEMPERATURE_UNITS = "imperial"  # or "metric"
 JOURNEY_BLANK_FILLER = " ? "
 HAT_PWM_ENABLED = False
 HARDWARE_PULSE = False
 LED_RGB_SEQUENCE = "RGB"  # try "RBG", "BGR", or "GRB" if colors look wrong
+FRAME_SCHEDULER = "deadline"  # or "fixed" (sleep a fixed delay after each frame)
 
 # =============================================================================
 # API KEYS
@@ -170,3 +179,11 @@ QUOTES = [
 # Time (hours/minutes/seconds) stays real, only the date changes
 # Comment out or set to "" to use the real date
 # DEBUG_DATE = "12-31"
+
+# Time every keyframe to find what eats the frame budget
+# When enabled, `kill -USR1 <pid>` prints the slowest keyframes to stderr,
+# and FRAME_PROFILE_PATH (if set) is rewritten as JSON every
+# FRAME_PROFILE_INTERVAL seconds
+FRAME_PROFILE = False
+# FRAME_PROFILE_PATH = "frame_profile.json"
+# FRAME_PROFILE_INTERVAL = 10
@@ -1,9 +1,11 @@
 import sys
 
 from setup import frames
-from utilities.animator import Animator
-from utilities.overhead import Overhead
-from utilities.quiethours import should_display_be_dim
+from utilities.animator import Animator, PHASE_IDLE, PHASE_PRE_DRAW, PHASE_PRESENT
+from utilities.flightset import diff_flights, flight_id
+from utilities.motion import MotionModel
+from utilities.overhead import HOME, Overhead
+from utilities.quiethours import get_schedule, should_display_be_dim
 
 from scenes.weather import WeatherScene
 from scenes.flightdetails import FlightDetailsScene
@@ -41,16 +43,18 @@ from scenes.thanksgiving import ThanksgivingScene
 from scenes.chinesenewyear import ChineseNewYearScene
 from scenes.planeintro import PlaneIntroScene
 
-from rgbmatrix import graphics
+from utilities import graphics
 from rgbmatrix import RGBMatrix, RGBMatrixOptions
 
 
-def callsigns_match(flights_a, flights_b):
-    get_callsigns = lambda flights: [f["callsign"] for f in flights]
-    callsigns_a = set(get_callsigns(flights_a))
-    callsigns_b = set(get_callsigns(flights_b))
-
-    return callsigns_a == callsigns_b
+# reset keyframes to redraw when a field of the flight on screen changes;
+# the plane name scrolls every frame and picks up changes by itself
+FIELD_REDRAWS = {
+    "origin": ("journey", "journey_arrow"),
+    "destination": ("journey", "journey_arrow"),
+    "callsign": ("flight_details",),
+}
+REDRAW_ORDER = ("journey", "journey_arrow", "flight_details")
 
 
 try:
@@ -150,6 +154,9 @@ class Display(
         self._data = []
         self._data_all_looped = False
 
+        # where the flights are now, between polls
+        self._motion = MotionModel(HOME)
+
         # Start Looking for planes
         self.overhead = Overhead()
         self.overhead.grab_data()
@@ -161,60 +168,101 @@ class Display(
         # Animator or Scenes
         self.delay = frames.PERIOD
 
+        # end an idle sleep when there's something new to show
+        self.overhead.subscribe(lambda: self.wake(self.check_for_loaded_data))
+        get_schedule().subscribe(lambda status: self.wake())
+
     def draw_square(self, x0, y0, x1, y1, colour):
         for x in range(x0, x1):
             _ = graphics.DrawLine(self.canvas, x, y0, x, y1, colour)
 
-    @Animator.KeyFrame.add(0)
+    def _phase_active(self, phase):
+        # idle animations never draw while flights are on screen; the
+        # reset_scene() that put the flights up already cleared their pixels
+        return not (phase == PHASE_IDLE and self._data)
+
+    @Animator.KeyFrame.add(0, phase=PHASE_PRE_DRAW)
     def clear_screen(self):
         # First operation after
         # a screen reset
         self.canvas.Clear()
+        self.tracked.reset()
 
-    @Animator.KeyFrame.add(frames.PER_SECOND * 5)
+    @Animator.KeyFrame.add(frames.PER_SECOND * 5, phase=PHASE_PRE_DRAW)
     def check_for_loaded_data(self, count):
         # skip flight data during quiet hours if configured
         if QUIET_HOURS_HIDE_FLIGHTS and should_display_be_dim():
             if self._data:
                 self._data = []
+                self._motion.update([])
                 self.reset_scene()
             return
 
         if self.overhead.new_data:
-            # Check if there's data
-            there_is_data = len(self._data) > 0 or not self.overhead.data_is_empty
-
             # this marks self.overhead.data as no longer new
-            new_data = self.overhead.data
+            self._update_flights(self.overhead.data)
 
-            # See if this matches the data already on the screen
-            # This test only checks if it's 2 lists with the same
-            # callsigns, regardless or order
-            data_is_different = not callsigns_match(self._data, new_data)
+    def _update_flights(self, new_data):
+        self._motion.update(new_data)
 
-            if data_is_different:
-                self._data_index = 0
-                self._data_all_looped = False
-                self._data = new_data
+        diff = diff_flights(self._data, new_data)
+        if not diff:
+            return
 
-            # Only reset if there's flight data already
-            # on the screen, of if there's some new
-            # data available to draw which is different
-            # from the current data
-            reset_required = there_is_data and data_is_different
+        shown = flight_id(self._data[self._data_index]) if self._data else None
+        ids = [flight_id(f) for f in new_data]
+        self._data = new_data
+        if diff.added:
+            self._data_all_looped = False
+
+        if shown not in ids:
+            # the flight on screen has gone (or nothing was shown):
+            # start again from the first one
+            self._data_index = 0
+            self._data_all_looped = False
+            self.reset_scene()
+            return
 
-            if reset_required:
-                self.reset_scene()
+        # keep showing the same flight, scroll position and all, and only
+        # redraw what changed
+        redraw = set()
+        index = ids.index(shown)
+        if index != self._data_index or diff.added or diff.removed:
+            redraw.add("flight_details")  # "N/M" counter
+        self._data_index = index
+
+        for field in diff.updated.get(shown, ()):
+            redraw.update(FIELD_REDRAWS.get(field, ()))
+
+        for name in REDRAW_ORDER:
+            if name in redraw:
+                getattr(self, name)()
+
+    def flight_estimate(self, index=None):
+        """Extrapolated position of a flight in _data (default: the one shown)."""
+        if not self._data:
+            return None
+        index = self._data_index if index is None else index
+        return self._motion.estimate(self._data[index])
+
+    @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+    def sync(self, count):
+        # present phase runs LAST, after all drawing is complete
+        self._present_tracked()
+
+        # nothing drew this frame: the panel already shows it
+        if not self.canvas_changed():
+            self.frame_stats["swaps_skipped"] += 1
+            return
 
-    @Animator.KeyFrame.add(1)
-    def zzzzz_sync(self, count):
-        # zzzzz_ prefix ensures this runs LAST, after all drawing is complete
-        _ = self.matrix.SwapOnVSync(self.canvas)
+        # the canvas itself, not the RawCanvas scenes draw through
+        _ = self.matrix.SwapOnVSync(self._canvas)
 
-    @Animator.KeyFrame.add(frames.PER_SECOND * 30)
+    @Animator.KeyFrame.add(frames.PER_SECOND * 30, phase=PHASE_PRE_DRAW)
     def grab_new_data(self, count):
         # don't poll for flights during quiet hours if configured
         if QUIET_HOURS_HIDE_FLIGHTS and should_display_be_dim():
+            self.overhead.pause()
             return
 
         if not (self.overhead.processing and self.overhead.new_data) and (
@@ -1,11 +1,11 @@
 import math
 import random
 from datetime import datetime, timedelta
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 # try to load anniversary config
@@ -91,7 +91,23 @@ class AnniversaryScene(object):
         today = get_now().strftime("%m-%d")
         return today == ANNIVERSARY_DATE
 
-    @Animator.KeyFrame.add(1)
+    def _anniversary_occasion(self):
+        """Days until the anniversary if it's close enough to show, else None."""
+        if DEMO_MODE:
+            return True
+        if not ANNIVERSARY_DATE:
+            return None
+
+        days = self._anniversary_get_days_until()
+        if days is None:
+            return None
+
+        # only show when within 7 days or on the day
+        if days > 7 and not self._is_anniversary_today():
+            return None
+        return days
+
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE, occasion=_anniversary_occasion)
     def anniversary(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -108,16 +124,7 @@ class AnniversaryScene(object):
             else:
                 days = 5  # default demo: 5 days until anniversary
         else:
-            if not ANNIVERSARY_DATE:
-                return
-
-            days = self._anniversary_get_days_until()
-            if days is None:
-                return
-
-            # only show when within 7 days or on the day
-            if days > 7 and not self._is_anniversary_today():
-                return
+            days = self.occasions["anniversary"]
 
         if not DEMO_MODE and should_display_be_dim():
             if self._last_anniversary_pixels:
@@ -1,6 +1,6 @@
 import math
 import random
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from setup import frames
 
 
@@ -55,8 +55,8 @@ class AuroraScene(object):
             self._aurora_bands.append(AuroraBand(y_base, color_idx))
         self._aurora_initialized = True
 
-    @Animator.KeyFrame.add(1)
-    def zzz_aurora(self, count):
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE, priority=2)
+    def aurora(self, count):
         if not DEMO_MODE:
             return
 
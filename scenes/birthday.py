@@ -2,11 +2,11 @@ import math
 import random
 import time
 from datetime import datetime
-from utilities.animator import Animator, IDLE_CYCLE_SECONDS
+from utilities.animator import Animator, IDLE_CYCLE_SECONDS, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 # default countdown days (can be overridden per person)
@@ -190,7 +190,12 @@ class BirthdayScene(object):
 
         return active
 
-    @Animator.KeyFrame.add(1)
+    def _birthday_occasion(self):
+        if DEMO_MODE:
+            return True
+        return self._get_all_active_birthdays() or None
+
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE, occasion=_birthday_occasion)
     def birthday(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -220,9 +225,7 @@ class BirthdayScene(object):
                     self._last_birthday_pixels = []
                 return
 
-            active = self._get_all_active_birthdays()
-            if not active:
-                return
+            active = self.occasions["birthday"]
 
         # special occasion cycling (rotates with holidays)
         if not self._register_special_occasion('birthday'):
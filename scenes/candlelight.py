@@ -1,6 +1,6 @@
 import random
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import frames
 
@@ -45,7 +45,7 @@ class CandlelightScene(object):
         self._candle_sway_phase = random.uniform(0, 2 * math.pi)
         self._last_candle_pixels = []
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
     def candlelight(self, count):
         if len(self._data):
             if self._last_candle_pixels:
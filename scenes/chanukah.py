@@ -1,10 +1,10 @@
 import math
 import random
 from datetime import datetime, date
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -178,7 +178,9 @@ class ChanukahScene(object):
                                     self.canvas.SetPixel(gx, gy, gr, gg, gb)
                                     drawn_pixels.append((gx, gy))
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._get_chanukah_night() or None
+    )
     def chanukah(self, count):
         if len(self._data):
             if self._last_chanukah_pixels:
@@ -187,9 +189,7 @@ class ChanukahScene(object):
                 self._last_chanukah_pixels = []
             return
 
-        night = self._get_chanukah_night()
-        if night == 0:
-            return
+        night = self.occasions["chanukah"]
 
         if not DEMO_MODE and should_display_be_dim():
             if self._last_chanukah_pixels:
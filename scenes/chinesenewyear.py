@@ -1,10 +1,10 @@
 import math
 import random
 from datetime import datetime, date
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -126,6 +126,10 @@ class ChineseNewYearScene(object):
 
         return False, None
 
+    def _cny_occasion(self):
+        is_cny, zodiac = self._get_cny_info()
+        return zodiac if is_cny else None
+
     def _draw_lantern(self, drawn_pixels, x, y, size):
         """Draw a Chinese lantern."""
         red = (220, 30, 30)
@@ -175,7 +179,7 @@ class ChineseNewYearScene(object):
             self.canvas.SetPixel(x, y - 1, *dark_red)
             drawn_pixels.append((x, y - 1))
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE, occasion=_cny_occasion)
     def chinese_new_year(self, count):
         if len(self._data):
             if self._last_cny_pixels:
@@ -184,9 +188,7 @@ class ChineseNewYearScene(object):
                 self._last_cny_pixels = []
             return
 
-        is_cny, zodiac = self._get_cny_info()
-        if not is_cny:
-            return
+        zodiac = self.occasions["chinese_new_year"]
 
         if not DEMO_MODE and should_display_be_dim():
             if self._last_cny_pixels:
@@ -1,10 +1,10 @@
 import math
 import random
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -76,7 +76,9 @@ class ChristmasScene(object):
         today = get_now().strftime("%m-%d")
         return today == "12-25"
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_christmas() or None
+    )
     def christmas(self, count):
         if len(self._data):
             if self._last_christmas_pixels:
@@ -85,9 +87,6 @@ class ChristmasScene(object):
                 self._last_christmas_pixels = []
             return
 
-        if not self._is_christmas():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_christmas_pixels:
                 for px, py in self._last_christmas_pixels:
@@ -1,8 +1,8 @@
-from utilities.animator import Animator
+from utilities.animator import Animator, CLOCK_REGION_Y, PHASE_OVERLAY
 from utilities.datenow import get_now
 from setup import colours, fonts, frames
 
-from rgbmatrix import graphics
+from utilities import graphics
 
 # Setup
 CLOCK_FONT = fonts.regular
@@ -15,10 +15,10 @@ class ClockScene(object):
         super().__init__()
         self._last_time = None
 
-    # zx_ prefix ensures this runs AFTER all idle animations in alphabetical
-    # keyframe order, so _idle_drawn_this_frame is already set correctly
-    @Animator.KeyFrame.add(frames.PER_SECOND * 1)
-    def zx_clock(self, count):
+    # overlay phase runs AFTER all idle animations,
+    # so _idle_drawn_this_frame is already set correctly
+    @Animator.KeyFrame.add(frames.PER_SECOND * 1, phase=PHASE_OVERLAY)
+    def clock(self, count):
         if len(self._data):
             # Ensure redraw when there's new data
             self._last_time = None
@@ -43,10 +43,12 @@ class ClockScene(object):
             now = get_now()
             current_time = now.strftime("%I:%M%p")
 
-            # Only draw if time needs updated
-            if self._last_time != current_time:
+            # Only draw if time needs updated, or something drew over it
+            if self._last_time != current_time or self.overlay_damaged(
+                *CLOCK_REGION_Y
+            ):
                 # Undraw last time if different from current
-                if self._last_time is not None:
+                if self._last_time not in (None, current_time):
                     _ = graphics.DrawText(
                         self.canvas,
                         CLOCK_FONT,
@@ -1,8 +1,8 @@
-from utilities.animator import Animator
+from utilities.animator import Animator, DATE_REGION_Y, PHASE_OVERLAY
 from utilities.datenow import get_now
 from setup import colours, fonts, frames
 
-from rgbmatrix import graphics
+from utilities import graphics
 
 # Setup
 DATE_COLOUR = colours.PINK_DARKER
@@ -15,10 +15,10 @@ class DateScene(object):
         super().__init__()
         self._last_date = None
 
-    # zx_ prefix ensures this runs AFTER all idle animations in alphabetical
-    # keyframe order, so _idle_drawn_this_frame is already set correctly
-    @Animator.KeyFrame.add(frames.PER_SECOND * 1)
-    def zx_date(self, count):
+    # overlay phase runs AFTER all idle animations,
+    # so _idle_drawn_this_frame is already set correctly
+    @Animator.KeyFrame.add(frames.PER_SECOND * 1, phase=PHASE_OVERLAY)
+    def date(self, count):
         if len(self._data):
             # Ensure redraw when there's new data
             self._last_date = None
@@ -43,10 +43,12 @@ class DateScene(object):
             now = get_now()
             current_date = now.strftime("%a %b %-d")
 
-            # Only draw if date needs updated
-            if self._last_date != current_date:
+            # Only draw if date needs updated, or something drew over it
+            if self._last_date != current_date or self.overlay_damaged(
+                *DATE_REGION_Y
+            ):
                 # Undraw last date if different from current
-                if self._last_date is not None:
+                if self._last_date not in (None, current_date):
                     _ = graphics.DrawText(
                         self.canvas,
                         DATE_FONT,
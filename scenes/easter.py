@@ -1,10 +1,10 @@
 import math
 import random
 from datetime import datetime, date
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -132,7 +132,9 @@ class EasterScene(object):
             self.canvas.SetPixel(x + 2, y + 1, *white)
             drawn_pixels.append((x + 2, y + 1))
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_easter() or None
+    )
     def easter(self, count):
         if len(self._data):
             if self._last_easter_pixels:
@@ -141,9 +143,6 @@ class EasterScene(object):
                 self._last_easter_pixels = []
             return
 
-        if not self._is_easter():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_easter_pixels:
                 for px, py in self._last_easter_pixels:
@@ -2,7 +2,7 @@ import random
 import time
 import json
 import urllib.request
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from setup import frames
 
@@ -112,7 +112,7 @@ class FallingSnowScene(object):
             flake.y = random.uniform(0, 31)
         self._snow_initialized = True
 
-    @Animator.KeyFrame.add(1)  # run every frame for smooth falling
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)  # run every frame for smooth falling
     def falling_snow(self, count):
         # only show when no flights overhead
         if len(self._data):
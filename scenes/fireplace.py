@@ -1,6 +1,9 @@
 import random
 import math
-from utilities.animator import Animator
+
+import numpy as np
+
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import frames
 
@@ -33,18 +36,37 @@ FIRE_HEIGHT = 28
 FIRE_X_OFFSET = 0
 FIRE_Y_OFFSET = 4
 
+# cells at or below this intensity are not drawn
+FIRE_MIN_INTENSITY = 10
+
+# cooling grows with height: 0 at the top row, up to 14 at the bottom
+FIRE_HEIGHT_COOLING = (np.arange(FIRE_HEIGHT) / FIRE_HEIGHT * 15).astype(np.int16)
+
 
 class FireplaceScene(object):
     def __init__(self):
         super().__init__()
-        self._fire_grid = []
+        self._fire_grid = None
         self._fire_initialized = False
-        self._last_fire_pixels = []
         self._fire_frame = 0
+        self._fire_palette = None
+        self._fire_rng = None
 
     def _init_fire(self):
-        # create cooling map
-        self._fire_grid = [[0] * FIRE_WIDTH for _ in range(FIRE_HEIGHT)]
+        # heat grid, one int16 cell per pixel
+        self._fire_grid = np.zeros((FIRE_HEIGHT, FIRE_WIDTH), dtype=np.int16)
+
+        # intensity -> colour lookup table
+        self._fire_palette = np.array(
+            [
+                self._get_fire_color(i) if i > FIRE_MIN_INTENSITY else (0, 0, 0)
+                for i in range(256)
+            ],
+            dtype=np.uint8,
+        )
+
+        # seeded from random so random.seed() still fixes the animation
+        self._fire_rng = np.random.default_rng(random.getrandbits(64))
         self._fire_initialized = True
 
     def _get_fire_color(self, intensity):
@@ -61,51 +83,36 @@ class FireplaceScene(object):
         factor = intensity / 255
         return (int(r * factor), int(g * factor), int(b * factor))
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
     def fireplace(self, count):
         # only show when no flights overhead
         if len(self._data):
-            if self._last_fire_pixels:
-                for px, py in self._last_fire_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_fire_pixels = []
+            self.tracked.erase("fireplace")
             return
 
         # only show during quiet hours (or always in demo mode)
         if not DEMO_MODE and not should_display_be_dim():
-            if self._last_fire_pixels:
-                for px, py in self._last_fire_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_fire_pixels = []
+            self.tracked.erase("fireplace")
             return
 
         # love messages take priority when active
         if getattr(self, '_msg_active', False):
-            if self._last_fire_pixels:
-                for px, py in self._last_fire_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_fire_pixels = []
+            self.tracked.erase("fireplace")
             return
 
         # quiet-hours ambient cycling
         if not self._register_quiet_ambient('fireplace'):
-            if self._last_fire_pixels:
-                for px, py in self._last_fire_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_fire_pixels = []
+            self.tracked.erase("fireplace")
             return
 
         if not self._fire_initialized:
             self._init_fire()
 
-        drawn_pixels = []
-
-        # clear previous
-        for px, py in self._last_fire_pixels:
-            self.canvas.SetPixel(px, py, 0, 0, 0)
+        # pixels not redrawn this pass are erased when it ends
+        self.tracked.begin("fireplace")
 
-        self.clear_clock_region(drawn_pixels)
-        self.clear_date_region(drawn_pixels)
+        self.clear_clock_region()
+        self.clear_date_region()
 
         # update fire simulation every 4th frame (slower animation)
         self._fire_frame += 1
@@ -115,66 +122,50 @@ class FireplaceScene(object):
         else:
             self._update_fire_sim()
 
-        # draw fire
-        for y in range(FIRE_HEIGHT):
-            for x in range(FIRE_WIDTH):
-                intensity = self._fire_grid[y][x]
-                if intensity > 10:
-                    px = FIRE_X_OFFSET + x
-                    py = FIRE_Y_OFFSET + y
-                    if 0 <= px < 64 and 0 <= py < 32:
-                        r, g, b = self._get_fire_color(intensity)
-                        self.canvas.SetPixel(px, py, r, g, b)
-                        drawn_pixels.append((px, py))
+        # draw fire, cool cells come out black from the palette
+        self.tracked.blit(
+            FIRE_X_OFFSET, FIRE_Y_OFFSET, self._fire_palette[self._fire_grid]
+        )
 
         # draw log/base
-        for x in range(FIRE_WIDTH - 4):
-            px = FIRE_X_OFFSET + x + 2
-            py = 31
-            self.canvas.SetPixel(px, py, 60, 30, 10)
-            drawn_pixels.append((px, py))
+        self.tracked.fill_rect(
+            FIRE_X_OFFSET + 2, 31, FIRE_X_OFFSET + FIRE_WIDTH - 3, 31, 60, 30, 10
+        )
 
-        self._last_fire_pixels = drawn_pixels
+        self.tracked.end()
 
     def _update_fire_sim(self):
         """Update fire simulation grid."""
-        # generate intense heat at bottom (fire source)
-        for x in range(FIRE_WIDTH):
-            # center burns hotter
-            center_dist = abs(x - FIRE_WIDTH // 2)
-            center_bonus = max(0, 30 - center_dist)
-
-            # base heat with variation
-            heat = random.randint(220, 255) + center_bonus
-            heat = min(255, heat)
-
-            # occasional cooler spots for flicker
-            if random.random() < 0.15:
-                heat = random.randint(180, 220)
-
-            self._fire_grid[FIRE_HEIGHT - 1][x] = heat
-            # also seed the row above for taller flames
-            if random.random() < 0.7:
-                self._fire_grid[FIRE_HEIGHT - 2][x] = random.randint(200, 255)
-
-        # propagate fire upward with gentler cooling
+        grid = self._fire_grid
+        rng = self._fire_rng
+
+        # generate intense heat at bottom (fire source), center burns hotter
+        center_bonus = np.maximum(0, 30 - np.abs(np.arange(FIRE_WIDTH) - FIRE_WIDTH // 2))
+        heat = np.minimum(255, rng.integers(220, 256, FIRE_WIDTH) + center_bonus)
+
+        # occasional cooler spots for flicker
+        cool = rng.random(FIRE_WIDTH) < 0.15
+        heat[cool] = rng.integers(180, 221, int(cool.sum()))
+        grid[-1] = heat
+
+        # also seed the row above for taller flames
+        seed = rng.random(FIRE_WIDTH) < 0.7
+        grid[-2][seed] = rng.integers(200, 256, int(seed.sum()))
+
+        # cooling and flicker/turbulence for every propagated cell at once
+        rows = FIRE_HEIGHT - 2
+        noise = rng.integers(3, 13, (rows, FIRE_WIDTH)) + FIRE_HEIGHT_COOLING[:rows, None]
+        flicker = rng.random((rows, FIRE_WIDTH)) < 0.1
+        noise[flicker] -= rng.integers(-20, 31, int(flicker.sum()))
+
+        # propagate fire upward; each row samples the row below, which
+        # already holds this step's values, so only the columns vectorise
         for y in range(FIRE_HEIGHT - 3, -1, -1):
-            for x in range(FIRE_WIDTH):
-                # sample from below with wind drift
-                below_left = self._fire_grid[y + 1][max(0, x - 1)]
-                below = self._fire_grid[y + 1][x]
-                below_right = self._fire_grid[y + 1][min(FIRE_WIDTH - 1, x + 1)]
-                below_far = self._fire_grid[min(FIRE_HEIGHT - 1, y + 2)][x]
-
-                # weighted average favoring center column
-                avg = (below_left + below * 3 + below_right + below_far) // 6
-
-                # gentler cooling that increases with height
-                height_factor = y / FIRE_HEIGHT  # 0 at bottom, 1 at top
-                cooling = random.randint(3, 12) + int(height_factor * 15)
-
-                # add random flicker/turbulence
-                if random.random() < 0.1:
-                    avg += random.randint(-20, 30)
-
-                self._fire_grid[y][x] = max(0, min(255, avg - cooling))
+            below = grid[y + 1]
+            below_left = np.concatenate((below[:1], below[:-1]))
+            below_right = np.concatenate((below[1:], below[-1:]))
+            below_far = grid[min(FIRE_HEIGHT - 1, y + 2)]
+
+            # weighted average favoring center column
+            avg = (below_left + below * 3 + below_right + below_far) // 6
+            grid[y] = np.clip(avg - noise[y], 0, 255)
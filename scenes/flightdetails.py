@@ -1,7 +1,7 @@
 from utilities.animator import Animator
 from setup import colours, fonts, screen
 
-from rgbmatrix import graphics
+from utilities import graphics
 
 # Setup
 BAR_STARTING_POSITION = (0, 18)
@@ -45,26 +45,17 @@ class FlightDetailsScene(object):
             colours.BLACK,
         )
 
-        # Draw flight number if available
+        # Draw flight number if available, a run of letters or digits at a time
         flight_no_text_length = 0
-        if (
-            self._data[self._data_index]["callsign"]
-            and self._data[self._data_index]["callsign"] != "N/A"
-        ):
-            flight_no = f'{self._data[self._data_index]["callsign"]}'
-
-            for ch in flight_no:
-                ch_length = graphics.DrawText(
-                    self.canvas,
-                    FLIGHT_NO_FONT,
-                    FLIGHT_NO_POSITION[0] + flight_no_text_length,
-                    FLIGHT_NO_POSITION[1],
-                    FLIGHT_NUMBER_NUMERIC_COLOUR
-                    if ch.isnumeric()
-                    else FLIGHT_NUMBER_ALPHA_COLOUR,
-                    ch,
-                )
-                flight_no_text_length += ch_length
+        for run, numeric in self._data[self._data_index].callsign_runs:
+            flight_no_text_length += graphics.DrawText(
+                self.canvas,
+                FLIGHT_NO_FONT,
+                FLIGHT_NO_POSITION[0] + flight_no_text_length,
+                FLIGHT_NO_POSITION[1],
+                FLIGHT_NUMBER_NUMERIC_COLOUR if numeric else FLIGHT_NUMBER_ALPHA_COLOUR,
+                run,
+            )
 
         # Draw bar
         if len(self._data) > 1:
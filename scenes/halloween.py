@@ -1,10 +1,10 @@
 import math
 import random
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -94,7 +94,9 @@ class HalloweenScene(object):
         today = get_now().strftime("%m-%d")
         return today == "10-31"
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_halloween() or None
+    )
     def halloween(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -104,9 +106,6 @@ class HalloweenScene(object):
                 self._last_halloween_pixels = []
             return
 
-        if not self._is_halloween():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_halloween_pixels:
                 for px, py in self._last_halloween_pixels:
@@ -1,7 +1,7 @@
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from setup import colours, frames
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -46,8 +46,9 @@ class HeartbeatScene(object):
         self._heart_phase = 0.0
         self._last_heart_pixels = []
 
-    @Animator.KeyFrame.add(frames.PER_SECOND // 10)
-    def zz_heartbeat(self, count):
+    # lowest priority idle animation: only draws if nothing else claimed the frame
+    @Animator.KeyFrame.add(frames.PER_SECOND // 10, phase=PHASE_IDLE, priority=1)
+    def heartbeat(self, count):
         if not DEMO_MODE:
             return
 
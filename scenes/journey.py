@@ -1,7 +1,7 @@
 from utilities.animator import Animator
 from setup import colours, fonts
 
-from rgbmatrix import graphics
+from utilities import graphics
 
 # Attempt to load config data
 try:
@@ -49,8 +49,9 @@ class JourneyScene(object):
         if len(self._data) == 0:
             return
 
-        origin = self._data[self._data_index]["origin"]
-        destination = self._data[self._data_index]["destination"]
+        flight = self._data[self._data_index]
+        origin = flight.origin
+        destination = flight.destination
 
         # Draw background
         self.draw_square(
@@ -31,7 +31,7 @@ class LoadingLEDScene(object):
             print(f"Error initializing GPIO: {e}", file=sys.stderr)
             self.gpio_setup_complete = False
 
-    @Animator.KeyFrame.add(4)
+    @Animator.KeyFrame.add(4, active=lambda self: self.overhead.processing)
     def loading_led(self, count):
         reset_count = True
 
@@ -10,8 +10,11 @@ BLINKER_COLOUR = colours.WHITE
 class LoadingPulseScene(object):
     def __init__(self):
         super().__init__()
+        self._pulse_lit = False
 
-    @Animator.KeyFrame.add(2)
+    @Animator.KeyFrame.add(
+        2, active=lambda self: self.overhead.processing or self._pulse_lit
+    )
     def loading_pulse(self, count):
         reset_count = True
         if self.overhead.processing:
@@ -27,11 +30,13 @@ class LoadingPulseScene(object):
                 brightness * BLINKER_COLOUR.green,
                 brightness * BLINKER_COLOUR.blue,
             )
+            self._pulse_lit = True
 
             # Only count 0 -> (BLINKER_STEPS - 1)
             reset_count = count == (BLINKER_STEPS - 1)
-        else:
+        elif self._pulse_lit:
             # Not processing, blank the square
             self.canvas.SetPixel(BLINKER_POSITION[0], BLINKER_POSITION[1], 0, 0, 0)
+            self._pulse_lit = False
 
         return reset_count
@@ -2,10 +2,11 @@ import math
 import random
 import time
 
-from utilities.animator import Animator
+from utilities import sprites, text
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 # default messages (used if config is missing or invalid)
@@ -90,6 +91,10 @@ HEART_PIXELS = [
 HEART_X = 28  # centered on 64px display
 HEART_Y = 10
 
+sprites.register(
+    "lovemessages.heart", lambda: sprites.Sprite.from_mask(HEART_PIXELS, (255, 20, 60))
+)
+
 # pulse settings
 PULSE_SPEED = 0.15
 PULSE_MIN = 0.3
@@ -108,39 +113,17 @@ class LoveMessagesScene(object):
         self._msg_current = ""
         self._msg_width = 0
         self._msg_heart_phase = 0.0
-        self._msg_last_heart_pixels = []
 
     def _get_message_width(self, message):
-        # ~5 pixels per character for extrasmall font (4x6 with spacing)
-        return len(message) * 5
+        return text.width(fonts.extrasmall, message)
 
     def _draw_heart(self, brightness):
-        base_r, base_g, base_b = 255, 20, 60
-        r = int(base_r * brightness)
-        g = int(base_g * brightness)
-        b = int(base_b * brightness)
-
-        pixels = []
-        for hx, hy in HEART_PIXELS:
-            px = HEART_X + hx
-            py = HEART_Y + hy
-            self.canvas.SetPixel(px, py, r, g, b)
-            pixels.append((px, py))
-        return pixels
+        heart = sprites.get("lovemessages.heart")
+        heart.draw(self.tracked, HEART_X, HEART_Y, heart.scaled(brightness))
 
     def _clear_areas(self):
-        # clear heart
-        for px, py in self._msg_last_heart_pixels:
-            self.canvas.SetPixel(px, py, 0, 0, 0)
-        self._msg_last_heart_pixels = []
-        for hx, hy in HEART_PIXELS:
-            self.canvas.SetPixel(HEART_X + hx, HEART_Y + hy, 0, 0, 0)
-
-        # clear text area
-        for x in range(64):
-            for y in range(MESSAGE_Y - 6, MESSAGE_Y + 2):
-                if 0 <= y < 32:
-                    self.canvas.SetPixel(x, y, 0, 0, 0)
+        # clear heart, message and the clock/date regions we blanked
+        self.tracked.erase("lovemessages")
 
     def _activate(self):
         self._msg_active = True
@@ -159,9 +142,24 @@ class LoveMessagesScene(object):
         self._msg_next_time = time.time() + random.randint(MIN_INTERVAL, MAX_INTERVAL)
         self._clear_areas()
 
+    def _message_x(self):
+        # short messages pause centered, long ones scroll through
+        if self._msg_width <= 64:
+            center_x = (64 - self._msg_width) // 2
+            if abs(self._msg_scroll_x - center_x) < 2:
+                self._msg_pause_counter += 1
+                if self._msg_pause_counter < PAUSE_FRAMES:
+                    return center_x
+            else:
+                self._msg_pause_counter = 0
+
+        # scroll left
+        self._msg_scroll_x -= SCROLL_SPEED
+        return self._msg_scroll_x
+
     # when active, this claims the idle frame mutex so persistent displays
     # (clock, date, temperature) skip drawing
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
     def heart_and_message(self, count):
         # flights take priority
         if len(self._data):
@@ -197,15 +195,12 @@ class LoveMessagesScene(object):
         self._idle_drawn_this_frame = True
 
         # clear regions to prevent clock/date bleed-through
-        drawn_pixels = []
-        self.clear_clock_region(drawn_pixels)
-        self.clear_date_region(drawn_pixels)
+        self.tracked.begin("lovemessages")
+        self.clear_clock_region()
+        self.clear_date_region()
 
         # clear text area for redraw
-        for x in range(64):
-            for y in range(MESSAGE_Y - 6, MESSAGE_Y + 2):
-                if 0 <= y < 32:
-                    self.canvas.SetPixel(x, y, 0, 0, 0)
+        self.tracked.fill_rect(0, MESSAGE_Y - 6, 63, MESSAGE_Y + 1, 0, 0, 0)
 
         # pulse heart
         self._msg_heart_phase += PULSE_SPEED
@@ -213,32 +208,15 @@ class LoveMessagesScene(object):
             self._msg_heart_phase -= 2 * math.pi
         pulse = (math.sin(self._msg_heart_phase) + 1) / 2
         brightness = PULSE_MIN + (PULSE_MAX - PULSE_MIN) * pulse
-        self._msg_last_heart_pixels = self._draw_heart(brightness)
-
-        # short messages pause centered, long ones scroll through
-        if self._msg_width <= 64:
-            center_x = (64 - self._msg_width) // 2
-            if abs(self._msg_scroll_x - center_x) < 2:
-                self._msg_pause_counter += 1
-                if self._msg_pause_counter < PAUSE_FRAMES:
-                    graphics.DrawText(
-                        self.canvas, fonts.extrasmall,
-                        center_x, MESSAGE_Y,
-                        MESSAGE_COLOR, self._msg_current
-                    )
-                    return
-            else:
-                self._msg_pause_counter = 0
-
-        # scroll left
-        self._msg_scroll_x -= SCROLL_SPEED
+        self._draw_heart(brightness)
 
         # draw message
-        graphics.DrawText(
-            self.canvas, fonts.extrasmall,
-            self._msg_scroll_x, MESSAGE_Y,
+        text.draw(
+            self.tracked, fonts.extrasmall,
+            self._message_x(), MESSAGE_Y,
             MESSAGE_COLOR, self._msg_current
         )
+        self.tracked.end()
 
         # scrolled off screen - pick next message
         if self._msg_scroll_x < -self._msg_width:
@@ -1,6 +1,6 @@
 import random
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import frames
 
@@ -76,7 +76,7 @@ class MoonriseScene(object):
         y = 20 - int((1 - normalized * normalized) * 16)  # peaks at y=4
         return x, y
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
     def moonrise(self, count):
         if len(self._data):
             if self._last_moon_pixels:
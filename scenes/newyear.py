@@ -1,11 +1,11 @@
 import math
 import random
 from datetime import datetime
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -108,7 +108,9 @@ class NewYearScene(object):
             return 0  # just past midnight, show celebration
         return None  # not countdown time
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_new_years_eve() or None
+    )
     def newyear(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -118,9 +120,6 @@ class NewYearScene(object):
                 self._last_newyear_pixels = []
             return
 
-        if not self._is_new_years_eve():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_newyear_pixels:
                 for px, py in self._last_newyear_pixels:
@@ -1,5 +1,5 @@
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import frames
 
@@ -33,7 +33,7 @@ class OceanWavesScene(object):
         self._wave_phase = 0.0
         self._last_wave_pixels = []
 
-    @Animator.KeyFrame.add(1)  # run every frame for smooth waves
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)  # run every frame for smooth waves
     def ocean_waves(self, count):
         # only show when no flights overhead
         if len(self._data):
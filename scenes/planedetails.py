@@ -1,5 +1,4 @@
-from rgbmatrix import graphics
-
+from utilities import text
 from utilities.animator import Animator
 from setup import colours, fonts, screen
 
@@ -16,7 +15,7 @@ class PlaneDetailsScene(object):
         self.plane_position = screen.WIDTH
         self._data_all_looped = False
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, active=lambda self: self._data)
     def plane_details(self, count):
         # skip while plane intro is playing
         if hasattr(self, 'is_intro_active') and self.is_intro_active():
@@ -26,30 +25,40 @@ class PlaneDetailsScene(object):
         if len(self._data) == 0:
             return
 
-        plane = f'{self._data[self._data_index]["plane"]}'
+        flight = self._data[self._data_index]
+
+        if flight.plane_width is None:
+            # the text never changes for a record, measure it once
+            flight.plane_width = text.width(PLANE_FONT, flight.plane)
+
+        self.tracked.begin("planedetails")
 
         # Draw background
-        self.draw_square(
+        self.tracked.fill_rect(
             0,
             PLANE_DISTANCE_FROM_TOP - PLANE_TEXT_HEIGHT,
-            screen.WIDTH,
-            screen.HEIGHT,
-            colours.BLACK,
+            screen.WIDTH - 1,
+            screen.HEIGHT - 1,
+            0,
+            0,
+            0,
         )
 
-        # Draw text
-        text_length = graphics.DrawText(
-            self.canvas,
+        # Draw text, a cached strip moved along a pixel each frame
+        text.draw(
+            self.tracked,
             PLANE_FONT,
             self.plane_position,
             PLANE_DISTANCE_FROM_TOP,
             PLANE_DETAILS_COLOUR,
-            plane,
+            flight.plane,
         )
 
+        self.tracked.end()
+
         # Handle scrolling
         self.plane_position -= 1
-        if self.plane_position + text_length < 0:
+        if self.plane_position + flight.plane_width < 0:
             self.plane_position = screen.WIDTH
             if len(self._data) > 1:
                 self._data_index = (self._data_index + 1) % len(self._data)
@@ -2,8 +2,150 @@
 Plane sweep animation that plays when a new flight is detected.
 Shows a commercial airliner flying across screen - fills full height.
 """
+import numpy as np
+
+from utilities import sprites
 from utilities.animator import Animator
-from setup import colours, frames
+from setup import colours, frames, screen
+
+
+def _is_demo_mode():
+    """Check if running in test/demo mode (test_animation.py)."""
+    try:
+        import config
+        config.ZONE_HOME
+        return False
+    except (ImportError, AttributeError):
+        return True
+
+DEMO_MODE = _is_demo_mode()
+
+
+def _render_sky():
+    # sky gradient behind the plane, one colour per row
+    rows = np.arange(screen.HEIGHT)
+    rgb = np.zeros((screen.HEIGHT, screen.WIDTH, 3), dtype=np.uint8)
+    rgb[..., 0] = (135 - rows)[:, None]
+    rgb[..., 1] = (240 - rows * 2)[:, None]
+    rgb[..., 2] = 255
+    return sprites.Sprite(rgb, np.ones((screen.HEIGHT, screen.WIDTH), dtype=bool))
+
+
+def _draw_plane(set_pixel):
+    """Draw Boeing 777 style plane - full screen height (32px), tail at x=0."""
+    # colors
+    white = (240, 240, 245)
+    light_gray = (200, 200, 210)
+    dark_gray = (120, 120, 130)
+    blue = (30, 60, 180)
+    red = (200, 40, 50)
+    window_blue = (60, 90, 140)
+    engine_gray = (180, 180, 185)
+
+    # plane spans full 32 pixel height
+    # y=0 is top, y=31 is bottom
+    # center of fuselage at y=16
+
+    # fuselage - fill it row by row for smooth shape
+    # top taper (rows 0-5)
+    for dx in range(18, 28):
+        set_pixel(dx, 0, white)
+    for dx in range(14, 32):
+        set_pixel(dx, 1, white)
+    for dx in range(10, 36):
+        set_pixel(dx, 2, white)
+    for dx in range(7, 39):
+        set_pixel(dx, 3, white)
+    for dx in range(5, 41):
+        set_pixel(dx, 4, white)
+    for dx in range(3, 43):
+        set_pixel(dx, 5, white)
+
+    # upper body (rows 6-11)
+    for dy in range(6, 12):
+        for dx in range(1, 45):
+            set_pixel(dx, dy, white)
+
+    # blue stripe (rows 12-14)
+    for dy in range(12, 15):
+        for dx in range(0, 46):
+            set_pixel(dx, dy, blue)
+
+    # red stripe (rows 15-17)
+    for dy in range(15, 18):
+        for dx in range(0, 46):
+            set_pixel(dx, dy, red)
+
+    # lower body (rows 18-23)
+    for dy in range(18, 24):
+        for dx in range(1, 45):
+            set_pixel(dx, dy, white)
+
+    # bottom taper (rows 24-31)
+    for dx in range(3, 43):
+        set_pixel(dx, 24, white)
+    for dx in range(5, 41):
+        set_pixel(dx, 25, white)
+    for dx in range(7, 39):
+        set_pixel(dx, 26, white)
+    for dx in range(10, 36):
+        set_pixel(dx, 27, white)
+    for dx in range(14, 32):
+        set_pixel(dx, 28, white)
+    for dx in range(18, 28):
+        set_pixel(dx, 29, white)
+
+    # nose cone (right side, rounded)
+    for dy in range(4, 26):
+        set_pixel(46, dy, light_gray)
+    for dy in range(5, 25):
+        set_pixel(47, dy, light_gray)
+    for dy in range(7, 23):
+        set_pixel(48, dy, light_gray)
+    for dy in range(9, 21):
+        set_pixel(49, dy, light_gray)
+    for dy in range(12, 18):
+        set_pixel(50, dy, light_gray)
+
+    # cockpit windows (dark area on nose)
+    for dy in range(4, 9):
+        for dx in range(42, 47):
+            set_pixel(dx, dy, window_blue)
+
+    # passenger windows (row of dots)
+    for dx in range(10, 40, 4):
+        set_pixel(dx, 7, window_blue)
+        set_pixel(dx + 1, 7, window_blue)
+        set_pixel(dx, 8, window_blue)
+        set_pixel(dx + 1, 8, window_blue)
+
+    # tail fin (vertical stabilizer) - at back, going up
+    for dy in range(-12, 6):
+        for dx in range(-2, 4):
+            set_pixel(dx, dy, white)
+    for dy in range(-10, 4):
+        for dx in range(4, 7):
+            set_pixel(dx, dy, white)
+
+    # tail blue stripe
+    for dy in range(-10, 2):
+        set_pixel(0, dy, blue)
+        set_pixel(1, dy, blue)
+        set_pixel(2, dy, blue)
+
+    # engine (underneath, larger)
+    for dy in range(26, 32):
+        for dx in range(18, 30):
+            set_pixel(dx, dy, engine_gray)
+
+    # engine intake (dark circle at front of engine)
+    for dy in range(27, 31):
+        set_pixel(30, dy, dark_gray)
+        set_pixel(31, dy, dark_gray)
+
+
+sprites.register("planeintro.sky", _render_sky)
+sprites.register("planeintro.plane", lambda: sprites.render(_draw_plane))
 
 
 class PlaneIntroScene(object):
@@ -20,138 +162,12 @@ class PlaneIntroScene(object):
         self._plane_intro_x = -50
         self._plane_intro_frames = 0
 
-    def _set_pixel(self, px, py, color):
-        """Helper to set pixel if in bounds."""
-        px, py = int(px), int(py)
-        if 0 <= px < 64 and 0 <= py < 32:
-            self.canvas.SetPixel(px, py, *color)
-
-    def _draw_plane(self, x):
-        """Draw Boeing 777 style plane - full screen height (32px)."""
-        # colors
-        white = (240, 240, 245)
-        light_gray = (200, 200, 210)
-        dark_gray = (120, 120, 130)
-        blue = (30, 60, 180)
-        red = (200, 40, 50)
-        window_blue = (60, 90, 140)
-        engine_gray = (180, 180, 185)
-
-        # plane spans full 32 pixel height
-        # y=0 is top, y=31 is bottom
-        # center of fuselage at y=16
-
-        # fuselage - fill it row by row for smooth shape
-        # top taper (rows 0-5)
-        for dx in range(18, 28):
-            self._set_pixel(x + dx, 0, white)
-        for dx in range(14, 32):
-            self._set_pixel(x + dx, 1, white)
-        for dx in range(10, 36):
-            self._set_pixel(x + dx, 2, white)
-        for dx in range(7, 39):
-            self._set_pixel(x + dx, 3, white)
-        for dx in range(5, 41):
-            self._set_pixel(x + dx, 4, white)
-        for dx in range(3, 43):
-            self._set_pixel(x + dx, 5, white)
-
-        # upper body (rows 6-11)
-        for dy in range(6, 12):
-            for dx in range(1, 45):
-                self._set_pixel(x + dx, dy, white)
-
-        # blue stripe (rows 12-14)
-        for dy in range(12, 15):
-            for dx in range(0, 46):
-                self._set_pixel(x + dx, dy, blue)
-
-        # red stripe (rows 15-17)
-        for dy in range(15, 18):
-            for dx in range(0, 46):
-                self._set_pixel(x + dx, dy, red)
-
-        # lower body (rows 18-23)
-        for dy in range(18, 24):
-            for dx in range(1, 45):
-                self._set_pixel(x + dx, dy, white)
-
-        # bottom taper (rows 24-31)
-        for dx in range(3, 43):
-            self._set_pixel(x + dx, 24, white)
-        for dx in range(5, 41):
-            self._set_pixel(x + dx, 25, white)
-        for dx in range(7, 39):
-            self._set_pixel(x + dx, 26, white)
-        for dx in range(10, 36):
-            self._set_pixel(x + dx, 27, white)
-        for dx in range(14, 32):
-            self._set_pixel(x + dx, 28, white)
-        for dx in range(18, 28):
-            self._set_pixel(x + dx, 29, white)
-
-        # nose cone (right side, rounded)
-        for dy in range(4, 26):
-            self._set_pixel(x + 46, dy, light_gray)
-        for dy in range(5, 25):
-            self._set_pixel(x + 47, dy, light_gray)
-        for dy in range(7, 23):
-            self._set_pixel(x + 48, dy, light_gray)
-        for dy in range(9, 21):
-            self._set_pixel(x + 49, dy, light_gray)
-        for dy in range(12, 18):
-            self._set_pixel(x + 50, dy, light_gray)
-
-        # cockpit windows (dark area on nose)
-        for dy in range(4, 9):
-            for dx in range(42, 47):
-                self._set_pixel(x + dx, dy, window_blue)
-
-        # passenger windows (row of dots)
-        for dx in range(10, 40, 4):
-            self._set_pixel(x + dx, 7, window_blue)
-            self._set_pixel(x + dx + 1, 7, window_blue)
-            self._set_pixel(x + dx, 8, window_blue)
-            self._set_pixel(x + dx + 1, 8, window_blue)
-
-        # tail fin (vertical stabilizer) - at back, going up
-        for dy in range(-12, 6):
-            for dx in range(-2, 4):
-                self._set_pixel(x + dx, dy, white)
-        for dy in range(-10, 4):
-            for dx in range(4, 7):
-                self._set_pixel(x + dx, dy, white)
-
-        # tail blue stripe
-        for dy in range(-10, 2):
-            self._set_pixel(x + 0, dy, blue)
-            self._set_pixel(x + 1, dy, blue)
-            self._set_pixel(x + 2, dy, blue)
-
-        # engine (underneath, larger)
-        for dy in range(26, 32):
-            for dx in range(18, 30):
-                self._set_pixel(x + dx, dy, engine_gray)
-
-        # engine intake (dark circle at front of engine)
-        for dy in range(27, 31):
-            self._set_pixel(x + 30, dy, dark_gray)
-            self._set_pixel(x + 31, dy, dark_gray)
-
-    def _is_demo_mode(self):
-        """Check if running in test/demo mode (test_animation.py)."""
-        try:
-            import config
-            config.ZONE_HOME
-            return False
-        except (ImportError, AttributeError):
-            return True
-
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1,
+        active=lambda self: self._plane_intro_active or self._data or DEMO_MODE,
+    )
     def plane_intro(self, count):
-        demo_mode = self._is_demo_mode()
-
-        if demo_mode:
+        if DEMO_MODE:
             # in test_animation.py - loop the intro for demo purposes
             if not self._plane_intro_active and self._plane_intro_x > 70:
                 if count % 30 == 0:
@@ -173,21 +189,16 @@ class PlaneIntroScene(object):
         # the plane acts as a "wipe" transition
         # left of plane = black (cleared for flight info after intro)
         # right of plane = sky background
-        plane_back_x = self._plane_intro_x - 2  # trailing edge of plane
-
-        for py in range(32):
-            for px in range(64):
-                if px < plane_back_x:
-                    # left side: clear to black
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                else:
-                    # right side: sky gradient
-                    blue_val = 220 - int(py * 1.5)
-                    green_val = 240 - int(py * 2)
-                    self.canvas.SetPixel(px, py, 135 - py, green_val, 255)
+        plane_back_x = min(max(self._plane_intro_x - 2, 0), screen.WIDTH)  # trailing edge of plane
+
+        self.tracked.begin("planeintro")
+        frame = self.tracked.paint(0, 0, screen.WIDTH - 1, screen.HEIGHT - 1)
+        frame[:, :plane_back_x] = 0
+        frame[:, plane_back_x:] = sprites.get("planeintro.sky").rgb[:, plane_back_x:]
 
         # draw the plane (no preview - let real scenes render after intro ends)
-        self._draw_plane(self._plane_intro_x)
+        sprites.get("planeintro.plane").draw(self.tracked, self._plane_intro_x, 0)
+        self.tracked.end()
 
         # move plane
         self._plane_intro_x += 3
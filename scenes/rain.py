@@ -1,6 +1,6 @@
 import random
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from setup import frames
 
 
@@ -39,7 +39,6 @@ class RainScene(object):
         super().__init__()
         self._raindrops = []
         self._rain_initialized = False
-        self._last_rain_pixels = []
         self._lightning_frames = 0
         self._puddles = [0] * 64  # splash effect at bottom
 
@@ -50,14 +49,11 @@ class RainScene(object):
             drop.y = random.uniform(0, 31)
         self._rain_initialized = True
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
     def rain(self, count):
         # only show when no flights overhead
         if len(self._data):
-            if self._last_rain_pixels:
-                for px, py in self._last_rain_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_rain_pixels = []
+            self.tracked.erase("rain")
             return
 
         # only show in demo/test mode
@@ -72,25 +68,21 @@ class RainScene(object):
         if not self._rain_initialized:
             self._init_rain()
 
-        drawn_pixels = []
+        # pixels not redrawn this pass are erased when it ends
+        self.tracked.begin("rain")
 
-        # clear previous
-        for px, py in self._last_rain_pixels:
-            self.canvas.SetPixel(px, py, 0, 0, 0)
-
-        self.clear_clock_region(drawn_pixels)
-        self.clear_date_region(drawn_pixels)
+        self.clear_clock_region()
+        self.clear_date_region()
 
         # check for lightning
         if self._lightning_frames > 0:
             self._lightning_frames -= 1
             # flash the screen
             flash_intensity = int(200 * (self._lightning_frames / LIGHTNING_DURATION))
-            for x in range(64):
-                for y in range(32):
-                    self.canvas.SetPixel(x, y, flash_intensity, flash_intensity, flash_intensity + 50)
-                    drawn_pixels.append((x, y))
-            self._last_rain_pixels = drawn_pixels
+            self.tracked.fill_rect(
+                0, 0, 63, 31, flash_intensity, flash_intensity, flash_intensity + 50
+            )
+            self.tracked.end()
             return
 
         # maybe trigger lightning
@@ -103,8 +95,7 @@ class RainScene(object):
                 cloud_intensity = int(15 * (1 - y / 10))
                 # deterministic cloud pattern using position-based hash
                 if ((x * 7 + y * 13 + count) % 10) < 3:
-                    self.canvas.SetPixel(x, y, cloud_intensity, cloud_intensity, cloud_intensity + 5)
-                    drawn_pixels.append((x, y))
+                    self.tracked.set_pixel(x, y, cloud_intensity, cloud_intensity, cloud_intensity + 5)
 
         # update and draw raindrops
         for drop in self._raindrops:
@@ -126,8 +117,7 @@ class RainScene(object):
                     r = int(RAIN_COLOR[0] * drop.brightness * fade)
                     g = int(RAIN_COLOR[1] * drop.brightness * fade)
                     b = int(RAIN_COLOR[2] * drop.brightness * fade)
-                    self.canvas.SetPixel(px, py, r, g, b)
-                    drawn_pixels.append((px, py))
+                    self.tracked.set_pixel(px, py, r, g, b)
 
         # draw and decay puddles/splashes at bottom
         for x in range(64):
@@ -137,10 +127,9 @@ class RainScene(object):
                     px = x + dx
                     if 0 <= px < 64:
                         intensity = int(80 * (1 - abs(dx) / (self._puddles[x] + 1)))
-                        self.canvas.SetPixel(px, 31, intensity, intensity, intensity + 30)
-                        drawn_pixels.append((px, 31))
+                        self.tracked.set_pixel(px, 31, intensity, intensity, intensity + 30)
                 # decay puddle
                 if random.random() < 0.2:
                     self._puddles[x] -= 1
 
-        self._last_rain_pixels = drawn_pixels
+        self.tracked.end()
@@ -1,6 +1,6 @@
 import random
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import frames
 
@@ -59,7 +59,6 @@ class StarfieldScene(object):
         self._starfield_stars = []
         self._starfield_shooting_stars = []
         self._starfield_initialized = False
-        self._last_star_pixels = []
 
     def _init_stars(self):
         self._starfield_stars = []
@@ -71,45 +70,33 @@ class StarfieldScene(object):
             self._starfield_stars.append(Star(x, y, brightness, phase))
         self._starfield_initialized = True
 
-    @Animator.KeyFrame.add(frames.PER_SECOND // 10)
+    @Animator.KeyFrame.add(frames.PER_SECOND // 10, phase=PHASE_IDLE)
     def starfield(self, count):
         # only show when no flights overhead
         if len(self._data):
             # clear stars if flights appear
-            if self._last_star_pixels:
-                for px, py in self._last_star_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_star_pixels = []
+            self.tracked.erase("starfield")
             return
 
         # only show during quiet hours or demo mode
         if not DEMO_MODE and not should_display_be_dim():
-            if self._last_star_pixels:
-                for px, py in self._last_star_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_star_pixels = []
+            self.tracked.erase("starfield")
             return
 
         # quiet-hours ambient cycling
         if not self._register_quiet_ambient('starfield'):
-            if self._last_star_pixels:
-                for px, py in self._last_star_pixels:
-                    self.canvas.SetPixel(px, py, 0, 0, 0)
-                self._last_star_pixels = []
+            self.tracked.erase("starfield")
             return
 
         # initialize stars on first run
         if not self._starfield_initialized:
             self._init_stars()
 
-        drawn_pixels = []
+        # previous positions not redrawn this pass are erased when it ends
+        self.tracked.begin("starfield")
 
-        # clear previous positions
-        for px, py in self._last_star_pixels:
-            self.canvas.SetPixel(px, py, 0, 0, 0)
-
-        self.clear_clock_region(drawn_pixels)
-        self.clear_date_region(drawn_pixels)
+        self.clear_clock_region()
+        self.clear_date_region()
 
         # update and draw stars
         for star in self._starfield_stars:
@@ -124,8 +111,7 @@ class StarfieldScene(object):
             g = int(base_color[1] * (0.3 + 0.7 * twinkle))
             b = int(base_color[2] * (0.3 + 0.7 * twinkle))
 
-            self.canvas.SetPixel(star.x, star.y, r, g, b)
-            drawn_pixels.append((star.x, star.y))
+            self.tracked.set_pixel(star.x, star.y, r, g, b)
 
         # maybe spawn shooting star
         if random.random() < SHOOTING_STAR_CHANCE:
@@ -148,12 +134,11 @@ class StarfieldScene(object):
                     r = int(255 * fade)
                     g = int(255 * fade)
                     b = int(200 * fade)
-                    self.canvas.SetPixel(trail_x, trail_y, r, g, b)
-                    drawn_pixels.append((trail_x, trail_y))
+                    self.tracked.set_pixel(trail_x, trail_y, r, g, b)
 
             # keep if still on screen
             if 0 <= ss.x < 64 and 0 <= ss.y < 32:
                 new_shooting_stars.append(ss)
 
         self._starfield_shooting_stars = new_shooting_stars
-        self._last_star_pixels = drawn_pixels
+        self.tracked.end()
@@ -1,10 +1,10 @@
 import math
 import random
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -71,7 +71,9 @@ class StPatricksScene(object):
         today = get_now().strftime("%m-%d")
         return today == "03-17"
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_st_patricks() or None
+    )
     def stpatricks(self, count):
         if len(self._data):
             if self._last_stpatricks_pixels:
@@ -80,9 +82,6 @@ class StPatricksScene(object):
                 self._last_stpatricks_pixels = []
             return
 
-        if not self._is_st_patricks():
-            return
-
         # yield to ambient scenes during quiet hours
         if not DEMO_MODE and should_display_be_dim():
             if self._last_stpatricks_pixels:
@@ -1,10 +1,10 @@
 import math
 import random
 from datetime import datetime, date
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -115,7 +115,9 @@ class ThanksgivingScene(object):
             self.canvas.SetPixel(x + 4, y - 1, *orange)
             drawn_pixels.append((x + 4, y - 1))
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_thanksgiving() or None
+    )
     def thanksgiving(self, count):
         if len(self._data):
             if self._last_thanksgiving_pixels:
@@ -124,9 +126,6 @@ class ThanksgivingScene(object):
                 self._last_thanksgiving_pixels = []
             return
 
-        if not self._is_thanksgiving():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_thanksgiving_pixels:
                 for px, py in self._last_thanksgiving_pixels:
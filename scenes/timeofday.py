@@ -1,5 +1,5 @@
 import math
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from setup import frames
 
@@ -46,7 +46,7 @@ class TimeOfDayScene(object):
         b = int(color1[2] + (color2[2] - color1[2]) * t)
         return (r, g, b)
 
-    @Animator.KeyFrame.add(2)  # slower update rate
+    @Animator.KeyFrame.add(2, phase=PHASE_IDLE)  # slower update rate
     def time_of_day(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -1,10 +1,10 @@
 import math
 import random
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_IDLE
 from utilities.datenow import get_now
 from utilities.quiethours import should_display_be_dim
 from setup import colours, frames, fonts
-from rgbmatrix import graphics
+from utilities import graphics
 
 
 def _is_demo_mode():
@@ -78,7 +78,9 @@ class ValentinesScene(object):
         today = get_now().strftime("%m-%d")
         return today == "02-14"
 
-    @Animator.KeyFrame.add(1)
+    @Animator.KeyFrame.add(
+        1, phase=PHASE_IDLE, occasion=lambda self: self._is_valentines_day() or None
+    )
     def valentines(self, count):
         # only show when no flights overhead
         if len(self._data):
@@ -88,9 +90,6 @@ class ValentinesScene(object):
                 self._last_valentines_pixels = []
             return
 
-        if not self._is_valentines_day():
-            return
-
         if not DEMO_MODE and should_display_be_dim():
             if self._last_valentines_pixels:
                 for px, py in self._last_valentines_pixels:
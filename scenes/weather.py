@@ -4,8 +4,8 @@ import time
 import json
 from math import ceil
 from functools import lru_cache
-from rgbmatrix import graphics
-from utilities.animator import Animator
+from utilities import graphics
+from utilities.animator import Animator, PHASE_OVERLAY
 from utilities.datenow import get_now
 from setup import colours, fonts, frames
 import sys
@@ -188,6 +188,15 @@ def grab_current_temperature_openweather(location, apikey, units):
     return current_temp
 
 
+def _has_overspill(rainfall_and_temperature):
+    # any hour with more rain than the graph can show flashes
+    return any(
+        ceil(data["precip_mm"] * (RAINFALL_GRAPH_HEIGHT / RAINFALL_MAX_VALUE))
+        > RAINFALL_GRAPH_HEIGHT
+        for data in rainfall_and_temperature or ()
+    )
+
+
 def _is_demo_mode():
     try:
         from config import ZONE_HOME
@@ -308,10 +317,10 @@ class WeatherScene(object):
 
                 self.draw_square(x1, y1, x2, y2, colours.BLACK)
 
-    # zx_ prefix ensures this runs AFTER all idle animations in alphabetical
-    # keyframe order, so _idle_drawn_this_frame is already set correctly
-    @Animator.KeyFrame.add(frames.PER_SECOND * 1)
-    def zx_rainfall(self, count):
+    # overlay phase runs AFTER all idle animations,
+    # so _idle_drawn_this_frame is already set correctly
+    @Animator.KeyFrame.add(frames.PER_SECOND * 1, phase=PHASE_OVERLAY)
+    def rainfall(self, count):
 
         if not RAINFALL_ENABLED:
             return
@@ -337,14 +346,24 @@ class WeatherScene(object):
             )
 
         # Test for drawing rainfall if data is available
-        if not self._last_upcoming_rain_and_temp == self.upcoming_rain_and_temp:
+        changed = not self._last_upcoming_rain_and_temp == self.upcoming_rain_and_temp
+        if changed:
             if self._last_upcoming_rain_and_temp is not None:
                 # Undraw previous graph
                 self.draw_rainfall_and_temperature(
                     self._last_upcoming_rain_and_temp, colours.BLACK
                 )
 
-        if self.upcoming_rain_and_temp:
+        # an unchanged graph only needs redrawing to flash its over-spill,
+        # or where something drew over it
+        flashing = RAINFALL_OVERSPILL_FLASH_ENABLED and _has_overspill(
+            self.upcoming_rain_and_temp
+        )
+        damaged = self.overlay_damaged(
+            RAINFALL_GRAPH_ORIGIN[1] - RAINFALL_GRAPH_HEIGHT, RAINFALL_GRAPH_ORIGIN[1] + 1
+        )
+
+        if self.upcoming_rain_and_temp and (changed or flashing or damaged):
             # Draw new graph
             flash_enabled = (
                 True if RAINFALL_OVERSPILL_FLASH_ENABLED and (count % 2) else False
@@ -355,13 +374,15 @@ class WeatherScene(object):
             )
             self._last_upcoming_rain_and_temp = self.upcoming_rain_and_temp.copy()
 
-    # zx_ prefix ensures this runs AFTER all idle animations in alphabetical
-    # keyframe order, so _idle_drawn_this_frame is already set correctly
-    @Animator.KeyFrame.add(frames.PER_SECOND * 1)
-    def zx_temperature(self, count):
+    # overlay phase runs AFTER all idle animations,
+    # so _idle_drawn_this_frame is already set correctly
+    @Animator.KeyFrame.add(frames.PER_SECOND * 1, phase=PHASE_OVERLAY)
+    def temperature(self, count):
 
         if len(self._data):
             # Don't draw if there's plane data
+            # and redraw when this is visible again
+            self._last_temperature_str = None
             return
 
         if self._idle_drawn_this_frame:
@@ -392,6 +413,18 @@ class WeatherScene(object):
                 idx = (count // TEMPERATURE_REFRESH_SECONDS) % len(DEMO_TEMPERATURES)
                 self.current_temperature = DEMO_TEMPERATURES[idx]
 
+        temp_str = None
+        if self.current_temperature is not None:
+            temp_str = f"{round(self.current_temperature)}°".rjust(4, " ")
+
+        if (
+            temp_str == self._last_temperature_str
+            and self.current_temperature == self._last_temperature
+            and not self.overlay_damaged(0, TEMPERATURE_POSITION[1])
+        ):
+            # Already on screen, leave the canvas alone
+            return
+
         if self._last_temperature_str is not None:
             # Undraw old temperature
             _ = graphics.DrawText(
@@ -403,9 +436,7 @@ class WeatherScene(object):
                 self._last_temperature_str,
             )
 
-        if self.current_temperature is not None:
-            temp_str = f"{round(self.current_temperature)}°".rjust(4, " ")
-
+        if temp_str is not None:
             temp_colour = self.temperature_to_colour(self.current_temperature)
 
             # Draw temperature
@@ -418,5 +449,5 @@ class WeatherScene(object):
                 temp_str,
             )
 
-            self._last_temperature = self.current_temperature
-            self._last_temperature_str = temp_str
+        self._last_temperature = self.current_temperature
+        self._last_temperature_str = temp_str
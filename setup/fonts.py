@@ -1,15 +1,19 @@
 import os
-from rgbmatrix import graphics
+
+from utilities import text
 
 # Fonts
 DIR_PATH = os.path.dirname(os.path.realpath(__file__))
-extrasmall = graphics.Font()
-small = graphics.Font()
-regular = graphics.Font()
-large = graphics.Font()
-large_bold = graphics.Font()
-extrasmall.LoadFont(f"{DIR_PATH}/../fonts/4x6.bdf")
-small.LoadFont(f"{DIR_PATH}/../fonts/5x8.bdf")
-regular.LoadFont(f"{DIR_PATH}/../fonts/6x12.bdf")
-large.LoadFont(f"{DIR_PATH}/../fonts/8x13.bdf")
-large_bold.LoadFont(f"{DIR_PATH}/../fonts/8x13B.bdf")
+
+
+def _load(filename):
+    # glyphs are read from the font's atlas on first use, and the
+    # rgbmatrix font only once something draws with it (utilities/graphics.py)
+    return text.BitmapFont(f"{DIR_PATH}/../fonts/{filename}")
+
+
+extrasmall = _load("4x6.bdf")
+small = _load("5x8.bdf")
+regular = _load("6x12.bdf")
+large = _load("8x13.bdf")
+large_bold = _load("8x13B.bdf")
@@ -105,7 +105,7 @@ if brightness_arg is not None:
     print(f"   Brightness: {brightness_arg}%")
 print()
 
-from utilities.animator import Animator
+from utilities.animator import Animator, PHASE_PRESENT
 from setup import frames
 
 # available animations to test
@@ -265,9 +265,10 @@ def main():
                 if hasattr(self, '_scenario_days'):
                     self._scenario_days = svalue
 
-        @Animator.KeyFrame.add(1)
-        def zzz_sync(self, count):
-            self.matrix.SwapOnVSync(self.canvas)
+        @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+        def sync(self, count):
+            self._present_tracked()
+            self.matrix.SwapOnVSync(self._canvas)
 
         def run(self):
             print(f"Testing: {animation_name}")
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""tests for the Animator keyframe scheduler."""
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from utilities import animator
+from utilities.animator import Animator, PHASE_IDLE, PHASE_OVERLAY, PHASE_PRESENT
+
+
+class FakeClock:
+    """monotonic clock that only moves when slept or advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_animator(render_time=0.0):
+    """build an animator whose keyframes log (frame, name) and take render_time."""
+
+    class Recorder(Animator):
+        def __init__(self):
+            self.calls = []
+            self.clock = None
+            super().__init__()
+            self.delay = 0.1
+
+        def _record(self, name):
+            self.calls.append((self.frame, name))
+            if self.clock:
+                self.clock.now += render_time
+
+        @Animator.KeyFrame.add(0)
+        def reset(self):
+            self._record("reset")
+
+        @Animator.KeyFrame.add(1)
+        def every_frame(self, count):
+            self._record("every_frame")
+
+        @Animator.KeyFrame.add(5)
+        def every_fifth(self, count):
+            self._record("every_fifth")
+
+    return Recorder()
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patches = [
+            mock.patch.object(animator, "monotonic", self.clock.monotonic),
+            mock.patch.object(animator, "sleep", self.clock.sleep),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _run(self, anim, frames):
+        anim._next_deadline = self.clock.monotonic()
+        for _ in range(frames):
+            anim._run_frame()
+            anim._wait_for_next_frame()
+
+    def test_render_time_does_not_stretch_period(self):
+        anim = make_animator(render_time=0.03)
+        anim.clock = self.clock
+        start = self.clock.now
+        self._run(anim, 10)
+        # 10 frames at 0.1s each, regardless of the 30ms render time
+        self.assertAlmostEqual(self.clock.now - start, 1.0, places=6)
+        self.assertEqual(anim.frame_stats["late"], 0)
+
+    def test_fixed_mode_adds_render_time(self):
+        anim = make_animator(render_time=0.03)
+        anim.clock = self.clock
+        anim.scheduler = animator.SCHEDULER_FIXED
+        start = self.clock.now
+        self._run(anim, 10)
+        render = 0.03 * len(anim.calls)
+        self.assertAlmostEqual(self.clock.now - start, 1.0 + render, places=6)
+
+    def test_overrun_skips_frames_and_coalesces_keyframes(self):
+        anim = make_animator()
+        self._run(anim, 3)
+        # stall for 2.5 frame periods inside frame 3
+        anim._run_frame()
+        self.clock.now += 0.25
+        anim._wait_for_next_frame()
+        self.assertEqual(anim.frame_stats["late"], 1)
+        self.assertEqual(anim.frame_stats["skipped"], 1)
+        self.assertEqual(anim.frame, 5)
+
+        # frame 4 was skipped, the every_fifth tick on frame 5 still runs once
+        anim.calls = []
+        anim._run_frame()
+        self.assertEqual(anim.calls, [(5, "every_fifth"), (5, "every_frame")])
+
+    def test_coalesced_tick_from_skipped_frame(self):
+        anim = make_animator()
+        self._run(anim, 4)
+        # frame 4 overruns by long enough to skip frame 5 entirely
+        anim._run_frame()
+        self.clock.now += 0.25
+        anim._wait_for_next_frame()
+        self.assertEqual(anim.frame, 6)
+        anim.calls = []
+        anim._run_frame()
+        # the frame 5 tick of every_fifth is coalesced into frame 6
+        self.assertIn((6, "every_fifth"), anim.calls)
+
+    def test_long_stall_resyncs(self):
+        anim = make_animator()
+        self._run(anim, 2)
+        anim._run_frame()
+        self.clock.now += 60
+        anim._wait_for_next_frame()
+        self.assertEqual(anim.frame_stats["resyncs"], 1)
+        self.assertEqual(anim.frame_stats["skipped"], 0)
+        # next deadline is one period from now, not a burst of catch-up frames
+        anim._run_frame()
+        before = self.clock.now
+        anim._wait_for_next_frame()
+        self.assertAlmostEqual(self.clock.now - before, 0.1, places=6)
+
+
+class TestDispatchTable(unittest.TestCase):
+
+    def test_wheel_matches_modulo_scan(self):
+        class Mixed(Animator):
+            @Animator.KeyFrame.add(10.0)
+            def a_second(self, count):
+                pass
+
+            @Animator.KeyFrame.add(4, 1)
+            def b_offset(self, count):
+                pass
+
+            @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+            def sync(self, count):
+                pass
+
+        anim = Mixed()
+        self.assertEqual(len(anim._wheel), 20)
+        for frame in range(1, 100):
+            expected = [
+                k for k in anim.keyframes
+                if k.properties["divisor"]
+                and not (frame - k.properties["offset"]) % k.properties["divisor"]
+            ]
+            due = [k for _, batch in anim._due_keyframes(frame) for k in batch]
+            self.assertEqual(due, expected)
+
+    def test_order_follows_method_names(self):
+        anim = make_animator()
+        anim._run_frame()
+        anim.frame = 5
+        anim._run_frame()
+        self.assertEqual(
+            anim.calls,
+            [(0, "reset"), (5, "every_fifth"), (5, "every_frame")],
+        )
+
+    def test_fractional_divisor_falls_back_to_scan(self):
+        class Fractional(Animator):
+            @Animator.KeyFrame.add(2.5)
+            def odd(self, count):
+                pass
+
+        anim = Fractional()
+        self.assertIsNone(anim._wheel)
+        self.assertEqual(len(anim._due_keyframes(5)), 1)
+        self.assertEqual(len(anim._due_keyframes(4)), 0)
+
+
+def make_phased_animator():
+    class Phased(Animator):
+        def __init__(self):
+            self.calls = []
+            self.flights_shown = False
+            super().__init__()
+
+        def _phase_active(self, phase):
+            return not (phase == PHASE_IDLE and self.flights_shown)
+
+        @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+        def a_sync(self, count):
+            self.calls.append("a_sync")
+
+        @Animator.KeyFrame.add(1, phase=PHASE_OVERLAY)
+        def b_clock(self, count):
+            self.calls.append("b_clock")
+
+        @Animator.KeyFrame.add(1, phase=PHASE_IDLE, priority=1)
+        def c_fallback(self, count):
+            self.calls.append("c_fallback")
+
+        @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
+        def d_snow(self, count):
+            self.calls.append("d_snow")
+
+        @Animator.KeyFrame.add(1)
+        def e_flight(self, count):
+            # flights appear part way through the frame
+            self.calls.append("e_flight")
+            self.flights_shown = count >= 1
+
+    return Phased()
+
+
+class TestPhases(unittest.TestCase):
+
+    def test_pipeline_order(self):
+        anim = make_phased_animator()
+        self.assertEqual(
+            [k.__name__ for k in anim.keyframes],
+            ["e_flight", "d_snow", "c_fallback", "b_clock", "a_sync"],
+        )
+        anim.frame = 1
+        anim._run_frame()
+        self.assertEqual(
+            anim.calls, ["e_flight", "d_snow", "c_fallback", "b_clock", "a_sync"]
+        )
+
+    def test_inactive_phase_is_skipped(self):
+        anim = make_phased_animator()
+        anim.frame = 1
+        anim._run_frame()
+        anim.calls = []
+        anim.frame = 2
+        anim._run_frame()
+        # the gate is checked when the idle phase starts, after e_flight ran
+        self.assertEqual(anim.calls, ["e_flight", "b_clock", "a_sync"])
+
+
+def make_idle_animator():
+    class Idle(Animator):
+        def __init__(self):
+            self.calls = []
+            self.flights = []
+            self.animating = False
+            super().__init__()
+            self.delay = 0.1
+
+        @Animator.KeyFrame.add(5)
+        def check_data(self, count):
+            self.calls.append((self.frame, "check_data"))
+
+        @Animator.KeyFrame.add(1, active=lambda self: self.flights)
+        def flight(self, count):
+            self.calls.append((self.frame, "flight"))
+
+        @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
+        def ambient(self, count):
+            self.calls.append((self.frame, "ambient"))
+            if self.animating:
+                self._idle_drawn_this_frame = True
+
+        @Animator.KeyFrame.add(10, phase=PHASE_OVERLAY)
+        def clock(self, count):
+            self.calls.append((self.frame, "clock"))
+
+        @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+        def sync(self, count):
+            self.calls.append((self.frame, "sync"))
+
+    return Idle()
+
+
+class TestIdleSleep(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.wake_at = None
+        self.transition = None
+        self.anim = make_idle_animator()
+        schedule = mock.Mock()
+        schedule.next_transition = lambda: self.transition
+        patches = [
+            mock.patch.object(animator, "monotonic", self.clock.monotonic),
+            mock.patch.object(animator, "sleep", self.clock.sleep),
+            mock.patch.object(animator, "get_schedule", lambda: schedule),
+            mock.patch.object(animator.datenow, "_read_clock", self._now),
+            mock.patch.object(self.anim, "_sleep_until_woken", self._sleep_until_woken),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _sleep_until_woken(self, seconds):
+        if self.wake_at is not None and self.clock.now + seconds > self.wake_at:
+            # another thread calls wake() part way through the sleep
+            self.clock.now = self.wake_at
+            self.wake_at = None
+            self.anim.wake(self.anim.clock)
+            return True
+        self.clock.now += seconds
+        return False
+
+    def _now(self):
+        # wall clock in step with the fake monotonic one
+        return datetime(2026, 10, 16, 21, 0) + timedelta(seconds=self.clock.now)
+
+    def _run(self, frames):
+        self.anim._next_deadline = self.clock.monotonic()
+        for _ in range(frames):
+            self.anim._run_frame()
+            self.anim._wait_for_next_frame()
+
+    def test_sleeps_until_next_active_keyframe(self):
+        start = self.clock.now
+        self._run(4)
+        # frame 0 resets, frame 1 runs, then check_data (5) and clock (10)
+        self.assertEqual(self.anim.frame, 15)
+        self.assertEqual(
+            [frame for frame, name in self.anim.calls if name == "sync"], [1, 5, 10]
+        )
+        self.assertAlmostEqual(self.clock.now - start, 1.5, places=6)
+        self.assertEqual(self.anim.frame_stats["slept"], 11)
+
+    def test_slept_frames_coalesce_into_next(self):
+        self._run(2)
+        self.anim.calls = []
+        self.anim._run_frame()
+        # the idle animation still gets a look in on the frame woken for
+        self.assertEqual(
+            self.anim.calls,
+            [(5, "check_data"), (5, "flight"), (5, "ambient"), (5, "sync")],
+        )
+
+    def test_drawing_idle_animation_keeps_full_rate(self):
+        self.anim.animating = True
+        self._run(12)
+        self.assertEqual(self.anim.frame, 12)
+        self.assertEqual(self.anim.frame_stats["slept"], 0)
+
+    def test_active_check_keeps_full_rate(self):
+        self.anim.flights = ["AAL123"]
+        self._run(12)
+        self.assertEqual(self.anim.frame, 12)
+
+    def test_wake_cuts_sleep_short_and_runs_keyframes(self):
+        self._run(2)
+        self.assertEqual(self.anim.frame, 5)
+        # woken 0.23s into the sleep towards frame 10
+        self.anim._run_frame()
+        self.wake_at = self.clock.now + 0.23
+        self.anim._wait_for_next_frame()
+        # resumes on the first deadline after the wake
+        self.assertEqual(self.anim.frame, 8)
+        self.assertAlmostEqual(self.anim._next_deadline, self.clock.now, places=6)
+        self.anim.calls = []
+        self.anim._run_frame()
+        self.assertIn((8, "clock"), self.anim.calls)
+
+    def test_sleep_ends_at_quiet_hours_transition(self):
+        self._run(2)
+        self.anim._run_frame()
+        # quiet hours start 0.25s into the sleep towards frame 10
+        self.transition = self._now() + timedelta(seconds=0.25)
+        self.anim._wait_for_next_frame()
+        self.assertEqual(self.anim.frame, 8)
+        self.assertGreaterEqual(self._now(), self.transition)
+
+    def test_wake_during_frame_prevents_sleep(self):
+        self._run(2)
+        self.anim._run_frame()
+        self.anim.wake()
+        self.anim._wait_for_next_frame()
+        self.assertEqual(self.anim.frame, 6)
+
+
+class NullCanvas:
+    def SetPixel(self, x, y, r, g, b):
+        pass
+
+
+class TestCanvasChanged(unittest.TestCase):
+
+    def setUp(self):
+        class Painter(Animator):
+            def __init__(self):
+                self.canvas = NullCanvas()
+                self.raw = 0
+                self.tracked_pixel = None
+                super().__init__()
+
+            @Animator.KeyFrame.add(1)
+            def draw(self, count):
+                # looking at the canvas without drawing on it
+                hasattr(self.canvas, "SetImage")
+                for _ in range(self.raw):
+                    self.canvas.SetPixel(0, 0, 255, 0, 0)
+                if self.tracked_pixel:
+                    self.tracked.begin("draw")
+                    self.tracked.set_pixel(*self.tracked_pixel)
+                    self.tracked.end()
+
+            @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+            def sync(self, count):
+                self._present_tracked()
+                self.changed.append(self.canvas_changed())
+
+        self.anim = Painter()
+        self.anim.changed = []
+
+    def _frames(self, count):
+        for _ in range(count):
+            self.anim.frame += 1
+            self.anim._run_frame()
+
+    def test_quiet_frames_are_unchanged(self):
+        self._frames(3)
+        # the first frame shows whatever was set up before it
+        self.assertEqual(self.anim.changed, [True, False, False])
+
+    def test_raw_canvas_use_counts_as_a_change(self):
+        self._frames(1)
+        self.anim.raw = 3
+        self._frames(2)
+        self.anim.raw = 0
+        self._frames(1)
+        self.assertEqual(self.anim.changed, [True, True, True, False])
+
+    def test_later_raw_draws_skip_the_wrapper(self):
+        self.anim.canvas.mark_drawn()
+        self.assertEqual(self.anim.canvas.SetPixel, self.anim._canvas.SetPixel)
+        self.anim.canvas.take_drawn()
+        self.assertNotEqual(self.anim.canvas.SetPixel, self.anim._canvas.SetPixel)
+
+    def test_tracked_writes_count_only_when_sent(self):
+        self._frames(1)
+        self.anim.tracked_pixel = (1, 1, 0, 255, 0)
+        self._frames(2)
+        # drawn again unchanged on the third frame, so nothing is sent
+        self.assertEqual(self.anim.changed, [True, True, False])
+
+
+class ShownCanvas:
+    """canvas that remembers the last colour written to each pixel."""
+
+    def __init__(self):
+        self.shown = {}
+
+    def SetPixel(self, x, y, r, g, b):
+        self.shown[x, y] = (r, g, b)
+
+
+class TestOverlays(unittest.TestCase):
+
+    def setUp(self):
+        class Layered(Animator):
+            def __init__(self):
+                self.canvas = ShownCanvas()
+                self.star = None
+                self.damage = []
+                super().__init__()
+
+            @Animator.KeyFrame.add(1, phase=PHASE_IDLE)
+            def stars(self, count):
+                self.tracked.begin("stars")
+                if self.star:
+                    self.tracked.set_pixel(*self.star, 255, 255, 255)
+                self.tracked.end()
+
+            @Animator.KeyFrame.add(1, phase=PHASE_OVERLAY)
+            def clock(self, count):
+                damaged = self.overlay_damaged(0, 10)
+                self.damage.append(damaged)
+                if count == 0 or damaged:
+                    self.canvas.SetPixel(5, 2, 0, 0, 255)
+
+            @Animator.KeyFrame.add(1, phase=PHASE_PRESENT)
+            def sync(self, count):
+                self._present_tracked()
+
+        self.anim = Layered()
+
+    def _frames(self, count):
+        for _ in range(count):
+            self.anim.frame += 1
+            self.anim._run_frame()
+
+    def test_overlay_drawn_over_same_frame_erase(self):
+        self.anim.star = (5, 2)
+        self._frames(1)
+        self.anim.star = None
+        self._frames(1)
+        # the star's erase went out before the clock drew
+        self.assertEqual(self.anim.canvas.shown[5, 2], (0, 0, 255))
+
+    def test_overlay_redraws_after_tracked_drawing_over_it(self):
+        self._frames(2)
+        self.anim.star = (5, 2)
+        self._frames(1)
+        self.anim.star = None
+        self._frames(2)
+        self.assertEqual(self.anim.damage, [False, False, True, True, False])
+        self.assertEqual(self.anim.canvas.shown[5, 2], (0, 0, 255))
+
+
+class TestFrameTime(unittest.TestCase):
+
+    def test_keyframes_share_one_time_per_frame(self):
+        class Reader(Animator):
+            def __init__(self):
+                self.seen = []
+                super().__init__()
+
+            @Animator.KeyFrame.add(1)
+            def first(self, count):
+                self.seen.append(animator.datenow.get_now())
+
+            @Animator.KeyFrame.add(1, phase=PHASE_OVERLAY)
+            def second(self, count):
+                self.seen.append(animator.datenow.get_now())
+
+        anim = Reader()
+        anim.frame = 1
+        anim._run_frame()
+        self.assertEqual(len(anim.seen), 2)
+        self.assertIs(anim.seen[0], anim.seen[1])
+        self.assertIsNot(animator.datenow.get_now(), anim.seen[0])
+
+
+class TestOccasions(unittest.TestCase):
+
+    def setUp(self):
+        class Holidays(Animator):
+            def __init__(self):
+                self.calls = []
+                self.checks = 0
+                super().__init__()
+
+            def _on_the_first(self):
+                self.checks += 1
+                today = animator.datenow.get_now()
+                return today.month if today.day == 1 else None
+
+            @Animator.KeyFrame.add(1, phase=PHASE_IDLE, occasion=_on_the_first)
+            def first_of_month(self, count):
+                self.calls.append(self.occasions["first_of_month"])
+
+            @Animator.KeyFrame.add(1)
+            def every_day(self, count):
+                pass
+
+        self.anim = Holidays()
+        self.today = datetime(2026, 10, 31, 23, 59)
+        patcher = mock.patch.object(animator.datenow, "_read_clock", lambda: self.today)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _frames(self, count):
+        for _ in range(count):
+            self.anim._run_frame()
+            self.anim.frame += 1
+
+    def test_not_scheduled_off_its_day(self):
+        self._frames(3)
+        self.assertEqual(self.anim.calls, [])
+        self.assertNotIn(self.anim.first_of_month, self.anim._periodic_keyframes)
+
+    def test_scheduled_from_midnight_with_the_day_value(self):
+        self._frames(2)
+        self.today = datetime(2026, 11, 1, 0, 0)
+        self._frames(2)
+        self.assertEqual(self.anim.calls, [11, 11])
+
+        self.today = datetime(2026, 11, 2, 0, 0)
+        self._frames(2)
+        self.assertEqual(self.anim.calls, [11, 11])
+
+    def test_checked_once_a_day(self):
+        self._frames(5)
+        self.assertEqual(self.anim.checks, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""tests for the ownership-tracking canvas layer."""
+import unittest
+
+import numpy as np
+
+from utilities import canvas as canvas_module
+from utilities.canvas import TrackedCanvas
+
+
+class RecordingCanvas:
+    """canvas stand-in that records every SetPixel call."""
+
+    def __init__(self):
+        self.pixels = {}
+        self.calls = 0
+
+    def SetPixel(self, x, y, r, g, b):
+        self.pixels[(x, y)] = (r, g, b)
+        self.calls += 1
+
+
+class ImageCanvas(RecordingCanvas):
+    """canvas stand-in that also takes bulk SetImage transfers."""
+
+    def __init__(self):
+        super().__init__()
+        self.images = []
+
+    def SetImage(self, image, offset_x, offset_y):
+        self.images.append((image.size, offset_x, offset_y))
+
+
+class TestTrackedCanvas(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = RecordingCanvas()
+        self.tracked = TrackedCanvas(self.canvas, width=8, height=4)
+
+    def _pass(self, owner, pixels):
+        self.tracked.begin(owner)
+        for (x, y), colour in pixels.items():
+            self.tracked.set_pixel(x, y, *colour)
+        self.tracked.end()
+        self.tracked.present()
+
+    def test_unchanged_pixels_are_not_rewritten(self):
+        self._pass("stars", {(1, 1): (255, 255, 255), (2, 2): (10, 10, 10)})
+        self.assertEqual(self.canvas.calls, 2)
+        self._pass("stars", {(1, 1): (255, 255, 255), (2, 2): (20, 20, 20)})
+        self.assertEqual(self.canvas.calls, 3)
+        self.assertEqual(self.canvas.pixels[(2, 2)], (20, 20, 20))
+
+    def test_pixels_not_redrawn_are_erased(self):
+        self._pass("stars", {(1, 1): (255, 255, 255)})
+        self._pass("stars", {(3, 1): (255, 255, 255)})
+        self.assertEqual(self.canvas.pixels[(1, 1)], (0, 0, 0))
+        self.assertEqual(self.canvas.pixels[(3, 1)], (255, 255, 255))
+
+    def test_last_write_in_a_pass_wins(self):
+        self.tracked.begin("fire")
+        self.tracked.fill_rect(0, 0, 7, 1, 0, 0, 0)
+        self.tracked.set_pixel(4, 1, 255, 120, 0)
+        self.tracked.end()
+        self.tracked.present()
+        self.assertEqual(self.canvas.calls, 16)
+        self.assertEqual(self.canvas.pixels[(4, 1)], (255, 120, 0))
+
+    def test_erase_skips_pixels_taken_by_another_owner(self):
+        self._pass("rain", {(0, 0): (100, 150, 200), (1, 0): (100, 150, 200)})
+        self._pass("fire", {(1, 0): (255, 60, 0)})
+        self.tracked.erase("rain")
+        self.tracked.present()
+        self.assertEqual(self.canvas.pixels[(0, 0)], (0, 0, 0))
+        self.assertEqual(self.canvas.pixels[(1, 0)], (255, 60, 0))
+        self.assertFalse(self.tracked.owns_pixels("rain"))
+
+    def test_distrust_resends_pixels_drawn_over_directly(self):
+        self._pass("stars", {(1, 1): (255, 255, 255)})
+        # drawn over straight on the canvas, e.g. by graphics.DrawText
+        self.canvas.SetPixel(1, 1, 0, 0, 255)
+        self.tracked.distrust()
+        self._pass("stars", {(1, 1): (255, 255, 255)})
+        self.assertEqual(self.canvas.pixels[(1, 1)], (255, 255, 255))
+
+    def test_paint_after_reset_starts_from_black(self):
+        self._pass("fire", {(0, 0): (255, 60, 0), (1, 0): (255, 60, 0)})
+        self.tracked.reset()
+        self.tracked.begin("intro")
+        self.tracked.paint(0, 0, 1, 0)[0, 1] = (0, 0, 255)
+        self.tracked.end()
+        self.tracked.present()
+        self.assertEqual(self.canvas.pixels[(0, 0)], (0, 0, 0))
+        self.assertEqual(self.canvas.pixels[(1, 0)], (0, 0, 255))
+
+    def test_nothing_is_sent_before_present(self):
+        self.tracked.begin("stars")
+        self.tracked.set_pixel(1, 1, 255, 255, 255)
+        self.tracked.end()
+        self.assertEqual(self.canvas.calls, 0)
+        self.tracked.present()
+        self.assertEqual(self.canvas.pixels[(1, 1)], (255, 255, 255))
+
+    def test_untracked_writes_are_always_sent(self):
+        self.tracked.fill_rect(0, 0, 1, 0, 0, 0, 0)
+        self.tracked.fill_rect(0, 0, 1, 0, 0, 0, 0)
+        self.assertEqual(self.canvas.calls, 4)
+
+    def test_out_of_bounds_is_ignored(self):
+        self._pass("snow", {(-1, 0): (255, 255, 255), (8, 0): (255, 255, 255)})
+        self.assertEqual(self.canvas.calls, 0)
+
+    def test_generation_counts_canvas_writes(self):
+        self._pass("stars", {(1, 1): (255, 255, 255)})
+        generation = self.tracked.generation
+        # the same pass again sends nothing
+        self._pass("stars", {(1, 1): (255, 255, 255)})
+        self.assertEqual(self.tracked.generation, generation)
+        self.tracked.set_pixel(0, 0, 1, 2, 3)
+        self.assertEqual(self.tracked.generation, generation + 1)
+
+    def test_dirty_bounding_box(self):
+        self._pass("stars", {(1, 1): (255, 255, 255), (5, 3): (10, 10, 10)})
+        self.assertEqual(self.tracked.take_dirty(), (1, 1, 5, 3))
+        self.assertIsNone(self.tracked.take_dirty())
+
+
+@unittest.skipIf(canvas_module.Image is None, "Pillow is not installed")
+class TestBulkPresent(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = ImageCanvas()
+        self.tracked = TrackedCanvas(self.canvas, width=8, height=4)
+
+    def test_covered_region_is_one_image(self):
+        self.tracked.begin("lightning")
+        self.tracked.fill_rect(0, 0, 7, 3, 255, 255, 200)
+        self.tracked.end()
+        self.tracked.present()
+        self.assertEqual(self.canvas.images, [((8, 4), 0, 0)])
+        self.assertEqual(self.canvas.calls, 0)
+
+    def test_only_the_changed_box_is_sent(self):
+        self.tracked.begin("intro")
+        self.tracked.paint(0, 0, 7, 3)[:] = (0, 0, 80)
+        self.tracked.end()
+        self.tracked.present()
+        self.tracked.begin("intro")
+        view = self.tracked.paint(0, 0, 7, 3)
+        view[:] = (0, 0, 80)
+        view[1:3, 2:4] = (255, 255, 255)
+        self.tracked.end()
+        self.tracked.present()
+        self.assertEqual(self.canvas.images[-1], ((2, 2), 2, 1))
+
+    def test_partly_covered_region_falls_back_to_pixels(self):
+        self._blit_sprite()
+        self.tracked.present()
+        self.assertEqual(self.canvas.images, [])
+        self.assertEqual(self.canvas.calls, 2)
+        self.assertEqual(self.canvas.pixels[(3, 1)], (255, 0, 0))
+
+    def _blit_sprite(self):
+        rgb = np.full((2, 2, 3), 255, dtype=np.uint8)
+        rgb[..., 1:] = 0
+        alpha = np.array([[True, False], [False, True]])
+        self.tracked.begin("plane")
+        self.tracked.blit(2, 0, rgb, alpha)
+        self.tracked.end()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,6 +32,7 @@ class FakeConfigModule:
 sys.modules['config'] = FakeConfigModule()
 
 from utilities.animator import Animator, CLOCK_REGION_Y
+from utilities.datenow import get_now
 
 # idle animations that should respect clock region
 IDLE_ANIMATIONS = {
@@ -152,6 +153,10 @@ def test_scene(name, verbose=False):
     except Exception as e:
         return (False, f"Failed to initialize: {e}")
 
+    # keyframes are called directly below, so work out today's occasions
+    # as the first frame would
+    display._refresh_occasions(get_now().date())
+
     # run a few frames to let the animation draw
     display._idle_drawn_this_frame = False
 
@@ -180,14 +185,15 @@ def test_scene(name, verbose=False):
     # run the animation for a few frames
     for frame in range(10):
         display._idle_drawn_this_frame = False
-        display.canvas.clock_pixels_set = []  # reset per-frame tracking
+        display._canvas.clock_pixels_set = []  # reset per-frame tracking
         try:
             keyframe_method(frame)
+            display._present_tracked()
         except Exception as e:
             return (False, f"Animation error on frame {frame}: {e}")
 
     # check results
-    tracker = display.canvas
+    tracker = display._canvas
 
     # demo-only scenes have `if not DEMO_MODE: return` gate
     # they won't show in production, so clock overlap is acceptable
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """tests for the get_now() debug date helper."""
 import sys
+import threading
 import types
 import unittest
 from datetime import datetime
 
 
-class TestGetNow(unittest.TestCase):
-    """test utilities.datenow.get_now() function."""
+class ConfigTestCase(unittest.TestCase):
+    """fresh config and utilities.datenow modules for each test."""
 
     def setUp(self):
         self._original_config = sys.modules.get('config')
@@ -37,6 +38,10 @@ class TestGetNow(unittest.TestCase):
                 raise ImportError("demo mode - no config")
         sys.modules['config'] = FakeConfigModule()
 
+
+class TestGetNow(ConfigTestCase):
+    """test utilities.datenow.get_now() function."""
+
     def test_no_config_returns_real_now(self):
         self._set_demo_mode()
         from utilities.datenow import get_now
@@ -127,5 +132,47 @@ class TestGetNow(unittest.TestCase):
             self.assertEqual(result.day, 29)
 
 
+class TestFrameSnapshot(ConfigTestCase):
+    """test utilities.datenow.freeze()/thaw() per-frame snapshots."""
+
+    def test_frozen_time_is_shared(self):
+        self._set_demo_mode()
+        from utilities.datenow import freeze, get_now, thaw
+        moment = datetime(2026, 3, 17, 12, 0)
+        freeze(moment)
+        self.assertIs(get_now(), moment)
+        self.assertIs(get_now(), moment)
+        thaw()
+        self.assertAlmostEqual(get_now().timestamp(), datetime.now().timestamp(), delta=1)
+
+    def test_frozen_time_is_per_thread(self):
+        self._set_demo_mode()
+        from utilities.datenow import freeze, get_now, thaw
+        moment = datetime(2026, 3, 17, 12, 0)
+        seen = []
+        freeze(moment)
+        try:
+            other = threading.Thread(target=lambda: seen.append(get_now()))
+            other.start()
+            other.join()
+        finally:
+            thaw()
+        self.assertIsNot(seen[0], moment)
+        self.assertAlmostEqual(seen[0].timestamp(), datetime.now().timestamp(), delta=1)
+
+    def test_freeze_applies_debug_date(self):
+        self._set_config(DEBUG_DATE="10-31")
+        from utilities.datenow import freeze, get_now, thaw
+        freeze()
+        self.assertEqual(get_now().strftime("%m-%d"), "10-31")
+        thaw()
+
+    def test_debug_date_is_read_once(self):
+        self._set_config(DEBUG_DATE="12-25")
+        from utilities.datenow import get_now
+        sys.modules['config'].DEBUG_DATE = "07-04"
+        self.assertEqual(get_now().strftime("%m-%d"), "12-25")
+
+
 if __name__ == '__main__':
     unittest.main()
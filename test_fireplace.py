@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""tests for the vectorised fireplace simulation."""
+import random
+import unittest
+
+import numpy as np
+
+from scenes.fireplace import FIRE_HEIGHT, FIRE_MIN_INTENSITY, FIRE_WIDTH, FireplaceScene
+
+
+def run_fire(seed, steps):
+    random.seed(seed)
+    scene = FireplaceScene()
+    scene._init_fire()
+    for _ in range(steps):
+        scene._update_fire_sim()
+    return scene
+
+
+class TestFireSimulation(unittest.TestCase):
+
+    def test_same_seed_same_fire(self):
+        a = run_fire(7, 20)._fire_grid
+        b = run_fire(7, 20)._fire_grid
+        self.assertTrue(np.array_equal(a, b))
+        self.assertFalse(np.array_equal(a, run_fire(8, 20)._fire_grid))
+
+    def test_heat_rises_from_the_bottom(self):
+        grid = run_fire(1, 50)._fire_grid
+        self.assertEqual(grid.shape, (FIRE_HEIGHT, FIRE_WIDTH))
+        self.assertTrue(((grid >= 0) & (grid <= 255)).all())
+        rows = grid.mean(axis=1)
+        self.assertGreater(rows[-1], 200)
+        self.assertGreater(rows[-5], rows[-15])
+
+    def test_palette_matches_colour_ramp(self):
+        scene = run_fire(1, 0)
+        for intensity in (0, FIRE_MIN_INTENSITY, 11, 128, 255):
+            expected = (0, 0, 0)
+            if intensity > FIRE_MIN_INTENSITY:
+                expected = scene._get_fire_color(intensity)
+            self.assertEqual(tuple(scene._fire_palette[intensity]), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""tests for the compact flight record."""
+import unittest
+
+from utilities.flightinfo import FlightInfo
+from utilities.flightset import diff_flights
+
+
+class TestFlightInfo(unittest.TestCase):
+
+    def test_callsign_runs(self):
+        flight = FlightInfo(callsign="BAW12X")
+        self.assertEqual(
+            flight.callsign_runs, (("BAW", False), ("12", True), ("X", False))
+        )
+        self.assertEqual(FlightInfo(callsign="N/A").callsign_runs, ())
+        self.assertEqual(FlightInfo().callsign_runs, ())
+
+    def test_mapping_access(self):
+        flight = FlightInfo(id="abc", plane="A320", altitude=5000)
+        self.assertEqual(flight["plane"], "A320")
+        self.assertEqual(flight.get("altitude"), 5000)
+        self.assertIsNone(flight.get("latitude"))
+        self.assertEqual(flight.get("callsign_runs", "missing"), "missing")
+        with self.assertRaises(KeyError):
+            flight["plane_width"]
+        with self.assertRaises(TypeError):
+            FlightInfo(colour="red")
+
+    def test_diffs_like_a_dict(self):
+        old = [FlightInfo(id="a", origin="LHR"), FlightInfo(id="b")]
+        new = [FlightInfo(id="a", origin="LGW"), FlightInfo(id="b")]
+        self.assertEqual(diff_flights(old, new).updated, {"a": {"origin"}})
+        self.assertFalse(diff_flights(old, list(old)))
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            FlightInfo().colour = "red"
+
+
+if __name__ == "__main__":
+    unittest.main()
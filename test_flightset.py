@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""tests for diffing flight lists by flight id."""
+import unittest
+
+from utilities.flightset import diff_flights, flight_id
+
+
+def flight(key, **fields):
+    record = {
+        "id": key,
+        "plane": "A320",
+        "origin": "LHR",
+        "destination": "JFK",
+        "altitude": 5000,
+        "callsign": key.upper(),
+    }
+    record.update(fields)
+    return record
+
+
+class TestDiffFlights(unittest.TestCase):
+
+    def test_identical_lists_have_no_changes(self):
+        flights = [flight("a"), flight("b")]
+        self.assertFalse(diff_flights(flights, [dict(f) for f in flights]))
+
+    def test_added_removed_and_updated(self):
+        old = [flight("a"), flight("b")]
+        new = [flight("b", altitude=5500), flight("c")]
+        diff = diff_flights(old, new)
+        self.assertEqual(diff.added, ["c"])
+        self.assertEqual(diff.removed, ["a"])
+        self.assertEqual(diff.updated, {"b": {"altitude"}})
+        self.assertFalse(diff.reordered)
+
+    def test_reordering_alone_is_a_change(self):
+        old = [flight("a"), flight("b")]
+        diff = diff_flights(old, list(reversed(old)))
+        self.assertTrue(diff)
+        self.assertTrue(diff.reordered)
+        self.assertEqual(diff.updated, {})
+
+    def test_records_without_id_fall_back_to_callsign(self):
+        self.assertEqual(flight_id({"callsign": "BAW1"}), "BAW1")
+        self.assertEqual(flight_id(flight("x")), "x")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""tests for the batched flight geometry."""
+import random
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from utilities import geo
+from utilities.overhead import bearing_from_home, distance_from_flight_to_home
+
+LOCATION = [40.68, -73.97, geo.EARTH_RADIUS_KM]
+HOME = geo.HomeGeometry(LOCATION)
+
+
+def random_flights(count, seed=3):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            callsign=f"F{i}",
+            latitude=LOCATION[0] + rng.uniform(-2, 2),
+            longitude=LOCATION[1] + rng.uniform(-2, 2),
+            altitude=rng.uniform(0, 40000),
+        )
+        for i in range(count)
+    ]
+
+
+class TestGeo(unittest.TestCase):
+
+    def test_matches_per_flight_helpers(self):
+        flights = random_flights(50)
+        lat, lon, alt = geo.flight_arrays(flights)
+        np.testing.assert_allclose(
+            HOME.bearings(lat, lon),
+            [bearing_from_home(f, LOCATION) for f in flights],
+        )
+        np.testing.assert_allclose(
+            HOME.distances(lat, lon, alt),
+            [distance_from_flight_to_home(f, LOCATION) for f in flights],
+        )
+
+    def test_nearest_flights_matches_sorted_filter(self):
+        flights = random_flights(300)
+        expected = sorted(
+            (f for f in flights if 1000 < f.altitude < 10000),
+            key=lambda f: distance_from_flight_to_home(f, HOME),
+        )[:5]
+        nearest = geo.nearest_flights(flights, HOME, 1000, 10000, limit=5)
+        self.assertEqual([f for f, _ in nearest], expected)
+        self.assertAlmostEqual(nearest[0][1], bearing_from_home(expected[0], HOME))
+
+    def test_window_view_and_missing_positions(self):
+        flights = random_flights(100)
+        flights[0].latitude = None
+        home = geo.HomeGeometry(LOCATION, window_bearing=90, window_fov=60)
+        nearest = geo.nearest_flights(flights, home, 0, 50000)
+        self.assertNotIn(flights[0], [f for f, _ in nearest])
+        for _, bearing in nearest:
+            self.assertLessEqual(abs(bearing - 90), 30)
+
+    def test_scalar_and_array_paths_agree(self):
+        home = geo.HomeGeometry(LOCATION, window_bearing=350, window_fov=40)
+        flights = random_flights(50)
+        lat, lon, alt = geo.flight_arrays(flights)
+        bearings = home.bearings(lat, lon)
+        np.testing.assert_allclose(bearings, [home.bearing(f.latitude, f.longitude) for f in flights])
+        np.testing.assert_allclose(
+            home.distances(lat, lon, alt),
+            [home.distance(f.latitude, f.longitude, f.altitude) for f in flights],
+        )
+        self.assertEqual(list(home.in_view(bearings)), [home.in_view(b) for b in bearings])
+        self.assertTrue(home.in_view(5) and home.in_view(335) and not home.in_view(20))
+
+    def test_no_flights(self):
+        self.assertEqual(geo.nearest_flights([], HOME, 0, 50000), [])
+
+
+class TestLargeZones(unittest.TestCase):
+
+    ZONE = {"tl_y": 42.68, "tl_x": -76.47, "br_y": 38.68, "br_x": -71.47}
+
+    def _flights(self):
+        rng = random.Random(11)
+        return [
+            SimpleNamespace(
+                callsign=f"F{i}",
+                latitude=rng.uniform(self.ZONE["br_y"], self.ZONE["tl_y"]),
+                longitude=rng.uniform(self.ZONE["tl_x"], self.ZONE["br_x"]),
+                altitude=rng.uniform(2000, 9000),
+            )
+            for i in range(2000)
+        ]
+
+    def test_query_zone_covers_the_visible_sector(self):
+        home = geo.HomeGeometry(LOCATION, window_bearing=250, window_fov=120)
+        zone = home.query_zone(self.ZONE, max_distance=40)
+        self.assertLess(zone["tl_y"] - zone["br_y"], 1)
+        self.assertLess(zone["br_x"] - zone["tl_x"], 1)
+        for bearing in range(190, 311, 2):
+            lat, lon = home.destination(bearing, 39.9)
+            self.assertTrue(zone["br_y"] <= lat <= zone["tl_y"])
+            self.assertTrue(zone["tl_x"] <= lon <= zone["br_x"])
+
+    def test_query_zone_without_limits_is_unchanged(self):
+        self.assertIs(HOME.query_zone(self.ZONE), self.ZONE)
+
+    def test_grid_only_culls_invisible_flights(self):
+        home = geo.HomeGeometry(LOCATION, window_bearing=250, window_fov=120)
+        grid = geo.SkyGrid(home, self.ZONE, max_distance=80)
+        flights = self._flights()
+
+        exact = geo.nearest_flights(flights, home, 1000, 10000, max_distance=80)
+        culled = geo.nearest_flights(flights, home, 1000, 10000, grid=grid, max_distance=80)
+        self.assertTrue(exact)
+        self.assertEqual(culled, exact)
+
+        lat, lon, _ = geo.flight_arrays(flights)
+        self.assertLess(grid.visible(lat, lon).sum(), len(flights) / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
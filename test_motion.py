@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""tests for dead reckoning between polls."""
+import unittest
+
+from utilities import motion
+from utilities.geo import HomeGeometry
+from utilities.motion import MotionModel
+
+HOME = HomeGeometry([51.47, -0.45])
+
+
+def report(**fields):
+    record = {
+        "id": "abc",
+        "callsign": "BAW1",
+        "latitude": 51.47,
+        "longitude": -0.30,
+        "altitude": 5000,
+        "heading": 90,
+        "ground_speed": 300,
+        "vertical_speed": 1200,
+        "timestamp": 1000.0,
+    }
+    record.update(fields)
+    return record
+
+
+class TestMotionModel(unittest.TestCase):
+
+    def test_position_moves_along_heading(self):
+        model = MotionModel(HOME)
+        flight = report()
+        model.update([flight], now=1000.0)
+        start = model.estimate(flight, now=1000.0)
+        moved = model.estimate(flight, now=1060.0)
+
+        # 300 knots for a minute is about 9.3 km due east
+        self.assertAlmostEqual(moved.latitude, start.latitude, places=2)
+        self.assertGreater(moved.longitude, start.longitude)
+        self.assertAlmostEqual(moved.distance - start.distance, 9.26, places=1)
+        self.assertAlmostEqual(moved.altitude, 6200)
+        self.assertAlmostEqual(moved.bearing, 90, delta=1)
+
+    def test_extrapolation_is_capped(self):
+        model = MotionModel(HOME)
+        flight = report()
+        model.update([flight], now=1000.0)
+        capped = model.estimate(flight, now=1000.0 + motion.MAX_EXTRAPOLATION)
+        self.assertEqual(model.estimate(flight, now=5000.0), capped)
+
+    def test_flights_without_position_are_not_tracked(self):
+        model = MotionModel(HOME)
+        flight = report(latitude=None)
+        model.update([flight], now=1000.0)
+        self.assertIsNone(model.estimate(flight))
+
+    def test_reports_replace_old_tracks(self):
+        model = MotionModel(HOME)
+        model.update([report()], now=1000.0)
+        model.update([report(id="xyz")], now=1010.0)
+        self.assertIsNone(model.estimate(report()))
+        self.assertIsNotNone(model.estimate(report(id="xyz")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""tests for the rate-limited flight detail lookups."""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from requests.exceptions import HTTPError
+
+from utilities import overhead as overhead_module
+from utilities import ratelimit
+from utilities.detailcache import DetailCache
+from utilities.overhead import Overhead
+from utilities.ratelimit import TokenBucket
+
+
+def make_flight(callsign, latitude, altitude=5000):
+    return SimpleNamespace(
+        callsign=callsign,
+        latitude=latitude,
+        longitude=-0.118092,
+        altitude=altitude,
+        vertical_speed=0,
+        origin_airport_iata="LHR",
+        destination_airport_iata="JFK",
+    )
+
+
+class FakeAPI:
+    """stand-in for FlightRadar24API."""
+
+    def __init__(self, flights, broken=(), hold=None, errors=None):
+        self.flights = flights
+        self.broken = set(broken)
+        self.errors = errors or {}
+        self.hold = hold or {}
+        self.lookups = []
+        self.polls = 0
+
+    def get_bounds(self, zone):
+        return "bounds"
+
+    def get_flights(self, bounds=None):
+        self.polls += 1
+        if "poll" in self.hold:
+            self.hold["poll"].wait(5)
+        return self.flights
+
+    def get_flight_details(self, flight):
+        self.lookups.append(flight.callsign)
+        if flight.callsign in self.hold:
+            self.hold[flight.callsign].wait(5)
+        if flight.callsign in self.broken:
+            raise KeyError("aircraft")
+        if flight.callsign in self.errors:
+            raise self.errors[flight.callsign]
+        return {"aircraft": {"model": {"text": "Boeing " + flight.callsign}}}
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_requests_are_spaced_by_rate(self):
+        now = [10.0]
+
+        def fake_sleep(seconds):
+            now[0] += seconds
+
+        with mock.patch.object(ratelimit, "monotonic", lambda: now[0]), \
+                mock.patch.object(ratelimit, "sleep", fake_sleep):
+            bucket = TokenBucket(2)
+            for _ in range(3):
+                bucket.acquire()
+        # first request is free, then one every half second
+        self.assertAlmostEqual(now[0], 11.0)
+
+
+class TestDetailCache(unittest.TestCase):
+
+    def test_entries_expire(self):
+        cache = DetailCache(":memory:", ttl=60)
+        cache.put("id:1", "A320")
+        self.assertEqual(cache.get("id:1"), "A320")
+        with mock.patch("utilities.detailcache.time", return_value=1e12):
+            self.assertIsNone(cache.get("id:1"))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = DetailCache(":memory:", size=2)
+        now = time.time()
+        with mock.patch("utilities.detailcache.time", side_effect=[now, now + 1, now + 2, now + 3]):
+            cache.put("id:1", "A320")
+            cache.put("id:2", "B738")
+            cache.get("id:1")
+            cache.put("id:3", "E190")
+        self.assertEqual(cache.get("id:1"), "A320")
+        self.assertIsNone(cache.get("id:2"))
+        self.assertEqual(len(cache), 2)
+
+    def test_hits_do_not_write(self):
+        cache = DetailCache(":memory:")
+        cache.put("id:1", "A320")
+        self.assertEqual(cache.get("id:1"), "A320")
+        self.assertFalse(cache._db.in_transaction)
+
+    def test_survives_reopening(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "details.sqlite")
+            DetailCache(path).put("id:1", "A359")
+            self.assertEqual(DetailCache(path).get("id:1"), "A359")
+
+
+class TestOverhead(unittest.TestCase):
+
+    def _overhead(self, api):
+        overhead = Overhead(api=api, details_cache=DetailCache(":memory:"))
+        overhead._rate_limit = TokenBucket(1000, burst=10)
+        return overhead
+
+    def test_results_are_closest_first(self):
+        api = FakeAPI([
+            make_flight("FAR", 51.9),
+            make_flight("NEAR", 51.51),
+            make_flight("MID", 51.7),
+            make_flight("HIGH", 51.6, altitude=40000),
+        ])
+        overhead = self._overhead(api)
+        overhead._grab_data()
+        self.assertFalse(overhead.processing)
+        self.assertEqual([f["callsign"] for f in overhead.data], ["NEAR", "MID", "FAR"])
+        self.assertEqual(overhead.data[0]["plane"], "Boeing NEAR")
+
+    def test_subscribers_hear_each_publish(self):
+        api = FakeAPI([make_flight("NEAR", 51.51), make_flight("FAR", 51.9)])
+        overhead = self._overhead(api)
+        published = []
+        overhead.subscribe(lambda: published.append(overhead.new_data))
+        overhead._grab_data()
+        # once per flight as it arrives, then once when the poll is done
+        self.assertEqual(published, [True, True, True])
+
+    def test_failed_lookups_are_retried_then_dropped(self):
+        api = FakeAPI([make_flight("OK", 51.6), make_flight("BAD", 51.51)], broken=["BAD"])
+        overhead = self._overhead(api)
+        overhead._grab_data()
+        self.assertEqual([f["callsign"] for f in overhead.data], ["OK"])
+        self.assertEqual(api.lookups.count("BAD"), 3)
+
+    def test_missing_fields_are_blank_not_retried(self):
+        flight = make_flight("OK", 51.6)
+        flight.origin_airport_iata = None
+        api = FakeAPI([flight])
+        overhead = self._overhead(api)
+        overhead._grab_data()
+        self.assertEqual(overhead.data[0]["origin"], "")
+        self.assertEqual(api.lookups, ["OK"])
+
+    def test_other_lookup_errors_drop_only_that_flight(self):
+        api = FakeAPI(
+            [make_flight("A", 51.51), make_flight("B", 51.6), make_flight("C", 51.7)],
+            errors={"B": HTTPError("500 Server Error")},
+        )
+        overhead = self._overhead(api)
+        with mock.patch("sys.stderr"):
+            found = overhead._grab_data()
+        self.assertEqual(found, 2)
+        self.assertTrue(overhead.new_data)
+        self.assertEqual([f["callsign"] for f in overhead.data], ["A", "C"])
+
+    def test_repolls_are_served_from_the_cache(self):
+        api = FakeAPI([make_flight("NEAR", 51.51), make_flight("FAR", 51.9)])
+        overhead = self._overhead(api)
+        overhead._grab_data()
+        overhead._grab_data()
+        self.assertEqual(sorted(api.lookups), ["FAR", "NEAR"])
+        self.assertEqual(overhead.data[1]["plane"], "Boeing FAR")
+
+    def test_partial_results_are_published(self):
+        release = threading.Event()
+        api = FakeAPI(
+            [make_flight("SLOW", 51.51), make_flight("FAST", 51.6)],
+            hold={"SLOW": release},
+        )
+        overhead = self._overhead(api)
+        grab = threading.Thread(target=overhead._grab_data)
+        grab.start()
+        try:
+            for _ in range(500):
+                if overhead.new_data:
+                    break
+                threading.Event().wait(0.01)
+            self.assertTrue(overhead.processing)
+            self.assertEqual([f["callsign"] for f in overhead.data], ["FAST"])
+        finally:
+            release.set()
+            grab.join(5)
+        self.assertEqual([f["callsign"] for f in overhead.data], ["SLOW", "FAST"])
+
+
+class TestPoller(unittest.TestCase):
+
+    def _overhead(self, api):
+        overhead = Overhead(api=api, details_cache=DetailCache(":memory:"))
+        overhead._rate_limit = TokenBucket(1000, burst=10)
+        self.addCleanup(overhead.stop)
+        return overhead
+
+    def _wait_for(self, condition):
+        for _ in range(500):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail("timed out")
+
+    def test_refresh_requests_coalesce(self):
+        release = threading.Event()
+        api = FakeAPI([make_flight("NEAR", 51.51)], hold={"poll": release})
+        overhead = self._overhead(api)
+        overhead.grab_data()
+        self._wait_for(lambda: api.polls == 1)
+        for _ in range(5):
+            overhead.grab_data()
+        release.set()
+        # one poll in progress plus one for all the queued requests
+        self._wait_for(lambda: api.polls == 2 and not overhead.processing)
+        time.sleep(0.05)
+        self.assertEqual(api.polls, 2)
+
+    def test_stop_ends_the_poller(self):
+        overhead = self._overhead(FakeAPI([]))
+        overhead.grab_data()
+        self._wait_for(lambda: overhead._next_poll > 0)
+        overhead.stop()
+        overhead._poller.join(1)
+        self.assertFalse(overhead._poller.is_alive())
+
+    def test_interval_adapts_to_results(self):
+        overhead = self._overhead(FakeAPI([]))
+        with mock.patch.object(overhead_module, "monotonic", return_value=0):
+            intervals = []
+            for found in [3, 0, 0, 0, None, None, None, None, None, 2]:
+                overhead._schedule_next(found)
+                intervals.append((overhead._next_poll, overhead._not_before))
+        self.assertEqual(
+            intervals,
+            [
+                (30, 0),
+                (60, 60), (120, 120), (180, 180),
+                (360, 360), (600, 600), (600, 600), (600, 600), (600, 600),
+                (30, 0),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""tests for per-keyframe frame profiling."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from utilities import animator, profiler
+from utilities.animator import Animator
+
+
+class Clock(object):
+    """perf_counter/thread_time that only move when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_animator(clock):
+    class Timed(Animator):
+        def __init__(self, clock):
+            self.clock = clock
+            super().__init__()
+            self.delay = 0.1
+
+        @Animator.KeyFrame.add(0)
+        def reset(self):
+            self.clock.now += 0.001
+
+        @Animator.KeyFrame.add(1)
+        def quick(self, count):
+            self.clock.now += 0.002
+
+        @Animator.KeyFrame.add(2)
+        def slow(self, count):
+            self.clock.now += 0.15
+
+    with mock.patch.object(animator, "FRAME_PROFILE", True), \
+            mock.patch.object(profiler.FrameProfiler, "install_signal"):
+        return Timed(clock)
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        patches = [
+            mock.patch.object(profiler, "perf_counter", self.clock),
+            mock.patch.object(profiler, "thread_time", self.clock),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_off_by_default(self):
+        self.assertIsNone(Animator().profiler)
+
+    def test_keyframes_and_frames_are_timed(self):
+        anim = make_animator(self.clock)
+        for frame in range(5):
+            anim.frame = frame
+            anim._run_frame()
+
+        report = anim.profiler.report()
+        self.assertEqual(report["budget_ms"], 100)
+        self.assertEqual(list(report["keyframes"]), ["slow", "quick", "reset"])
+
+        quick = report["keyframes"]["quick"]
+        self.assertEqual(quick["calls"], 4)
+        self.assertEqual(quick["overruns"], 0)
+        self.assertAlmostEqual(quick["wall_ms"]["p95"], 2)
+
+        slow = report["keyframes"]["slow"]
+        self.assertEqual((slow["calls"], slow["overruns"]), (2, 2))
+        self.assertEqual(report["frame"]["calls"], 5)
+        self.assertEqual(report["frame"]["overruns"], 2)
+        self.assertIn("slow", anim.profiler.format())
+
+    def test_json_is_rewritten_every_interval(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "profile.json")
+
+        frames = profiler.FrameProfiler(0.1, path, interval=10)
+        frames.start_frame()
+        frames.end_frame()
+        self.assertFalse(os.path.exists(path))
+
+        self.clock.now += 10
+        frames.start_frame()
+        frames.end_frame()
+        with open(path) as f:
+            self.assertEqual(json.load(f)["frame"]["calls"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
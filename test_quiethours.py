@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""tests for the compiled quiet hours schedule."""
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from utilities import quiethours
+from utilities.quiethours import QuietSchedule, _compile_day
+
+WEEKDAY = {
+    "off": {"start": "23:00", "end": "05:00"},
+    "dim": {"start": "21:00", "end": "07:00", "brightness": 20},
+}
+WEEKEND = {"dim": {"start": "23:30", "end": "09:00"}}
+
+
+class Clock(object):
+    """settable get_now() and monotonic() pair that counts lookups."""
+
+    def __init__(self, now):
+        self.now = now
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.now
+
+    def monotonic(self):
+        return self.now.timestamp()
+
+
+class FakeTimer(object):
+    """threading.Timer stand-in that only fires when told to."""
+
+    def __init__(self, interval, function):
+        self.interval = interval
+        self.function = function
+        self.cancelled = False
+
+    def start(self):
+        pass
+
+    def cancel(self):
+        self.cancelled = True
+
+    def fire(self):
+        self.function()
+
+
+class TestQuietSchedule(unittest.TestCase):
+
+    def setUp(self):
+        # 2026-10-16 is a Friday
+        self.clock = Clock(datetime(2026, 10, 16, 20, 0))
+        self.schedule = QuietSchedule(
+            _compile_day(WEEKDAY), _compile_day(WEEKEND), self.clock
+        )
+        patcher = mock.patch.object(quiethours, "monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.timers = []
+
+        def make_timer(interval, function):
+            self.timers.append(FakeTimer(interval, function))
+            return self.timers[-1]
+
+        patcher = mock.patch.object(quiethours, "Timer", make_timer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_modes(self):
+        at = self.schedule.status_at
+        self.assertEqual(at(datetime(2026, 10, 16, 20, 0))["mode"], "normal")
+        self.assertEqual(at(datetime(2026, 10, 16, 21, 0)), {"mode": "dim", "brightness": 20})
+        self.assertEqual(at(datetime(2026, 10, 16, 23, 0))["mode"], "off")
+        self.assertEqual(at(datetime(2026, 10, 15, 5, 0))["mode"], "off")
+        self.assertEqual(at(datetime(2026, 10, 15, 5, 0, 1))["mode"], "dim")
+        # saturday uses the weekend rules
+        self.assertEqual(at(datetime(2026, 10, 17, 0, 30)), {"mode": "dim", "brightness": 30})
+        self.assertEqual(at(datetime(2026, 10, 17, 23, 0))["mode"], "normal")
+
+    def test_answer_is_reused_until_the_next_transition(self):
+        self.assertEqual(self.schedule.mode(), "normal")
+        self.assertEqual(self.schedule.next_transition(), datetime(2026, 10, 16, 21, 0))
+        calls = self.clock.calls
+
+        self.clock.now = datetime(2026, 10, 16, 20, 0, 30)
+        for _ in range(100):
+            self.schedule.mode()
+        self.assertEqual(self.clock.calls, calls)
+
+        self.clock.now = datetime(2026, 10, 16, 21, 0)
+        self.assertEqual(self.schedule.mode(), "dim")
+        self.assertEqual(self.schedule.next_transition(), datetime(2026, 10, 16, 23, 0))
+
+    def test_midnight_switches_day_type(self):
+        self.clock.now = datetime(2026, 10, 16, 23, 30)
+        self.assertEqual(self.schedule.mode(), "off")
+        self.assertEqual(self.schedule.next_transition(), datetime(2026, 10, 17, 0, 0))
+
+    def test_subscribers_hear_changes(self):
+        heard = []
+        self.schedule.subscribe(heard.append)
+        self.schedule.mode()
+        self.clock.now = datetime(2026, 10, 16, 20, 30)
+        self.schedule.mode()
+        self.assertEqual(heard, [])
+
+        self.clock.now = datetime(2026, 10, 16, 21, 0)
+        self.schedule.mode()
+        self.assertEqual(heard, [{"mode": "dim", "brightness": 20}])
+
+    def test_timer_tells_subscribers_at_the_transition(self):
+        heard = []
+        self.schedule.subscribe(heard.append)
+        self.assertEqual(self.timers[-1].interval, QuietSchedule.MAX_CACHE_SECONDS)
+
+        self.clock.now = datetime(2026, 10, 16, 20, 59, 30)
+        self.timers[-1].fire()
+        self.assertEqual(self.timers[-1].interval, 30)
+        self.assertEqual(heard, [])
+
+        # nothing asks for the status; the timer finds the change
+        self.clock.now = datetime(2026, 10, 16, 21, 0)
+        self.timers[-1].fire()
+        self.assertEqual(heard, [{"mode": "dim", "brightness": 20}])
+        self.assertTrue(self.timers[-2].cancelled)
+
+    def test_no_timer_without_subscribers(self):
+        self.schedule.mode()
+        self.assertEqual(self.timers, [])
+
+    def test_no_rules(self):
+        schedule = QuietSchedule(clock=self.clock)
+        self.assertEqual(schedule.mode(), "normal")
+        self.assertIsNone(schedule.next_transition())
+        self.assertEqual(_compile_day({"dim": {"start": "late", "end": "07:00"}}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
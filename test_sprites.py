@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""tests for the prerendered sprite cache."""
+import unittest
+
+from utilities import sprites
+from utilities.canvas import TrackedCanvas
+from test_canvas import RecordingCanvas
+
+
+class TestSprites(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = RecordingCanvas()
+        self.tracked = TrackedCanvas(self.canvas, width=8, height=4)
+
+    def _draw(self, sprite, x, y, rgb=None):
+        self.tracked.begin("sprite")
+        sprite.draw(self.tracked, x, y, rgb)
+        self.tracked.end()
+        self.tracked.present()
+
+    def test_render_keeps_offsets_and_alpha(self):
+        def draw(set_pixel):
+            set_pixel(-1, -1, (1, 2, 3))
+            set_pixel(1, 0, (4, 5, 6))
+
+        sprite = sprites.render(draw)
+        self.assertEqual((sprite.x, sprite.y, sprite.width, sprite.height), (-1, -1, 3, 2))
+        self._draw(sprite, 2, 2)
+        self.assertEqual(self.canvas.pixels, {(1, 1): (1, 2, 3), (3, 2): (4, 5, 6)})
+
+    def test_draw_is_clipped_to_the_screen(self):
+        sprite = sprites.Sprite.from_mask([(0, 0), (1, 0), (2, 0)], (9, 9, 9))
+        self._draw(sprite, 6, 3)
+        self._draw(sprite, -2, 0)
+        self.assertEqual(set(self.canvas.pixels), {(6, 3), (7, 3), (0, 0)})
+        self.assertEqual(self.canvas.pixels[(6, 3)], (0, 0, 0))
+
+    def test_scaled_colours(self):
+        sprite = sprites.Sprite.from_mask([(0, 0)], (255, 20, 60))
+        self._draw(sprite, 0, 0, sprite.scaled(0.5))
+        self.assertEqual(self.canvas.pixels[(0, 0)], (127, 10, 30))
+
+    def test_builder_runs_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return sprites.Sprite.from_mask([(0, 0)], (1, 1, 1))
+
+        sprites.register("test.dot", build)
+        self.assertIs(sprites.get("test.dot"), sprites.get("test.dot"))
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""tests for text metrics and prerendered text strips."""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from utilities import text
+from utilities.canvas import TrackedCanvas
+from test_canvas import RecordingCanvas
+
+FONTS = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fonts")
+
+
+class Colour(object):
+    def __init__(self, red, green, blue):
+        self.red, self.green, self.blue = red, green, blue
+
+
+class TestBitmapFont(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.atlas = os.path.join(self.dir, "4x6.atlas")
+        self.font = text.BitmapFont(os.path.join(FONTS, "4x6.bdf"), self.atlas)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_metrics(self):
+        self.assertEqual(self.font.height, 6)
+        self.assertEqual(self.font.baseline, 5)
+        self.assertEqual(self.font.character_width(ord("A")), 4)
+        self.assertEqual(self.font.character_width(0x10FFFF), -1)
+        self.assertEqual(text.width(self.font, "I love you"), 40)
+
+    def test_glyph_bitmap(self):
+        mask, left, top = self.font.mask("A")
+        self.assertEqual((left, top), (0, -5))
+        rows = ["".join("#" if v else "." for v in row) for row in mask]
+        self.assertEqual(rows, [".#..", "#.#.", "###.", "#.#.", "#.#.", "...."])
+
+    def test_strip_is_cached_and_coloured(self):
+        colour = Colour(255, 150, 200)
+        sprite = text.strip(self.font, "XOXO", colour)
+        self.assertIs(text.strip(self.font, "XOXO", colour), sprite)
+        self.assertEqual(sprite.width, 16)
+        self.assertEqual(sprite.y, -5)
+        self.assertEqual(tuple(sprite.rgb[sprite.alpha][0]), (255, 150, 200))
+        self.assertFalse(sprite.rgb[~sprite.alpha].any())
+
+    def test_empty_text(self):
+        self.assertEqual(text.width(self.font, ""), 0)
+        blank = text.strip(self.font, "   ", Colour(1, 2, 3))
+        self.assertEqual(blank.width, 12)
+        self.assertFalse(blank.alpha.any())
+
+
+class TestAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.bdf = os.path.join(self.dir, "4x6.bdf")
+        shutil.copy(os.path.join(FONTS, "4x6.bdf"), self.bdf)
+        self.atlas = self.bdf + ".atlas"
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_first_load_compiles_the_atlas(self):
+        self.assertIsNone(text.open_atlas(self.bdf, self.atlas))
+        parsed = text.BitmapFont(self.bdf)
+        self.assertEqual(parsed.width("Boeing"), 24)
+        self.assertTrue(os.path.exists(self.atlas))
+
+        mapped = text.BitmapFont(self.bdf)
+        self.assertIsNotNone(text.open_atlas(self.bdf, self.atlas))
+        for string in ("Boeing 737", "\u00e9\u2603"):
+            self.assertEqual(mapped.width(string), parsed.width(string))
+            for a, b in zip(mapped.mask(string), parsed.mask(string)):
+                self.assertTrue(np.array_equal(a, b))
+
+    def test_changed_font_is_recompiled(self):
+        text.BitmapFont(self.bdf).width("A")
+        with open(self.bdf, "a") as bdf:
+            bdf.write("\n")
+        self.assertIsNone(text.open_atlas(self.bdf, self.atlas))
+        self.assertEqual(text.BitmapFont(self.bdf).character_width(ord("A")), 4)
+        self.assertIsNotNone(text.open_atlas(self.bdf, self.atlas))
+
+    def test_corrupt_atlas_is_ignored(self):
+        with open(self.atlas, "wb") as atlas:
+            atlas.write(b"garbage")
+        self.assertIsNone(text.open_atlas(self.bdf, self.atlas))
+        self.assertEqual(text.BitmapFont(self.bdf).width("XOXO"), 16)
+
+    def test_draw_into_pass(self):
+        font = text.BitmapFont(self.bdf)
+        tracked = TrackedCanvas(RecordingCanvas())
+        tracked.begin("text")
+        self.assertEqual(text.draw(tracked, font, 2, 5, Colour(9, 8, 7), "A"), 4)
+        tracked.end()
+        # top of the A: .#.. one row above the glyph's bottom-left
+        self.assertEqual(tuple(tracked.pixels[0, 3]), (9, 8, 7))
+        self.assertFalse(tracked.pixels[0, 2].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
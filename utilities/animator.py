@@ -1,10 +1,58 @@
+import math
 import random
+import sys
 import time
-from time import sleep
+from threading import Event
+from time import monotonic, sleep
+
+from utilities import datenow
+from utilities.canvas import RawCanvas, TrackedCanvas
+from utilities.profiler import FrameProfiler
+from utilities.quiethours import get_schedule
 
 DELAY_DEFAULT = 0.01
 IDLE_CYCLE_SECONDS = 10  # rotate between special occasion scenes
 
+# frame scheduling modes
+# "deadline": aim every frame at an absolute monotonic deadline, so render
+#             time is absorbed into the frame period instead of added to it
+# "fixed":    sleep a fixed delay after every frame (original behaviour)
+SCHEDULER_DEADLINE = "deadline"
+SCHEDULER_FIXED = "fixed"
+MAX_FRAME_SKIP = 10  # overruns longer than this resync instead of catching up
+LATE_REPORT_SECONDS = 60  # how often late frames are reported on stderr
+MAX_WHEEL_SLOTS = 3600  # longest keyframe cycle precomputed into the dispatch table
+MAX_IDLE_FRAMES = 600  # longest idle sleep, in frames, when nothing at all is due
+
+try:
+    from config import FRAME_SCHEDULER
+except (ModuleNotFoundError, NameError, ImportError):
+    FRAME_SCHEDULER = SCHEDULER_DEADLINE
+
+try:
+    from config import FRAME_PROFILE
+except (ModuleNotFoundError, NameError, ImportError):
+    FRAME_PROFILE = False
+
+try:
+    from config import FRAME_PROFILE_PATH
+except (ModuleNotFoundError, NameError, ImportError):
+    FRAME_PROFILE_PATH = None
+
+try:
+    from config import FRAME_PROFILE_INTERVAL
+except (ModuleNotFoundError, NameError, ImportError):
+    FRAME_PROFILE_INTERVAL = 10  # seconds between FRAME_PROFILE_PATH rewrites
+
+# keyframe phases, run in this order every frame. Within a phase keyframes
+# run by priority (lowest first), then alphabetically by method name.
+PHASE_PRE_DRAW = 0  # data checks and screen clears
+PHASE_DRAW = 1  # flight scenes
+PHASE_IDLE = 2  # idle animations (holidays, ambient), only one draws per frame
+PHASE_OVERLAY = 3  # persistent displays drawn over whatever is idle (clock, date)
+PHASE_PRESENT = 4  # push the finished canvas to the panel
+PHASES = (PHASE_PRE_DRAW, PHASE_DRAW, PHASE_IDLE, PHASE_OVERLAY, PHASE_PRESENT)
+
 # reserved screen regions that persistent scenes use
 # idle animations must clear these areas before drawing
 CLOCK_REGION_Y = (0, 10)  # clock draws at y=0-8, we clear y=0-10 for safety
@@ -12,22 +60,76 @@ DATE_REGION_Y = (25, 31)  # date draws at y=31, font extends up ~6px
 
 
 class Animator(object):
+    # the LED canvas, behind the canvas property
+    _canvas = None
+    _raw = None
+    _raw_draws = 0
+    _presented = None
+
     class KeyFrame(object):
         @staticmethod
-        def add(divisor, offset=0):
+        def add(
+            divisor, offset=0, phase=PHASE_DRAW, priority=0, active=None, occasion=None
+        ):
+            # active: optional check, called with the animator, of whether
+            # the keyframe has anything to do right now (see _keyframe_active)
+            # occasion: optional check, called once a day, of whether today
+            # is the keyframe's day: None if not, else a value for the day
+            # kept in self.occasions (see _refresh_occasions)
             def wrapper(func):
-                func.properties = {"divisor": divisor, "offset": offset, "count": 0}
+                func.properties = {
+                    "divisor": divisor,
+                    "offset": offset,
+                    "phase": phase,
+                    "priority": priority,
+                    "active": active,
+                    "occasion": occasion,
+                    "count": 0,
+                }
                 return func
 
             return wrapper
 
     def __init__(self):
         self.keyframes = []
+        self._reset_keyframes = []
+        self._periodic_keyframes = []
+        self._wheel = None
         self.frame = 0
         self._delay = DELAY_DEFAULT
         self._reset_scene = True
+        self.scheduler = FRAME_SCHEDULER
+
+        # deadline scheduler state
+        self._next_deadline = None
+        self._skipped_frames = 0
+        self.frame_stats = {
+            "frames": 0,
+            "late": 0,
+            "skipped": 0,
+            "resyncs": 0,
+            "slept": 0,
+            "swaps_skipped": 0,
+        }
+        self._late_reported = dict(self.frame_stats)
+        self._late_report_time = monotonic()
+
+        # per-keyframe timings (see utilities/profiler.py), None when off
+        self.profiler = None
+        if FRAME_PROFILE:
+            self.profiler = FrameProfiler(
+                self._delay, FRAME_PROFILE_PATH, FRAME_PROFILE_INTERVAL
+            )
+            self.profiler.install_signal()
+
+        # idle sleeping: wake() cuts a sleep short, and keyframes passed to
+        # it run on the next frame whether they are due or not
+        self._wake_event = Event()
+        self._woken_keyframes = []
+
         # mutual exclusion: only one idle animation draws per frame
         self._idle_drawn_this_frame = False
+        self._idle_claimed_frame = 0  # last frame an idle animation drew
 
         # special occasion cycling (birthdays + holidays rotate)
         self._special_candidates_prev = []
@@ -39,10 +141,75 @@ class Animator(object):
         self._quiet_ambient_winner = None
         self._quiet_ambient_locked = False
 
+        # ownership-tracking layer over the canvas (see utilities/canvas.py)
+        self.tracked = TrackedCanvas(self._canvas)
+        self._tracked_draws = self._raw_draws
+        # rows tracked drawing wrote to since the overlays last ran
+        self._overlay_damage = None
+
+        # today's value of each occasion keyframe that is on today, by name
+        self.occasions = {}
+        self._occasion_day = None
+
         self._register_keyframes()
 
         super().__init__()
 
+    @property
+    def canvas(self):
+        # draws that bypass self.tracked (self.canvas.SetPixel,
+        # graphics.DrawText(self.canvas, ...)) go through this RawCanvas,
+        # which notes that they happened; _canvas is the canvas itself
+        return self._raw
+
+    @canvas.setter
+    def canvas(self, canvas):
+        self._canvas = canvas
+        self._raw = None if canvas is None else RawCanvas(canvas)
+        self._raw_draws += 1
+
+    def _count_raw_draws(self):
+        # bumped once for each stretch of drawing straight onto the canvas
+        if self._raw is not None and self._raw.take_drawn():
+            self._raw_draws += 1
+        return self._raw_draws
+
+    def canvas_changed(self):
+        """Whether the canvas may have changed since the last call.
+
+        True if anything drew on self.canvas or TrackedCanvas wrote to it
+        in between. The present phase calls this to skip pushing a frame
+        that is the same as the one already on the panel.
+        """
+        generation = (self._count_raw_draws(), self.tracked.generation)
+        changed = generation != self._presented
+        self._presented = generation
+        return changed
+
+    def _present_tracked(self):
+        """Send tracked pixels to the canvas (TrackedCanvas.present).
+
+        Runs before the overlay phase, so overlays drawn straight onto the
+        canvas end up on top, and again in the present phase.
+        """
+        draws = self._count_raw_draws()
+        if draws != self._tracked_draws:
+            # drawing straight onto the canvas may have covered pixels
+            # present() takes to be still showing
+            self._tracked_draws = draws
+            self.tracked.distrust()
+        self.tracked.present()
+
+    def overlay_damaged(self, y0, y1):
+        """Whether tracked drawing since the overlays last ran hit rows y0-y1.
+
+        Overlays draw once and leave their text on the canvas, so one
+        whose rows were drawn over (a star erased in the clock, say) has
+        to draw itself again.
+        """
+        damage = self._overlay_damage
+        return damage is not None and damage[1] <= y1 and damage[3] >= y0
+
     def _resolve_special_occasion_cycle(self):
         """Pick which special occasion scene draws this frame.
 
@@ -104,36 +271,34 @@ class Animator(object):
         self._idle_drawn_this_frame = True
         return True
 
+    def _clear_region(self, y_start, y_end, drawn_pixels):
+        # inside a tracked pass this is one staged region fill, and the
+        # pixels only reach the canvas if they aren't already black
+        self.tracked.fill_rect(0, y_start, 63, y_end, 0, 0, 0)
+
+        cleared = [(x, y) for x in range(64) for y in range(y_start, y_end + 1)]
+        if drawn_pixels is not None:
+            drawn_pixels.extend(cleared)
+        return cleared
+
     def clear_clock_region(self, drawn_pixels=None):
         """Clear the clock region (y=0-10) to prevent overlap with idle animations.
 
+        Scenes drawing through self.tracked call this inside their pass and
+        don't need drawn_pixels; the region is owned (and later erased) by
+        the pass like any other pixel.
+
         Args:
             drawn_pixels: optional list to append cleared pixel coords to
 
         Returns:
             list of (x, y) tuples that were cleared
         """
-        cleared = []
-        y_start, y_end = CLOCK_REGION_Y
-        for x in range(64):
-            for y in range(y_start, y_end + 1):
-                self.canvas.SetPixel(x, y, 0, 0, 0)
-                cleared.append((x, y))
-        if drawn_pixels is not None:
-            drawn_pixels.extend(cleared)
-        return cleared
+        return self._clear_region(*CLOCK_REGION_Y, drawn_pixels)
 
     def clear_date_region(self, drawn_pixels=None):
         """Clear the date region (y=25-31) to prevent overlap with idle animations."""
-        cleared = []
-        y_start, y_end = DATE_REGION_Y
-        for x in range(64):
-            for y in range(y_start, y_end + 1):
-                self.canvas.SetPixel(x, y, 0, 0, 0)
-                cleared.append((x, y))
-        if drawn_pixels is not None:
-            drawn_pixels.extend(cleared)
-        return cleared
+        return self._clear_region(*DATE_REGION_Y, drawn_pixels)
 
     def _register_keyframes(self):
         # Some introspection to setup keyframes
@@ -142,41 +307,350 @@ class Animator(object):
             if hasattr(method, "properties"):
                 self.keyframes.append(method)
 
-    def reset_scene(self):
+        # resolve phases into one static pipeline; dir() is alphabetical
+        # and the sort is stable, so names still break ties
+        self.keyframes.sort(
+            key=lambda k: (k.properties["phase"], k.properties["priority"])
+        )
+
+        self._build_schedule()
+
+    def _build_schedule(self):
+        """Precompute which keyframes are due on each frame of the cycle.
+
+        The dispatch table ("wheel") has one slot per frame of the least
+        common multiple of all divisors, each holding the keyframes due on
+        that frame grouped by phase, in pipeline order. Every frame then
+        only touches the keyframes that are actually due.
+        """
+        self._reset_keyframes = [
+            k for k in self.keyframes if not k.properties["divisor"]
+        ]
+        # occasion keyframes are only scheduled on their days
+        self._periodic_keyframes = [
+            k
+            for k in self.keyframes
+            if k.properties["divisor"]
+            and (k.properties["occasion"] is None or k.__name__ in self.occasions)
+        ]
+
+        divisors = [k.properties["divisor"] for k in self._periodic_keyframes]
+        if any(d != int(d) or d < 0 for d in divisors):
+            # fractional divisors can't be laid out on a wheel
+            self._wheel = None
+            return
+
+        length = math.lcm(*(int(d) for d in divisors)) if divisors else 1
+        if length > MAX_WHEEL_SLOTS:
+            self._wheel = None
+            return
+
+        self._wheel = [
+            self._group_by_phase(
+                k
+                for k in self._periodic_keyframes
+                if not (slot - k.properties["offset"]) % int(k.properties["divisor"])
+            )
+            for slot in range(length)
+        ]
+
+    def _refresh_occasions(self, today):
+        """Work out which occasion keyframes are on today.
+
+        Runs on the first frame and again on the first frame of each new
+        day. Keyframes whose occasion isn't on today are left out of the
+        schedule altogether, rather than checking the date every frame.
+        """
+        occasions = {}
         for keyframe in self.keyframes:
-            if keyframe.properties["divisor"] == 0:
+            check = keyframe.properties["occasion"]
+            if check is None:
+                continue
+            value = check(self)
+            if value is not None:
+                occasions[keyframe.__name__] = value
+
+        self._occasion_day = today
+        changed = occasions.keys() != self.occasions.keys()
+        self.occasions = occasions
+        if changed:
+            self._build_schedule()
+
+    @staticmethod
+    def _group_by_phase(keyframes):
+        """Split pipeline-ordered keyframes into (phase, keyframes) batches."""
+        groups = []
+        for keyframe in keyframes:
+            phase = keyframe.properties["phase"]
+            if groups and groups[-1][0] == phase:
+                groups[-1][1].append(keyframe)
+            else:
+                groups.append((phase, [keyframe]))
+        return tuple((phase, tuple(batch)) for phase, batch in groups)
+
+    def _due_keyframes(self, frame, skipped=0, woken=()):
+        """Keyframes due on a frame, as (phase, keyframes) batches."""
+        if self._wheel is not None and not skipped and not woken:
+            return self._wheel[frame % len(self._wheel)]
+
+        # coalesced frame after an overrun or a sleep, keyframes run by
+        # wake(), or no wheel: check each keyframe
+        return self._group_by_phase(
+            k
+            for k in self._periodic_keyframes
+            if k in woken or self._keyframe_due(k, frame, skipped)
+        )
+
+    def _phase_active(self, phase):
+        """Whether a phase runs this frame.
+
+        Checked as each phase starts, so a phase can be skipped based on
+        state changed earlier in the same frame. Scenes override this to
+        skip whole phases, e.g. idle animations while flights are shown.
+        """
+        return True
+
+    def _keyframe_active(self, keyframe):
+        """Whether a periodic keyframe could change anything if it ran now.
+
+        While no keyframe due soon is active the animator sleeps through
+        the frames in between (see _idle_frames). A keyframe's own active
+        check decides; without one, present keyframes never count (they
+        only show what the others drew), idle animations count while one
+        of them is drawing, and everything else always counts.
+        """
+        properties = keyframe.properties
+        if properties["active"] is not None:
+            return properties["active"](self)
+        if properties["phase"] == PHASE_PRESENT:
+            return False
+        if properties["phase"] == PHASE_IDLE:
+            # idle animations claim the phase on every frame they draw
+            return self.frame - self._idle_claimed_frame < properties["divisor"]
+        return True
+
+    def _idle_frames(self):
+        """How many frames after this one can be slept through.
+
+        That is every frame until the next one on which an active keyframe
+        is due, and none past the next change of quiet hours, which changes
+        the brightness and what the scenes draw. Keyframes that were due on
+        the slept frames run, coalesced, on the frame the animator wakes for.
+        """
+        if self._wake_event.is_set() or self._woken_keyframes:
+            return 0
+
+        upcoming = self.frame + 1
+        for _, keyframes in self._due_keyframes(upcoming):
+            if any(self._keyframe_active(k) for k in keyframes):
+                return 0
+
+        soonest = MAX_IDLE_FRAMES
+        for keyframe in self._periodic_keyframes:
+            divisor = keyframe.properties["divisor"]
+            if divisor != int(divisor):
+                # fractional divisors don't land on whole frames
+                return 0
+            wait = (keyframe.properties["offset"] - upcoming) % int(divisor)
+            if wait < soonest and self._keyframe_active(keyframe):
+                soonest = wait
+        if not soonest:
+            return 0
+        return min(soonest, self._frames_before_quiet_transition())
+
+    def _frames_before_quiet_transition(self):
+        transition = get_schedule().next_transition()
+        if transition is None:
+            return MAX_IDLE_FRAMES
+        # the first frame on or after the transition is the one to run
+        until = (transition - datenow.get_now()).total_seconds()
+        late = monotonic() + until - self._next_deadline
+        return max(0, math.ceil(late / self._delay))
+
+    def wake(self, *keyframes):
+        """End an idle sleep now; safe to call from other threads.
+
+        The given keyframes (bound methods) run on the next frame even if
+        they aren't due, e.g. the one that picks up new flight data.
+        """
+        self._woken_keyframes.extend(keyframes)
+        self._wake_event.set()
+
+    def _sleep_until_woken(self, seconds):
+        """Sleep for seconds or until wake(); True if woken."""
+        return self._wake_event.wait(max(0, seconds))
+
+    def reset_scene(self):
+        self._run_reset_keyframes()
+
+    def _run_reset_keyframes(self):
+        profiler = self.profiler
+        for keyframe in self._reset_keyframes:
+            if profiler is None:
                 keyframe()
+            else:
+                profiler.call_reset(keyframe)
 
-    def play(self):
-        while True:
-            # reset idle animation flag each frame
-            self._idle_drawn_this_frame = False
-            self._resolve_special_occasion_cycle()
-            self._resolve_quiet_ambient_cycle()
-
-            for keyframe in self.keyframes:
-                # If divisor == 0 then only run once on first loop
-                if self.frame == 0:
-                    if keyframe.properties["divisor"] == 0:
-                        keyframe()
-
-                # Otherwise perform normal operation
-                if (
-                    self.frame > 0
-                    and keyframe.properties["divisor"]
-                    and not (
-                        (self.frame - keyframe.properties["offset"])
-                        % keyframe.properties["divisor"]
-                    )
-                ):
-                    if keyframe(keyframe.properties["count"]):
+    def _keyframe_due(self, keyframe, frame, skipped=0):
+        """Check if a keyframe ticks on this frame.
+
+        When frames were skipped after an overrun, a keyframe that ticked
+        on any of the skipped frames is still due (once) on this one.
+        """
+        divisor = keyframe.properties["divisor"]
+        offset = keyframe.properties["offset"]
+        if not skipped:
+            return not ((frame - offset) % divisor)
+        return (frame - offset) // divisor != (frame - skipped - 1 - offset) // divisor
+
+    def _run_frame(self):
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start_frame()
+
+        # one time for the whole frame (see utilities/datenow.py)
+        datenow.freeze()
+        try:
+            self._run_keyframes()
+        finally:
+            datenow.thaw()
+
+        if profiler is not None:
+            profiler.end_frame()
+
+        self._reset_scene = False
+        self.frame_stats["frames"] += 1
+
+    def _run_keyframes(self):
+        today = datenow.get_now().date()
+        if today != self._occasion_day:
+            self._refresh_occasions(today)
+
+        # reset idle animation flag each frame
+        self._idle_drawn_this_frame = False
+        self._resolve_special_occasion_cycle()
+        self._resolve_quiet_ambient_cycle()
+
+        skipped = self._skipped_frames
+        self._skipped_frames = 0
+        # swapped rather than cleared, so a wake() from another thread
+        # lands either in this frame or the next
+        self._wake_event.clear()
+        woken, self._woken_keyframes = self._woken_keyframes, []
+
+        profiler = self.profiler
+        if self.frame == 0:
+            # If divisor == 0 then only run once on first loop
+            self._run_reset_keyframes()
+        else:
+            # Otherwise perform normal operation
+            for phase, keyframes in self._due_keyframes(self.frame, skipped, woken):
+                if not self._phase_active(phase):
+                    continue
+                if phase == PHASE_OVERLAY:
+                    self._present_tracked()
+                    self._overlay_damage = self.tracked.take_dirty()
+                for keyframe in keyframes:
+                    count = keyframe.properties["count"]
+                    if profiler is None:
+                        done = keyframe(count)
+                    else:
+                        done = profiler.call(keyframe, count)
+                    if done:
                         keyframe.properties["count"] = 0
                     else:
                         keyframe.properties["count"] += 1
 
-            self._reset_scene = False
+        if self._idle_drawn_this_frame:
+            self._idle_claimed_frame = self.frame
+
+    def _wait_for_next_frame(self):
+        """Sleep until the next frame should start.
+
+        In deadline mode each frame is aimed at an absolute deadline on the
+        monotonic clock. A frame that overruns its slot makes the next one
+        start immediately; whole periods that were missed are skipped (the
+        frame counter jumps ahead and their keyframes are coalesced into the
+        next frame) so frame-counted timings keep pace with the wall clock.
+
+        When no active keyframe is due for a while (say only the clock is
+        on screen), it sleeps until the next frame one is due on, or until
+        wake() is called.
+        """
+        if self.scheduler != SCHEDULER_DEADLINE:
             self.frame += 1
             sleep(self._delay)
+            return
+
+        now = monotonic()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        self._next_deadline += self._delay
+
+        if now < self._next_deadline:
+            idle = self._idle_frames()
+            if idle:
+                self._sleep_idle(idle)
+                return
+            self.frame += 1
+            sleep(self._next_deadline - now)
+            return
+
+        # overran: count how many whole frame periods were missed
+        self.frame_stats["late"] += 1
+        missed = int((now - self._next_deadline) // self._delay) if self._delay else 0
+
+        if missed > MAX_FRAME_SKIP:
+            # far too late (system stall, suspend); don't try to catch up
+            self.frame_stats["resyncs"] += 1
+            self._next_deadline = now
+            missed = 0
+        else:
+            self._next_deadline += missed * self._delay
+
+        self.frame_stats["skipped"] += missed
+        self._skipped_frames = missed
+        self.frame += 1 + missed
+        self._report_late_frames(now)
+
+    def _sleep_idle(self, frames):
+        """Sleep through up to frames frames, then wait for the next deadline."""
+        first = self._next_deadline
+        if self._sleep_until_woken(first + frames * self._delay - monotonic()):
+            self._wake_event.clear()
+            # carry on from the first frame deadline after the wake
+            late = monotonic() - first
+            frames = min(frames, max(0, math.ceil(late / self._delay)))
+
+        self._next_deadline = first + frames * self._delay
+        self.frame_stats["slept"] += frames
+        self._skipped_frames = frames
+        self.frame += 1 + frames
+
+        now = monotonic()
+        if now < self._next_deadline:
+            sleep(self._next_deadline - now)
+
+    def _report_late_frames(self, now):
+        if now - self._late_report_time < LATE_REPORT_SECONDS:
+            return
+        late = self.frame_stats["late"] - self._late_reported["late"]
+        skipped = self.frame_stats["skipped"] - self._late_reported["skipped"]
+        frames = self.frame_stats["frames"] - self._late_reported["frames"]
+        if late:
+            print(
+                f"Animator: {late}/{frames} frames late, {skipped} skipped "
+                f"in the last {int(now - self._late_report_time)}s",
+                file=sys.stderr,
+            )
+        self._late_reported = dict(self.frame_stats)
+        self._late_report_time = now
+
+    def play(self):
+        self._next_deadline = monotonic()
+        while True:
+            self._run_frame()
+            self._wait_for_next_frame()
 
     @property
     def delay(self):
@@ -185,6 +659,8 @@ class Animator(object):
     @delay.setter
     def delay(self, value):
         self._delay = value
+        if getattr(self, "profiler", None) is not None:
+            self.profiler.budget = value
 
 
 if __name__ == "__main__":
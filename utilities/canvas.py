@@ -0,0 +1,296 @@
+"""
+Ownership-tracking framebuffer between scenes and the LED canvas.
+
+Idle animations redraw a moving picture every frame. Instead of each
+scene keeping its own list of (x, y) tuples to black out again on the
+next frame, a scene draws a "pass" through TrackedCanvas:
+
+    self.tracked.begin("fireplace")
+    self.tracked.set_pixel(x, y, r, g, b)
+    ...
+    self.tracked.end()
+
+Passes are composed into a 64x32x3 uint8 NumPy framebuffer (pixels).
+Scenes can also write slices of it directly through paint() and blit().
+Pixels the owner drew last pass but not this one are blacked out, and
+erase(owner) removes everything an owner still has on screen.
+
+Nothing reaches the canvas until present(), which the Animator calls
+before the overlay phase (so overlay text lands on top) and again right
+before SwapOnVSync. Only pixels whose colour actually changed are sent, and
+when they form a rectangle the framebuffer fully covers (plane intro
+wipe, lightning flash, fire) they go over in a single SetImage call.
+
+Drawing straight onto self.canvas (graphics.DrawText etc.) is not
+tracked. Pixels nobody owns are always written, so only a scene's own
+pixels are assumed to be unchanged between its passes, and distrust()
+drops even that after drawing straight onto the canvas. Writes outside
+a pass go to the canvas immediately.
+
+generation counts the writes made to the canvas from here. Scenes draw
+straight onto the canvas through a RawCanvas, which notes whether
+anything did. Between them they tell an unchanged frame apart (see
+Animator.canvas_changed).
+"""
+import numpy as np
+
+from setup import screen
+
+try:
+    from PIL import Image
+except ImportError:
+    # without Pillow every change is sent with SetPixel
+    Image = None
+
+
+class TrackedCanvas(object):
+    def __init__(self, canvas, width=screen.WIDTH, height=screen.HEIGHT):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+
+        # frame being composed by tracked passes
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+
+        # what the canvas shows as far as we know, whether that can be
+        # trusted, and which owner (id, 0 = nobody) each pixel belongs to
+        self._shown = np.zeros((height, width, 3), dtype=np.uint8)
+        self._trusted = np.zeros((height, width), dtype=bool)
+        self._owners = np.zeros((height, width), dtype=np.int16)
+        self._owner_ids = {}
+
+        # pixels written by passes since the last present()
+        self._touched = np.zeros((height, width), dtype=bool)
+
+        # current pass
+        self._owner = 0
+        self._pass = None
+
+        # bounding box (x0, y0, x1, y1) of pixels written since take_dirty()
+        self.dirty = None
+        # bumped on every write to the canvas
+        self.generation = 0
+
+        # how present() has been pushing pixels to the canvas
+        self.stats = {"presents": 0, "bulk": 0, "pixels": 0}
+
+    def begin(self, owner):
+        """Start a drawing pass for owner."""
+        self._owner = self._owner_ids.setdefault(owner, len(self._owner_ids) + 1)
+        self._pass = np.zeros((self.height, self.width), dtype=bool)
+
+    def end(self):
+        """Finish the current pass: take its pixels, erase stale ones."""
+        owner, drawn = self._owner, self._pass
+        self._owner, self._pass = 0, None
+
+        stale = (self._owners == owner) & ~drawn
+        self.pixels[stale] = 0
+        self._owners[stale] = 0
+        self._owners[drawn] = owner
+        self._touched |= drawn | stale
+
+    def erase(self, owner):
+        """Black out everything owner still has on screen."""
+        owner_id = self._owner_ids.get(owner)
+        if owner_id is None:
+            return
+        owned = self._owners == owner_id
+        self.pixels[owned] = 0
+        self._owners[owned] = 0
+        self._touched |= owned
+
+    def owns_pixels(self, owner):
+        owner_id = self._owner_ids.get(owner)
+        return owner_id is not None and bool((self._owners == owner_id).any())
+
+    def set_pixel(self, x, y, r, g, b):
+        x, y = int(x), int(y)
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+
+        if self._pass is not None:
+            self.pixels[y, x] = (r, g, b)
+            self._pass[y, x] = True
+        else:
+            self._write_now(x, y, x, y, (int(r), int(g), int(b)))
+
+    def fill_rect(self, x0, y0, x1, y1, r, g, b):
+        """Fill the inclusive rectangle (x0, y0)-(x1, y1) with one colour."""
+        x0, x1 = max(0, int(x0)), min(self.width - 1, int(x1))
+        y0, y1 = max(0, int(y0)), min(self.height - 1, int(y1))
+        if x0 > x1 or y0 > y1:
+            return
+
+        if self._pass is not None:
+            self.paint(x0, y0, x1, y1)[:] = (r, g, b)
+        else:
+            self._write_now(x0, y0, x1, y1, (int(r), int(g), int(b)))
+
+    def paint(self, x0, y0, x1, y1):
+        """Claim the inclusive rectangle for the current pass.
+
+        Returns the (rows, columns, 3) slice of the framebuffer for the
+        caller to fill with array operations.
+        """
+        self._pass[y0:y1 + 1, x0:x1 + 1] = True
+        return self.pixels[y0:y1 + 1, x0:x1 + 1]
+
+    def blit(self, x, y, rgb, alpha=None):
+        """Copy an (h, w, 3) image into the current pass, clipped to the screen.
+
+        alpha is an optional (h, w) bool mask of the pixels to copy.
+        """
+        h, w = rgb.shape[:2]
+        x, y = int(x), int(y)
+        sx0, sy0 = max(0, -x), max(0, -y)
+        sx1, sy1 = min(w, self.width - x), min(h, self.height - y)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+
+        dest = (slice(y + sy0, y + sy1), slice(x + sx0, x + sx1))
+        src = rgb[sy0:sy1, sx0:sx1]
+        if alpha is None:
+            self.pixels[dest] = src
+            self._pass[dest] = True
+        else:
+            mask = alpha[sy0:sy1, sx0:sx1]
+            self.pixels[dest][mask] = src[mask]
+            self._pass[dest] |= mask
+
+    def present(self):
+        """Send the pixels changed since the last present() to the canvas."""
+        touched = self._touched
+        if not touched.any():
+            return
+        self.stats["presents"] += 1
+
+        unchanged = self._trusted & (self.pixels == self._shown).all(axis=2)
+        changed = touched & ~unchanged
+
+        self._shown[touched] = self.pixels[touched]
+        self._trusted[touched] = self._owners[touched] > 0
+        self._touched = np.zeros((self.height, self.width), dtype=bool)
+
+        if not changed.any():
+            return
+
+        ys, xs = np.nonzero(changed)
+        x0, x1 = int(xs.min()), int(xs.max())
+        y0, y1 = int(ys.min()), int(ys.max())
+        self._mark_dirty(x0, y0, x1, y1)
+
+        if (
+            Image is not None
+            and hasattr(self.canvas, "SetImage")
+            and touched[y0:y1 + 1, x0:x1 + 1].all()
+        ):
+            # every pixel in the box is ours: one bulk transfer
+            region = np.ascontiguousarray(self.pixels[y0:y1 + 1, x0:x1 + 1])
+            self.canvas.SetImage(Image.fromarray(region, "RGB"), x0, y0)
+            self.stats["bulk"] += 1
+        else:
+            for x, y, (r, g, b) in zip(
+                xs.tolist(), ys.tolist(), self.pixels[ys, xs].tolist()
+            ):
+                self.canvas.SetPixel(x, y, r, g, b)
+        self.stats["pixels"] += len(xs)
+
+    def distrust(self):
+        """Stop assuming the canvas still shows what present() last sent.
+
+        For after drawing straight onto the canvas: the next present()
+        sends every pixel passes touched, changed or not.
+        """
+        self._trusted[:] = False
+
+    def reset(self):
+        """Forget everything, e.g. after the canvas was cleared."""
+        self.pixels[:] = 0
+        self._shown[:] = 0
+        self._trusted[:] = False
+        self._owners[:] = 0
+        self._touched[:] = False
+
+    def take_dirty(self):
+        """Return the dirty bounding box and start a new one."""
+        dirty = self.dirty
+        self.dirty = None
+        return dirty
+
+    def _write_now(self, x0, y0, x1, y1, colour):
+        # untracked write: straight to the canvas, nobody owns the result
+        area = (slice(y0, y1 + 1), slice(x0, x1 + 1))
+        self.pixels[area] = colour
+        self._shown[area] = colour
+        self._trusted[area] = False
+        self._owners[area] = 0
+        self._touched[area] = False
+
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                self.canvas.SetPixel(x, y, *colour)
+        self._mark_dirty(x0, y0, x1, y1)
+
+    def _mark_dirty(self, x0, y0, x1, y1):
+        # every write to the canvas comes through here
+        self.generation += 1
+        if self.dirty is None:
+            self.dirty = (x0, y0, x1, y1)
+        else:
+            dx0, dy0, dx1, dy1 = self.dirty
+            self.dirty = (min(dx0, x0), min(dy0, y0), max(dx1, x1), max(dy1, y1))
+
+
+class RawCanvas(object):
+    """The LED canvas as scenes draw straight onto it (Animator.canvas).
+
+    Notes whether anything drew: the first draw after take_drawn() sets
+    drawn, and later ones go straight to the canvas until the next
+    take_drawn(). Everything else is the canvas's own. utilities/graphics.py
+    hands rgbmatrix the canvas itself and marks it drawn.
+    """
+
+    DRAW_METHODS = ("SetPixel", "SetImage", "Clear", "Fill")
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.drawn = False
+
+    def __getattr__(self, name):
+        return getattr(self.canvas, name)
+
+    def mark_drawn(self):
+        if self.drawn:
+            return
+        self.drawn = True
+        # shadow the methods below until take_drawn()
+        for name in self.DRAW_METHODS:
+            method = getattr(self.canvas, name, None)
+            if method is not None:
+                self.__dict__[name] = method
+
+    def take_drawn(self):
+        """Whether anything drew since the last call."""
+        drawn = self.drawn
+        if drawn:
+            self.drawn = False
+            for name in self.DRAW_METHODS:
+                self.__dict__.pop(name, None)
+        return drawn
+
+    def SetPixel(self, x, y, r, g, b):
+        self.mark_drawn()
+        self.canvas.SetPixel(x, y, r, g, b)
+
+    def SetImage(self, *args, **kwargs):
+        self.mark_drawn()
+        self.canvas.SetImage(*args, **kwargs)
+
+    def Clear(self):
+        self.mark_drawn()
+        self.canvas.Clear()
+
+    def Fill(self, r, g, b):
+        self.mark_drawn()
+        self.canvas.Fill(r, g, b)
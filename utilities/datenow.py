@@ -1,28 +1,73 @@
-"""centralized date/time helper with optional DEBUG_DATE override."""
+"""centralized date/time helper with optional DEBUG_DATE override.
+
+the animator pins the time once per frame with freeze() and releases it
+with thaw(), so every keyframe in a frame sees the same moment and
+get_now() is only a variable read. the pinned time belongs to the thread
+that froze it; other threads, and the animator between frames, read the
+clock.
+"""
 import sys
+import threading
 from datetime import datetime
 
 
-def get_now():
-    """get current datetime, with optional date override from config.
-
-    if DEBUG_DATE is set in config (format: "MM-DD"), returns a datetime
-    with that month/day but real hours/minutes/seconds. this allows
-    testing holiday animations without changing the system clock.
-    """
-    now = datetime.now()
-
+def _load_debug_date():
+    """read DEBUG_DATE from config once; returns (month, day) or None."""
     try:
         from config import DEBUG_DATE
     except (ImportError, NameError):
-        return now
+        return None
 
     if not DEBUG_DATE:
-        return now
+        return None
 
     try:
         month, day = map(int, DEBUG_DATE.split("-"))
-        return now.replace(month=month, day=day)
+        # a leap year, so 02-29 is accepted here
+        datetime(2000, month, day)
     except (ValueError, AttributeError):
         print(f"[WARNING] invalid DEBUG_DATE '{DEBUG_DATE}', using real date", file=sys.stderr)
+        return None
+    return month, day
+
+
+_debug_date = _load_debug_date()
+# per-thread pinned time; .now is None when nothing is frozen
+_frame = threading.local()
+
+
+def _read_clock():
+    now = datetime.now()
+    if _debug_date is None:
+        return now
+
+    try:
+        return now.replace(month=_debug_date[0], day=_debug_date[1])
+    except ValueError:
+        # 02-29 outside a leap year
+        return now
+
+
+def get_now():
+    """get current datetime, with optional date override from config.
+
+    if DEBUG_DATE is set in config (format: "MM-DD"), returns a datetime
+    with that month/day but real hours/minutes/seconds. this allows
+    testing holiday animations without changing the system clock.
+    """
+    now = getattr(_frame, "now", None)
+    if now is not None:
         return now
+    return _read_clock()
+
+
+def freeze(now=None):
+    """make get_now() return one moment (default: the clock now) until thaw().
+
+    only the calling thread sees the pinned time.
+    """
+    _frame.now = _read_clock() if now is None else now
+
+
+def thaw():
+    _frame.now = None
@@ -0,0 +1,102 @@
+"""persistent TTL + LRU cache of flight details, kept in SQLite."""
+import sqlite3
+import sys
+from threading import Lock
+from time import time
+
+try:
+    # file the cache lives in; restarts of the service keep it
+    from config import DETAIL_CACHE_PATH
+except (ModuleNotFoundError, NameError, ImportError):
+    DETAIL_CACHE_PATH = "flight_details.sqlite"
+
+try:
+    from config import DETAIL_CACHE_TTL
+except (ModuleNotFoundError, NameError, ImportError):
+    DETAIL_CACHE_TTL = 6 * 60 * 60  # seconds
+
+try:
+    from config import DETAIL_CACHE_SIZE
+except (ModuleNotFoundError, NameError, ImportError):
+    DETAIL_CACHE_SIZE = 500  # flights
+
+
+def flight_key(flight):
+    """Key a flight by its FlightRadar24 id, falling back to registration/callsign."""
+    for attribute in ("id", "registration", "callsign"):
+        value = getattr(flight, attribute, None)
+        if value and str(value).upper() not in ("N/A", "NONE"):
+            return f"{attribute}:{value}"
+    return None
+
+
+class DetailCache:
+    def __init__(self, path=DETAIL_CACHE_PATH, ttl=DETAIL_CACHE_TTL, size=DETAIL_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self._lock = Lock()
+        # key -> last read time, written out with the next put() so a
+        # cache hit doesn't cost a commit (an fsync on the SD card)
+        self._used = {}
+
+        try:
+            self._db = self._open(path)
+        except sqlite3.Error as e:
+            print(f"Flight detail cache unavailable at {path}: {e}", file=sys.stderr)
+            self._db = self._open(":memory:")
+
+    @staticmethod
+    def _open(path):
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS details ("
+            "key TEXT PRIMARY KEY, plane TEXT, fetched REAL, used REAL)"
+        )
+        db.commit()
+        return db
+
+    def get(self, key):
+        """Return the cached plane model for key, or None if missing or expired."""
+        now = time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT plane, fetched FROM details WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            plane, fetched = row
+            if now - fetched > self.ttl:
+                self._used.pop(key, None)
+                self._db.execute("DELETE FROM details WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+
+            self._used[key] = now
+            return plane
+
+    def put(self, key, plane):
+        now = time()
+        with self._lock:
+            # bring read times up to date before choosing what to evict
+            self._db.executemany(
+                "UPDATE details SET used = ? WHERE key = ?",
+                [(used, used_key) for used_key, used in self._used.items()],
+            )
+            self._used.clear()
+            self._db.execute(
+                "INSERT OR REPLACE INTO details (key, plane, fetched, used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, plane, now, now),
+            )
+            # evict the least recently used beyond the size limit
+            self._db.execute(
+                "DELETE FROM details WHERE key IN ("
+                "SELECT key FROM details ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.size,),
+            )
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM details").fetchone()[0]
@@ -0,0 +1,71 @@
+"""compact flight record passed from Overhead to the scenes."""
+from itertools import groupby
+
+
+class FlightInfo:
+    # record fields, in the order of the old dict records
+    FIELDS = (
+        "id",
+        "plane",
+        "origin",
+        "destination",
+        "vertical_speed",
+        "altitude",
+        "callsign",
+        "bearing",
+        "latitude",
+        "longitude",
+        "heading",
+        "ground_speed",
+        "timestamp",
+    )
+
+    # set-like, as dict.keys() is
+    _KEYS = dict.fromkeys(FIELDS).keys()
+
+    __slots__ = FIELDS + ("callsign_runs", "plane_width")
+
+    def __init__(self, **fields):
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f"unknown flight fields: {', '.join(sorted(unknown))}")
+
+        for name in self.FIELDS:
+            setattr(self, name, fields.get(name))
+        for name in ("plane", "origin", "destination", "callsign"):
+            if getattr(self, name) is None:
+                setattr(self, name, "")
+
+        # callsign split into (text, is_numeric) runs, e.g. BAW 12 X, for the
+        # two-colour flight number
+        if self.callsign and self.callsign != "N/A":
+            self.callsign_runs = tuple(
+                ("".join(run), numeric)
+                for numeric, run in groupby(self.callsign, key=str.isnumeric)
+            )
+        else:
+            self.callsign_runs = ()
+
+        # pixel width of the plane text, measured once by PlaneDetailsScene
+        self.plane_width = None
+
+    # mapping-style access, so code written against the dict records works
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._KEYS else default
+
+    def keys(self):
+        return self._KEYS
+
+    def __eq__(self, other):
+        if not isinstance(other, FlightInfo):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS)
+
+    def __repr__(self):
+        return f"FlightInfo(callsign={self.callsign!r}, plane={self.plane!r})"
@@ -0,0 +1,54 @@
+"""diffing of flight lists from Overhead, keyed by flight id."""
+
+
+def flight_id(flight):
+    """Stable key for a flight record; older records only have a callsign."""
+    return flight.get("id") or flight.get("callsign")
+
+
+class FlightDiff:
+    def __init__(self, added, removed, updated, reordered):
+        # ids only in the new list / only in the old one
+        self.added = added
+        self.removed = removed
+        # id -> set of field names whose values changed
+        self.updated = updated
+        # same flights, different order
+        self.reordered = reordered
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.updated or self.reordered)
+
+    def __repr__(self):
+        return (
+            f"FlightDiff(added={self.added}, removed={self.removed}, "
+            f"updated={self.updated}, reordered={self.reordered})"
+        )
+
+
+def diff_flights(old, new):
+    """Compare two flight lists and report what changed between them."""
+    old_by_id = {flight_id(f): f for f in old}
+    new_by_id = {flight_id(f): f for f in new}
+
+    added = [key for key in new_by_id if key not in old_by_id]
+    removed = [key for key in old_by_id if key not in new_by_id]
+
+    updated = {}
+    for key, flight in new_by_id.items():
+        previous = old_by_id.get(key)
+        if previous is None:
+            continue
+        changed = {
+            field
+            for field in previous.keys() | flight.keys()
+            if previous.get(field) != flight.get(field)
+        }
+        if changed:
+            updated[key] = changed
+
+    kept_old = [flight_id(f) for f in old if flight_id(f) in new_by_id]
+    kept_new = [flight_id(f) for f in new if flight_id(f) in old_by_id]
+    reordered = kept_old != kept_new
+
+    return FlightDiff(added, removed, updated, reordered)
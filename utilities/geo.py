@@ -0,0 +1,302 @@
+"""
+Geometry around home, built once and shared.
+
+HomeGeometry holds everything about the home point that doesn't change
+between flights: its trig terms, its Cartesian position and the window
+field-of-view sector. Its scalar methods serve single flights and
+landmarks (overhead.py helpers, calc_bearing.py). The array methods and
+nearest_flights() take the whole flight list as NumPy arrays and filter
+and rank it in one vectorised pass.
+
+For big zones, query_zone() shrinks the box asked of the API to the
+window sector and distance limit, and SkyGrid culls whatever still
+comes back by grid cell, with no per-flight trig, before the exact
+checks run on the survivors.
+"""
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371
+FEET_TO_KM = 0.0003048
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+# step in degrees when tracing the edge of the visible sector
+SECTOR_STEP = 5
+
+# slack so SkyGrid never culls a cell the exact checks would keep
+GRID_MARGIN_KM = 1
+GRID_MARGIN_DEGREES = 1
+
+
+def cartesian(lat, lon, radius):
+    """Points on a sphere of the given radius (km) as an (..., 3) array."""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    return np.stack(
+        (
+            radius * np.cos(lat) * np.sin(lon),
+            radius * np.sin(lat),
+            radius * np.cos(lat) * np.cos(lon),
+        ),
+        axis=-1,
+    )
+
+
+def destination(lat, lon, bearing, distance_km):
+    """(lat, lon) reached travelling distance_km from a point along bearing."""
+    lat1 = math.radians(lat)
+    angle = distance_km / EARTH_RADIUS_KM
+    bearing = math.radians(bearing)
+    sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
+
+    lat2 = math.asin(
+        sin_lat1 * math.cos(angle) + cos_lat1 * math.sin(angle) * math.cos(bearing)
+    )
+    dlon = math.atan2(
+        math.sin(bearing) * math.sin(angle) * cos_lat1,
+        math.cos(angle) - sin_lat1 * math.sin(lat2),
+    )
+    return math.degrees(lat2), lon + math.degrees(dlon)
+
+
+class HomeGeometry:
+    def __init__(self, location, window_bearing=None, window_fov=None):
+        self.latitude = location[0]
+        self.longitude = location[1]
+        self.radius = location[2] if len(location) > 2 else EARTH_RADIUS_KM
+
+        lat = math.radians(self.latitude)
+        self._sin_lat = math.sin(lat)
+        self._cos_lat = math.cos(lat)
+        self.xyz = cartesian(self.latitude, self.longitude, self.radius)
+        self._xyz = tuple(self.xyz.tolist())
+
+        # window sector, None = the whole sky is visible
+        self.window_bearing = window_bearing
+        if window_bearing is None or window_fov is None:
+            self._half_fov = None
+        else:
+            self._half_fov = window_fov / 2
+
+    # single points
+
+    def bearing(self, lat, lon):
+        """Bearing in degrees to a point (0=north, 90=east, 180=south)."""
+        lat2 = math.radians(lat)
+        dlon = math.radians(lon - self.longitude)
+        cos_lat2 = math.cos(lat2)
+
+        x = math.sin(dlon) * cos_lat2
+        y = self._cos_lat * math.sin(lat2) - self._sin_lat * cos_lat2 * math.cos(dlon)
+        return math.degrees(math.atan2(x, y)) % 360
+
+    def distance(self, lat, lon, altitude_ft):
+        """Straight-line distance in km to a point, altitude included."""
+        radius = altitude_ft * FEET_TO_KM + EARTH_RADIUS_KM
+        lat, lon = math.radians(lat), math.radians(lon)
+        x0, y0, z0 = self._xyz
+        return math.sqrt(
+            (x0 - radius * math.cos(lat) * math.sin(lon)) ** 2
+            + (y0 - radius * math.sin(lat)) ** 2
+            + (z0 - radius * math.cos(lat) * math.cos(lon)) ** 2
+        )
+
+    def in_view(self, bearing):
+        """True if a bearing (or mask for an array of them) is inside the window."""
+        if self._half_fov is None:
+            return True if np.isscalar(bearing) else np.ones(np.shape(bearing), dtype=bool)
+
+        # normalize difference to -180..180
+        diff = (bearing - self.window_bearing + 180) % 360 - 180
+        return abs(diff) <= self._half_fov
+
+    def destination(self, bearing, distance_km):
+        """(lat, lon) reached travelling distance_km from home along bearing."""
+        return destination(self.latitude, self.longitude, bearing, distance_km)
+
+    def query_zone(self, zone, max_distance=None):
+        """Shrink a ZONE_HOME style box to the sky flights can be seen in.
+
+        The result covers the window sector (or the full circle) out to
+        max_distance km, or out to the far corner of zone if unset, and
+        never extends past zone.
+        """
+        if self._half_fov is None and max_distance is None:
+            return zone
+
+        corners = [(zone["tl_y"], zone["tl_x"]), (zone["tl_y"], zone["br_x"]),
+                   (zone["br_y"], zone["tl_x"]), (zone["br_y"], zone["br_x"])]
+        reach = max_distance
+        if reach is None:
+            reach = max(self.ground_distance(lat, lon) for lat, lon in corners)
+
+        if self._half_fov is None:
+            start, end = 0, 360
+        else:
+            start = self.window_bearing - self._half_fov
+            end = self.window_bearing + self._half_fov
+        steps = max(1, int(math.ceil((end - start) / SECTOR_STEP)))
+
+        points = [(self.latitude, self.longitude)] + [
+            self.destination(start + (end - start) * i / steps, reach)
+            for i in range(steps + 1)
+        ]
+        lats = [lat for lat, _ in points]
+        lons = [lon for _, lon in points]
+
+        # the edge bulges out between traced points; pad by a step's sagitta
+        pad = reach * (1 - math.cos(math.radians(SECTOR_STEP) / 2)) / KM_PER_DEGREE
+        lon_pad = pad / max(self._cos_lat, 0.01)
+
+        tight = {
+            "tl_y": min(zone["tl_y"], max(lats) + pad),
+            "tl_x": max(zone["tl_x"], min(lons) - lon_pad),
+            "br_y": max(zone["br_y"], min(lats) - pad),
+            "br_x": min(zone["br_x"], max(lons) + lon_pad),
+        }
+        if tight["tl_y"] <= tight["br_y"] or tight["tl_x"] >= tight["br_x"]:
+            # home and its view are outside the zone; leave it alone
+            return zone
+        return tight
+
+    def ground_distance(self, lat, lon):
+        """Great-circle distance in km along the ground to a point."""
+        return float(self.ground_distances(np.float64(lat), np.float64(lon)))
+
+    # arrays
+
+    def ground_distances(self, lat, lon):
+        lat2 = np.radians(lat)
+        dlat = lat2 - math.radians(self.latitude)
+        dlon = np.radians(lon - self.longitude)
+        a = np.sin(dlat / 2) ** 2 + self._cos_lat * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1)))
+
+    def bearings(self, lat, lon):
+        lat2 = np.radians(lat)
+        dlon = np.radians(lon - self.longitude)
+        cos_lat2 = np.cos(lat2)
+
+        x = np.sin(dlon) * cos_lat2
+        y = self._cos_lat * np.sin(lat2) - self._sin_lat * cos_lat2 * np.cos(dlon)
+        return np.degrees(np.arctan2(x, y)) % 360
+
+    def distances(self, lat, lon, altitude_ft):
+        xyz = cartesian(lat, lon, altitude_ft * FEET_TO_KM + EARTH_RADIUS_KM)
+        return np.sqrt(((xyz - self.xyz) ** 2).sum(axis=-1))
+
+
+def flight_arrays(flights):
+    """Return (latitude, longitude, altitude in feet) arrays; missing values are NaN."""
+    def column(name):
+        return np.array(
+            [getattr(f, name, None) for f in flights], dtype=np.float64
+        )
+
+    return column("latitude"), column("longitude"), column("altitude")
+
+
+class SkyGrid:
+    """Grid over a zone marking the cells a visible flight could be in.
+
+    Each cell's bearings and nearest distance from home are worked out
+    once, here. Looking flights up afterwards is only index arithmetic,
+    so everything outside the window sector or distance limit is dropped
+    before any per-flight trig. Cells partly inside are kept; the exact
+    checks in nearest_flights() decide for the flights in them.
+    """
+
+    def __init__(self, home, zone, max_distance=None, cell_degrees=0.05):
+        self.south = zone["br_y"]
+        self.west = zone["tl_x"]
+        self.cell = cell_degrees
+        rows = max(1, int(math.ceil((zone["tl_y"] - zone["br_y"]) / cell_degrees)))
+        cols = max(1, int(math.ceil((zone["br_x"] - zone["tl_x"]) / cell_degrees)))
+
+        lat_edges = self.south + np.arange(rows + 1) * cell_degrees
+        lon_edges = self.west + np.arange(cols + 1) * cell_degrees
+        self.mask = np.ones((rows, cols), dtype=bool)
+
+        if max_distance is not None:
+            # nearest point of each cell to home
+            near_lat = np.clip(home.latitude, lat_edges[:-1], lat_edges[1:])
+            near_lon = np.clip(home.longitude, lon_edges[:-1], lon_edges[1:])
+            near = home.ground_distances(near_lat[:, None], near_lon[None, :])
+            self.mask &= near <= max_distance + GRID_MARGIN_KM
+
+        if home.window_bearing is not None and home._half_fov is not None:
+            corner_bearings = home.bearings(lat_edges[:, None], lon_edges[None, :])
+            diff = (corner_bearings - home.window_bearing + 180) % 360 - 180
+            corners = np.stack(
+                (diff[:-1, :-1], diff[:-1, 1:], diff[1:, :-1], diff[1:, 1:])
+            )
+            low, high = corners.min(axis=0), corners.max(axis=0)
+            half_fov = home._half_fov + GRID_MARGIN_DEGREES
+            sector = (high >= -half_fov) & (low <= half_fov)
+
+            # the cells round home see every direction
+            row = int((home.latitude - self.south) // cell_degrees)
+            col = int((home.longitude - self.west) // cell_degrees)
+            sector[max(0, row - 1):row + 2, max(0, col - 1):col + 2] = True
+            self.mask &= sector
+
+    def visible(self, lat, lon):
+        """Mask of points that may be visible; points off the grid are kept."""
+        with np.errstate(invalid="ignore"):
+            rows = np.floor((lat - self.south) / self.cell)
+            cols = np.floor((lon - self.west) / self.cell)
+            inside = (
+                (rows >= 0) & (rows < self.mask.shape[0])
+                & (cols >= 0) & (cols < self.mask.shape[1])
+            )
+
+        visible = np.ones(len(lat), dtype=bool)
+        visible[inside] = self.mask[rows[inside].astype(int), cols[inside].astype(int)]
+        return visible
+
+
+def nearest_flights(
+    flights, home, min_altitude, max_altitude, limit=None, grid=None, max_distance=None
+):
+    """Filter flights by altitude, home's window view and distance; rank them.
+
+    grid is an optional SkyGrid to cull with first. Returns up to limit
+    (flight, bearing) pairs, closest first.
+    """
+    flights = list(flights)
+    if not flights:
+        return []
+
+    lat, lon, alt = flight_arrays(flights)
+
+    with np.errstate(invalid="ignore"):
+        keep = (alt < max_altitude) & (alt > min_altitude)
+    keep &= ~(np.isnan(lat) | np.isnan(lon))
+    if grid is not None:
+        keep &= grid.visible(lat, lon)
+
+    candidates = np.flatnonzero(keep)
+    lat, lon, alt = lat[candidates], lon[candidates], alt[candidates]
+
+    bearing = home.bearings(lat, lon)
+    keep = home.in_view(bearing)
+    if max_distance is not None:
+        keep &= home.ground_distances(lat, lon) <= max_distance
+
+    candidates, bearing = candidates[keep], bearing[keep]
+    if not len(candidates):
+        return []
+
+    distance = home.distances(lat[keep], lon[keep], alt[keep])
+
+    # only the closest `limit` need sorting
+    if limit is not None and limit < len(candidates):
+        nearest = np.argpartition(distance, limit - 1)[:limit]
+    else:
+        nearest = np.arange(len(candidates))
+    nearest = nearest[np.argsort(distance[nearest], kind="stable")]
+
+    return [
+        (flights[candidates[i]], float(bearing[i])) for i in nearest.tolist()
+    ]
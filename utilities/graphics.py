@@ -0,0 +1,56 @@
+"""
+rgbmatrix.graphics for drawing straight onto the canvas.
+
+The fonts in setup/fonts.py are utilities.text BitmapFonts, which only
+map the glyph atlas when first used. rgbmatrix's DrawText needs its own
+graphics.Font, parsed from the BDF file, so DrawText here loads that the
+first time a font is drawn with rather than when fonts are imported.
+The draws also unwrap the Animator's RawCanvas, noting on the way that
+something drew. Scenes import this in place of rgbmatrix.graphics:
+
+    from utilities import graphics
+
+    graphics.DrawText(self.canvas, fonts.regular, x, y, colour, "12:00")
+"""
+from rgbmatrix import graphics
+
+from utilities.canvas import RawCanvas
+from utilities.text import BitmapFont
+
+Color = graphics.Color
+Font = graphics.Font
+
+# BitmapFont -> its graphics.Font, once something has drawn with it
+_loaded = {}
+
+
+def load(font):
+    """The graphics.Font for a BitmapFont (parsing it the first time)."""
+    if not isinstance(font, BitmapFont):
+        return font
+
+    loaded = _loaded.get(font)
+    if loaded is None:
+        loaded = _loaded[font] = graphics.Font()
+        loaded.LoadFont(font.path)
+    return loaded
+
+
+def _target(canvas):
+    # rgbmatrix draws onto its own canvas type only
+    if isinstance(canvas, RawCanvas):
+        canvas.mark_drawn()
+        return canvas.canvas
+    return canvas
+
+
+def DrawText(canvas, font, x, y, colour, text):
+    return graphics.DrawText(_target(canvas), load(font), x, y, colour, text)
+
+
+def DrawLine(canvas, x0, y0, x1, y1, colour):
+    return graphics.DrawLine(_target(canvas), x0, y0, x1, y1, colour)
+
+
+def DrawCircle(canvas, x, y, radius, colour):
+    return graphics.DrawCircle(_target(canvas), x, y, radius, colour)
@@ -0,0 +1,78 @@
+"""
+Dead reckoning for flights between polls.
+
+Positions from FlightRadar24 arrive every 30 seconds or more. For each
+flight, MotionModel keeps the last reported position, ground speed,
+heading and vertical speed. From those it extrapolates where the plane
+is at the moment it's asked, so bearing and distance readouts move
+smoothly without extra API calls. Nothing is worked out until a readout
+asks for it.
+"""
+from collections import namedtuple
+from time import time
+
+from utilities.flightset import flight_id
+from utilities.geo import destination
+
+KNOTS_TO_KMH = 1.852
+
+# stop extrapolating this long after the last report; the guess gets
+# worse the longer a plane keeps turning or climbing unseen
+MAX_EXTRAPOLATION = 120  # seconds
+
+Estimate = namedtuple("Estimate", "latitude longitude altitude bearing distance")
+
+
+class _Track:
+    __slots__ = ("latitude", "longitude", "altitude", "heading", "ground_speed",
+                 "vertical_speed", "timestamp")
+
+    def __init__(self, flight, now):
+        self.latitude = flight["latitude"]
+        self.longitude = flight["longitude"]
+        self.altitude = flight.get("altitude") or 0
+        self.heading = flight.get("heading") or 0
+        self.ground_speed = flight.get("ground_speed") or 0  # knots
+        self.vertical_speed = flight.get("vertical_speed") or 0  # feet per minute
+        self.timestamp = flight.get("timestamp") or now
+
+
+class MotionModel:
+    def __init__(self, home):
+        self.home = home
+        self._tracks = {}
+
+    def update(self, flights, now=None):
+        """Take fresh reports; flights no longer reported are dropped."""
+        now = time() if now is None else now
+        self._tracks = {
+            flight_id(f): _Track(f, now)
+            for f in flights
+            if f.get("latitude") is not None and f.get("longitude") is not None
+        }
+
+    def estimate(self, flight, now=None):
+        """Estimate for a flight record at now (wall clock seconds), or None."""
+        track = self._tracks.get(flight_id(flight))
+        if track is None:
+            return None
+
+        now = time() if now is None else now
+        elapsed = min(max(now - track.timestamp, 0), MAX_EXTRAPOLATION)
+
+        travelled = track.ground_speed * KNOTS_TO_KMH * elapsed / 3600
+        if travelled:
+            lat, lon = destination(
+                track.latitude, track.longitude, track.heading, travelled
+            )
+        else:
+            lat, lon = track.latitude, track.longitude
+
+        altitude = max(0, track.altitude + track.vertical_speed * elapsed / 60)
+        return Estimate(
+            lat,
+            lon,
+            altitude,
+            self.home.bearing(lat, lon),
+            self.home.ground_distance(lat, lon),
+        )
@@ -1,9 +1,15 @@
 from FlightRadar24.api import FlightRadar24API
-from threading import Thread, Lock
-from time import sleep
-import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Condition, Event, Thread, Lock
+from time import monotonic, sleep
 import sys
 
+from utilities import geo
+from utilities.geo import EARTH_RADIUS_KM, HomeGeometry, SkyGrid
+from utilities.detailcache import DetailCache, flight_key
+from utilities.flightinfo import FlightInfo
+from utilities.ratelimit import TokenBucket
+
 from requests.exceptions import ConnectionError
 from urllib3.exceptions import NewConnectionError
 from urllib3.exceptions import MaxRetryError
@@ -21,10 +27,26 @@ try:
 except (ModuleNotFoundError, NameError, ImportError):
     MAX_ALTITUDE = 10000  # feet
 
+try:
+    # flight detail lookups per second, shared by all workers
+    from config import FLIGHT_LOOKUP_RATE
+except (ModuleNotFoundError, NameError, ImportError):
+    FLIGHT_LOOKUP_RATE = 1
+
+try:
+    from config import FLIGHT_LOOKUP_WORKERS
+except (ModuleNotFoundError, NameError, ImportError):
+    FLIGHT_LOOKUP_WORKERS = 3
+
 RETRIES = 3
-RATE_LIMIT_DELAY = 1
 MAX_FLIGHT_LOOKUP = 5
-EARTH_RADIUS_KM = 6371
+
+# seconds between polls: with traffic overhead, after an empty sky
+# (doubling up to POLL_EMPTY_MAX) and after API errors (up to POLL_ERROR_MAX)
+POLL_INTERVAL = 30
+POLL_INTERVAL_EMPTY = 60
+POLL_EMPTY_MAX = 180
+POLL_ERROR_MAX = 600
 BLANK_FIELDS = ["", "N/A", "NONE"]
 
 try:
@@ -47,74 +69,219 @@ except (ModuleNotFoundError, NameError, ImportError):
     WINDOW_FOV = None
 
 
-def bearing_from_home(flight, home=LOCATION_DEFAULT):
-    """Calculate bearing from home to flight in degrees (0=north, 90=east, 180=south)."""
-    try:
-        lat1 = math.radians(home[0])
-        lat2 = math.radians(flight.latitude)
-        dlon = math.radians(flight.longitude - home[1])
+try:
+    # furthest flights to consider, km along the ground from home
+    from config import MAX_DISTANCE
+except (ModuleNotFoundError, NameError, ImportError):
+    MAX_DISTANCE = None
 
-        x = math.sin(dlon) * math.cos(lat2)
-        y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
+# home point, window sector and their trig terms, worked out once
+HOME = HomeGeometry(LOCATION_DEFAULT, WINDOW_BEARING, WINDOW_FOV)
 
-        return math.degrees(math.atan2(x, y)) % 360
-    except AttributeError:
-        return 0
+# only ask the API for the part of the zone that can be seen, and cull
+# what comes back by grid cell before the exact checks
+QUERY_ZONE = HOME.query_zone(ZONE_DEFAULT, MAX_DISTANCE)
+if QUERY_ZONE is ZONE_DEFAULT:
+    SKY_GRID = None
+else:
+    SKY_GRID = SkyGrid(HOME, QUERY_ZONE, MAX_DISTANCE)
 
 
-def is_in_window_view(flight, home=LOCATION_DEFAULT):
-    """Check if a flight falls within the configured window field of view."""
-    if WINDOW_BEARING is None or WINDOW_FOV is None:
-        return True
+def _home_geometry(home):
+    if isinstance(home, HomeGeometry):
+        return home
+    return HomeGeometry(home, WINDOW_BEARING, WINDOW_FOV)
 
-    bearing = bearing_from_home(flight, home)
-    half_fov = WINDOW_FOV / 2
-    # normalize difference to -180..180
-    diff = (bearing - WINDOW_BEARING + 180) % 360 - 180
-    return abs(diff) <= half_fov
 
+def bearing_from_home(flight, home=HOME):
+    """Calculate bearing from home to flight in degrees (0=north, 90=east, 180=south)."""
+    try:
+        return _home_geometry(home).bearing(flight.latitude, flight.longitude)
+    except (AttributeError, TypeError):
+        return 0
 
-def distance_from_flight_to_home(flight, home=LOCATION_DEFAULT):
-    def polar_to_cartesian(lat, long, alt):
-        DEG2RAD = math.pi / 180
-        return [
-            alt * math.cos(DEG2RAD * lat) * math.sin(DEG2RAD * long),
-            alt * math.sin(DEG2RAD * lat),
-            alt * math.cos(DEG2RAD * lat) * math.cos(DEG2RAD * long),
-        ]
 
-    def feet_to_meters_plus_earth(altitude_ft):
-        altitude_km = 0.0003048 * altitude_ft
-        return altitude_km + EARTH_RADIUS_KM
+def is_in_window_view(flight, home=HOME):
+    """Check if a flight falls within the configured window field of view."""
+    home = _home_geometry(home)
+    return home.in_view(bearing_from_home(flight, home))
+
 
+def distance_from_flight_to_home(flight, home=HOME):
     try:
-        (x0, y0, z0) = polar_to_cartesian(
-            flight.latitude,
-            flight.longitude,
-            feet_to_meters_plus_earth(flight.altitude),
+        return _home_geometry(home).distance(
+            flight.latitude, flight.longitude, flight.altitude
         )
 
-        (x1, y1, z1) = polar_to_cartesian(*home)
+    except (AttributeError, TypeError):
+        # on error say it's far away
+        return 1e6
 
-        dist = math.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2 + (z1 - z0) ** 2)
 
-        return dist
+def _number(value):
+    # FlightRadar24 fills missing values with "N/A"
+    return value if isinstance(value, (int, float)) else None
 
-    except AttributeError:
-        # on error say it's far away
-        return 1e6
+
+def _text(value):
+    # missing or placeholder strings are passed along as ""
+    if not isinstance(value, str) or value.upper() in BLANK_FIELDS:
+        return ""
+    return value
 
 
 class Overhead:
-    def __init__(self):
-        self._api = FlightRadar24API()
+    def __init__(self, api=None, details_cache=None):
+        # api can be any stand-in with get_bounds/get_flights/get_flight_details
+        self._api = api if api is not None else FlightRadar24API()
+        self._details_cache = details_cache if details_cache is not None else DetailCache()
         self._lock = Lock()
         self._data = []
         self._new_data = False
         self._processing = False
 
+        # detail lookups run in parallel within the rate limit
+        self._rate_limit = TokenBucket(FLIGHT_LOOKUP_RATE)
+        self._workers = ThreadPoolExecutor(
+            max_workers=FLIGHT_LOOKUP_WORKERS, thread_name_prefix="flight-lookup"
+        )
+
+        # one long-lived poller; grab_data() only queues a refresh
+        self._poller = None
+        self._wake = Condition()
+        self._refresh_requested = False
+        self._paused = False
+        self._stopping = Event()
+        self._next_poll = 0.0  # timer poll
+        self._not_before = 0.0  # earliest a requested refresh may run
+        self._backoff = 0
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """Call callback() from the poller thread whenever new data is published."""
+        self._subscribers.append(callback)
+
+    def _publish(self, data, processing):
+        with self._lock:
+            self._new_data = True
+            self._processing = processing
+            self._data = data
+        for callback in list(self._subscribers):
+            callback()
+
     def grab_data(self):
-        Thread(target=self._grab_data).start()
+        """Ask the poller for a refresh; repeated requests coalesce into one."""
+        with self._wake:
+            self._refresh_requested = True
+            self._paused = False
+            if self._poller is None:
+                self._poller = Thread(
+                    target=self._poll_forever, name="overhead-poller", daemon=True
+                )
+                self._poller.start()
+            self._wake.notify()
+
+    def pause(self):
+        """Stop timed polls until the next grab_data() (e.g. quiet hours)."""
+        with self._wake:
+            self._paused = True
+
+    def stop(self):
+        """Shut the poller down and cancel outstanding lookups."""
+        self._stopping.set()
+        with self._wake:
+            self._wake.notify()
+        self._workers.shutdown(wait=False, cancel_futures=True)
+
+    def _poll_forever(self):
+        while True:
+            with self._wake:
+                while not self._stopping.is_set():
+                    now = monotonic()
+                    due = float("inf") if self._paused else self._next_poll
+                    if self._refresh_requested:
+                        due = min(due, self._not_before)
+                    if now >= due:
+                        break
+                    self._wake.wait(None if due == float("inf") else due - now)
+
+                if self._stopping.is_set():
+                    return
+                self._refresh_requested = False
+
+            self._schedule_next(self._grab_data())
+
+    def _schedule_next(self, found):
+        """Adapt the poll interval to the last result.
+
+        found is the number of flights, or None if the API failed. With
+        traffic overhead a refresh request runs straight away; an empty
+        sky or errors back off, and requests wait for the backoff too.
+        """
+        if found:
+            self._backoff = 0
+            interval = POLL_INTERVAL
+            not_before = 0
+        else:
+            ceiling = POLL_EMPTY_MAX if found == 0 else POLL_ERROR_MAX
+            self._backoff = min(max(self._backoff * 2, POLL_INTERVAL_EMPTY), ceiling)
+            interval = not_before = self._backoff
+
+        now = monotonic()
+        with self._wake:
+            self._next_poll = now + interval
+            self._not_before = now + not_before
+
+    def _plane_model(self, flight):
+        # Rate limit protection
+        self._rate_limit.acquire()
+
+        details = self._api.get_flight_details(flight)
+
+        # Get plane type
+        try:
+            plane = details["aircraft"]["model"]["text"]
+        except (KeyError, TypeError):
+            plane = ""
+
+        # Tidy up what we pass along
+        return _text(plane)
+
+    def _flight_details(self, flight, bearing):
+        # the aircraft doesn't change while a flight is around, so
+        # re-polls of the same traffic are answered from the cache
+        key = flight_key(flight)
+        plane = self._details_cache.get(key) if key else None
+
+        # only the details request can fail; each retry asks again
+        retries = RETRIES
+        while plane is None and retries:
+            try:
+                plane = self._plane_model(flight)
+                if key:
+                    self._details_cache.put(key, plane)
+            except (KeyError, AttributeError):
+                retries -= 1
+
+        if plane is None:
+            return None
+
+        return FlightInfo(
+            id=key,
+            plane=plane,
+            origin=_text(getattr(flight, "origin_airport_iata", None)),
+            destination=_text(getattr(flight, "destination_airport_iata", None)),
+            vertical_speed=flight.vertical_speed,
+            altitude=flight.altitude,
+            callsign=_text(getattr(flight, "callsign", None)),
+            bearing=bearing,
+            # last reported motion, for dead reckoning between polls
+            latitude=_number(getattr(flight, "latitude", None)),
+            longitude=_number(getattr(flight, "longitude", None)),
+            heading=_number(getattr(flight, "heading", None)),
+            ground_speed=_number(getattr(flight, "ground_speed", None)),
+            timestamp=_number(getattr(flight, "time", None)),
+        )
 
     def _grab_data(self):
         # Mark data as old
@@ -122,81 +289,48 @@ class Overhead:
             self._new_data = False
             self._processing = True
 
-        data = []
-
         # Grab flight details
         try:
-            bounds = self._api.get_bounds(ZONE_DEFAULT)
+            bounds = self._api.get_bounds(QUERY_ZONE)
             flights = self._api.get_flights(bounds=bounds)
 
-            # filter by altitude and window view, sort by closest first
-            flights = [
-                f
-                for f in flights
-                if f.altitude < MAX_ALTITUDE
-                and f.altitude > MIN_ALTITUDE
-                and is_in_window_view(f)
-            ]
-            flights = sorted(flights, key=lambda f: distance_from_flight_to_home(f))
-
-            for flight in flights[:MAX_FLIGHT_LOOKUP]:
-                retries = RETRIES
-
-                while retries:
-                    # Rate limit protection
-                    sleep(RATE_LIMIT_DELAY)
-
-                    # Grab and store details
-                    try:
-                        details = self._api.get_flight_details(flight)
-
-                        # Get plane type
-                        try:
-                            plane = details["aircraft"]["model"]["text"]
-                        except (KeyError, TypeError):
-                            plane = ""
-
-                        # Tidy up what we pass along
-                        plane = plane if not (plane.upper() in BLANK_FIELDS) else ""
-
-                        origin = (
-                            flight.origin_airport_iata
-                            if not (flight.origin_airport_iata.upper() in BLANK_FIELDS)
-                            else ""
-                        )
-
-                        destination = (
-                            flight.destination_airport_iata
-                            if not (flight.destination_airport_iata.upper() in BLANK_FIELDS)
-                            else ""
-                        )
-
-                        callsign = (
-                            flight.callsign
-                            if not (flight.callsign.upper() in BLANK_FIELDS)
-                            else ""
-                        )
-
-                        data.append(
-                            {
-                                "plane": plane,
-                                "origin": origin,
-                                "destination": destination,
-                                "vertical_speed": flight.vertical_speed,
-                                "altitude": flight.altitude,
-                                "callsign": callsign,
-                                "bearing": bearing_from_home(flight),
-                            }
-                        )
-                        break
-
-                    except (KeyError, AttributeError):
-                        retries -= 1
-
-            with self._lock:
-                self._new_data = True
-                self._processing = False
-                self._data = data
+            # filter by altitude and window view, closest first
+            nearest = geo.nearest_flights(
+                flights,
+                HOME,
+                MIN_ALTITUDE,
+                MAX_ALTITUDE,
+                limit=MAX_FLIGHT_LOOKUP,
+                grid=SKY_GRID,
+                max_distance=MAX_DISTANCE,
+            )
+
+            lookups = {
+                self._workers.submit(self._flight_details, flight, bearing): rank
+                for rank, (flight, bearing) in enumerate(nearest)
+            }
+            found = {}
+
+            for lookup in as_completed(lookups):
+                if self._stopping.is_set():
+                    return None
+
+                try:
+                    details = lookup.result()
+                except Exception as e:
+                    # drop just this flight; the others still stand
+                    print(f"FlightRadar API flight lookup error: {e}", file=sys.stderr)
+                    continue
+                if details is None:
+                    continue
+
+                # publish what has arrived so far, closest first
+                found[lookups[lookup]] = details
+                self._publish([found[rank] for rank in sorted(found)], True)
+
+            self._publish([found[rank] for rank in sorted(found)], False)
+
+            return len(found)
 
         except (ConnectionError, NewConnectionError, MaxRetryError) as e:
             print(f"FlightRadar API connection error: {e}", file=sys.stderr)
@@ -209,6 +343,8 @@ class Overhead:
                 self._new_data = False
                 self._processing = False
 
+        return None
+
     @property
     def new_data(self):
         with self._lock:
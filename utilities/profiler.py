@@ -0,0 +1,172 @@
+"""
+Per-keyframe timing for the Animator.
+
+With FRAME_PROFILE enabled, every keyframe call is timed (wall clock and
+the thread's CPU time) along with each whole frame. The last WINDOW
+samples of each give rolling p50/p95/p99, and a keyframe or frame that
+takes longer than the frame period counts as an overrun.
+
+The report can be read three ways while the tracker runs:
+
+    kill -USR1 <pid>          # table of the slowest keyframes on stderr
+    FRAME_PROFILE_PATH        # JSON file rewritten every FRAME_PROFILE_INTERVAL s
+    display.profiler.report() # the same data as a dict
+
+When profiling is off the Animator has no profiler at all and pays one
+None check per keyframe.
+"""
+import json
+import os
+import signal
+import sys
+from collections import deque
+from time import perf_counter, thread_time
+
+import numpy as np
+
+WINDOW = 600  # samples kept per keyframe for the percentiles
+PERCENTILES = (50, 95, 99)
+
+
+class _Timings(object):
+    __slots__ = ("calls", "overruns", "total_wall", "total_cpu", "wall", "cpu")
+
+    def __init__(self):
+        self.calls = 0
+        self.overruns = 0
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self.wall = deque(maxlen=WINDOW)
+        self.cpu = deque(maxlen=WINDOW)
+
+    def add(self, wall, cpu, budget):
+        self.calls += 1
+        self.total_wall += wall
+        self.total_cpu += cpu
+        self.wall.append(wall)
+        self.cpu.append(cpu)
+        if wall > budget:
+            self.overruns += 1
+
+    def summary(self):
+        return {
+            "calls": self.calls,
+            "overruns": self.overruns,
+            "total_ms": round(self.total_wall * 1000, 3),
+            "cpu_total_ms": round(self.total_cpu * 1000, 3),
+            "wall_ms": _percentiles(self.wall),
+            "cpu_ms": _percentiles(self.cpu),
+        }
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    values = np.percentile(np.fromiter(samples, dtype=np.float64), PERCENTILES) * 1000
+    summary = {f"p{p}": round(float(v), 3) for p, v in zip(PERCENTILES, values)}
+    summary["max"] = round(max(samples) * 1000, 3)
+    return summary
+
+
+class FrameProfiler(object):
+    def __init__(self, budget, path=None, interval=10):
+        # frame period in seconds; longer calls count as overruns
+        self.budget = budget
+        self.path = path
+        self.interval = interval
+        self.frame = _Timings()
+        self.keyframes = {}
+        self._written = perf_counter()
+        self._frame_start = None
+
+    def call(self, keyframe, count):
+        """Run keyframe(count), timing it; returns what the keyframe returns."""
+        wall, cpu = perf_counter(), thread_time()
+        try:
+            return keyframe(count)
+        finally:
+            self._add(keyframe, perf_counter() - wall, thread_time() - cpu)
+
+    def call_reset(self, keyframe):
+        """Run a divisor 0 keyframe, timing it."""
+        wall, cpu = perf_counter(), thread_time()
+        try:
+            return keyframe()
+        finally:
+            self._add(keyframe, perf_counter() - wall, thread_time() - cpu)
+
+    def _add(self, keyframe, wall, cpu):
+        name = keyframe.__name__
+        timings = self.keyframes.get(name)
+        if timings is None:
+            timings = self.keyframes[name] = _Timings()
+        timings.add(wall, cpu, self.budget)
+
+    def start_frame(self):
+        self._frame_start = (perf_counter(), thread_time())
+
+    def end_frame(self):
+        wall, cpu = self._frame_start
+        now = perf_counter()
+        self.frame.add(now - wall, thread_time() - cpu, self.budget)
+
+        if self.path and now - self._written >= self.interval:
+            self._written = now
+            self.write(self.path)
+
+    def report(self):
+        """Frame and per-keyframe timings, slowest keyframes (by total) first."""
+        keyframes = sorted(
+            self.keyframes.items(), key=lambda item: item[1].total_wall, reverse=True
+        )
+        return {
+            "budget_ms": round(self.budget * 1000, 3),
+            "window": WINDOW,
+            "frame": self.frame.summary(),
+            "keyframes": {name: timings.summary() for name, timings in keyframes},
+        }
+
+    def write(self, path):
+        """Write report() as JSON, replacing the file in one step."""
+        partial = f"{path}.tmp"
+        try:
+            with open(partial, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(partial, path)
+        except OSError as e:
+            print(f"Profiler: couldn't write {path}: {e}", file=sys.stderr)
+
+    def format(self, limit=15):
+        """report() as a text table of the slowest keyframes."""
+        report = self.report()
+        lines = [
+            f"frames: {report['frame']['calls']}  overruns: {report['frame']['overruns']}"
+            f"  budget: {report['budget_ms']:.1f} ms  {_format_ms(report['frame']['wall_ms'])}",
+            f"{'keyframe':<32}{'calls':>8}{'total ms':>11}{'p50':>8}{'p95':>8}"
+            f"{'p99':>8}{'cpu p95':>9}{'over':>6}",
+        ]
+        for name, summary in list(report["keyframes"].items())[:limit]:
+            wall, cpu = summary["wall_ms"], summary["cpu_ms"]
+            lines.append(
+                f"{name:<32}{summary['calls']:>8}{summary['total_ms']:>11.1f}"
+                f"{wall['p50']:>8.2f}{wall['p95']:>8.2f}{wall['p99']:>8.2f}"
+                f"{cpu['p95']:>9.2f}{summary['overruns']:>6}"
+            )
+        return "\n".join(lines)
+
+    def install_signal(self, signum=getattr(signal, "SIGUSR1", None)):
+        """Print format() to stderr when the process gets signum."""
+        if signum is None:
+            return False
+        try:
+            signal.signal(signum, lambda *_: print(self.format(), file=sys.stderr))
+        except ValueError:
+            # not the main thread
+            return False
+        return True
+
+
+def _format_ms(summary):
+    if summary is None:
+        return ""
+    return "  ".join(f"{key} {value:.2f}" for key, value in summary.items())
@@ -2,9 +2,14 @@
 Quiet hours utility for FlightTracker.
 
 Provides functions to check if the display should be dimmed or off
-based on configurable weekday/weekend schedules.
+based on configurable weekday/weekend schedules. The schedule is parsed
+once into a QuietSchedule, which only re-evaluates at the next change
+of mode.
 """
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
+from threading import Lock, Timer
+from time import monotonic
+
 from utilities.datenow import get_now
 
 
@@ -17,20 +22,11 @@ def _parse_time(time_str):
         return None
 
 
-def _time_in_range(start_str, end_str, check_time=None):
-    """Check if current time is within a time range.
+def _in_range(start, end, check_time):
+    """Check if a time is within a range of parsed times.
 
     Handles ranges that cross midnight (e.g., 22:00 to 02:00).
     """
-    if check_time is None:
-        check_time = get_now().time()
-
-    start = _parse_time(start_str)
-    end = _parse_time(end_str)
-
-    if start is None or end is None:
-        return False
-
     if start <= end:
         # normal range (e.g., 09:00 to 17:00)
         return start <= check_time <= end
@@ -39,11 +35,6 @@ def _time_in_range(start_str, end_str, check_time=None):
         return check_time >= start or check_time <= end
 
 
-def _is_weekend():
-    """Check if today is a weekend (Saturday=5, Sunday=6)."""
-    return get_now().weekday() >= 5
-
-
 def _load_schedule():
     """Load quiet schedule from config."""
     try:
@@ -67,6 +58,188 @@ def _load_legacy_config():
         return None
 
 
+class QuietSchedule(object):
+    """Quiet hours compiled once from config.
+
+    The schedule is a list of (mode, start, end, brightness) rules per day
+    type, checked in order. Looking up the status works out the time of
+    the next change of mode too, and the answer is reused until then, so
+    callers can ask every frame. Subscribers are called with the new
+    status when the mode changes: a timer set for the next transition
+    checks then, from its own thread, whether anyone asks or not.
+    """
+
+    # re-check at least this often, in case the wall clock jumps back
+    MAX_CACHE_SECONDS = 60
+
+    # how far ahead to look for the next transition
+    LOOKAHEAD_DAYS = 8
+
+    def __init__(self, weekday_rules=(), weekend_rules=(), clock=None):
+        self._rules = {"weekday": list(weekday_rules), "weekend": list(weekend_rules)}
+        self._clock = clock or get_now
+        self._subscribers = []
+        self._status = None
+        self._next_transition = None
+        self._expires = 0
+        self._lock = Lock()
+        self._timer = None
+
+    @classmethod
+    def from_config(cls, clock=None):
+        schedule = _load_schedule()
+        if schedule:
+            return cls(
+                _compile_day(schedule.get("weekday", {})),
+                _compile_day(schedule.get("weekend", {})),
+                clock,
+            )
+
+        legacy = _load_legacy_config()
+        rules = []
+        if legacy:
+            mode = legacy.get("mode", "off")
+            start = legacy.get("start")
+            end = legacy.get("end")
+            if mode != "off":
+                rule = _compile_rule(
+                    "dim" if mode == "dim" else "off",
+                    start,
+                    end,
+                    legacy.get("brightness", 30) if mode == "dim" else 0,
+                )
+                if rule:
+                    rules.append(rule)
+        return cls(rules, rules, clock)
+
+    def status(self):
+        """Current {'mode', 'brightness'} status; don't modify it."""
+        if monotonic() >= self._expires:
+            self._refresh(self._clock())
+        return self._status
+
+    def mode(self):
+        return self.status()["mode"]
+
+    def next_transition(self):
+        """datetime (in get_now() time) of the next change of mode, or None."""
+        self.status()
+        return self._next_transition
+
+    def subscribe(self, callback):
+        """Call callback(status) whenever the mode changes.
+
+        It may be called from the timer's thread.
+        """
+        self._subscribers.append(callback)
+        # start the timer
+        self._refresh(self._clock())
+
+    def status_at(self, moment):
+        """Status at a datetime, worked out from scratch."""
+        day_type = "weekend" if moment.weekday() >= 5 else "weekday"
+        check_time = moment.time()
+        for mode, start, end, brightness in self._rules[day_type]:
+            if _in_range(start, end, check_time):
+                return {"mode": mode, "brightness": brightness}
+        return {"mode": "normal", "brightness": 100}
+
+    def _refresh(self, now):
+        with self._lock:
+            status = self.status_at(now)
+            self._next_transition = self._find_transition(now, status)
+
+            wait = self.MAX_CACHE_SECONDS
+            if self._next_transition is not None:
+                wait = min(wait, (self._next_transition - now).total_seconds())
+            self._expires = monotonic() + max(0, wait)
+
+            if self._subscribers:
+                self._start_timer(wait)
+
+            previous, self._status = self._status, status
+
+        if previous is not None and previous != status:
+            for callback in list(self._subscribers):
+                callback(status)
+
+    def _start_timer(self, wait):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = Timer(wait, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        self._refresh(self._clock())
+
+    def _find_transition(self, now, status):
+        # the status only changes at midnight, at a rule's start or just
+        # after its (inclusive) end; try those instants in order
+        today = datetime.combine(now.date(), time())
+        times = {time()}
+        for rules in self._rules.values():
+            for _, start, end, _ in rules:
+                times.add(start)
+                times.add(_after(end))
+
+        for day in range(self.LOOKAHEAD_DAYS + 1):
+            date = (today + timedelta(days=day)).date()
+            for moment in sorted(datetime.combine(date, t) for t in times):
+                if moment > now and self.status_at(moment) != status:
+                    return moment
+        return None
+
+
+def _compile_rule(mode, start_str, end_str, brightness):
+    if not (start_str and end_str):
+        return None
+    start = _parse_time(start_str)
+    end = _parse_time(end_str)
+    if start is None or end is None:
+        return None
+    return (mode, start, end, brightness)
+
+
+def _compile_day(day_schedule):
+    # "off" takes priority over "dim"
+    rules = []
+    off_config = day_schedule.get("off", {})
+    if off_config:
+        rule = _compile_rule("off", off_config.get("start"), off_config.get("end"), 0)
+        if rule:
+            rules.append(rule)
+
+    dim_config = day_schedule.get("dim", {})
+    if dim_config:
+        rule = _compile_rule(
+            "dim",
+            dim_config.get("start"),
+            dim_config.get("end"),
+            dim_config.get("brightness", 30),
+        )
+        if rule:
+            rules.append(rule)
+    return rules
+
+
+def _after(end):
+    # first instant past an inclusive end time
+    moment = datetime.combine(datetime.min.date(), end) + timedelta(microseconds=1)
+    return moment.time()
+
+
+_schedule = None
+
+
+def get_schedule():
+    """The QuietSchedule compiled from config, built on first use."""
+    global _schedule
+    if _schedule is None:
+        _schedule = QuietSchedule.from_config()
+    return _schedule
+
+
 def get_quiet_status():
     """Get current quiet hours status.
 
@@ -75,64 +248,19 @@ def get_quiet_status():
             'mode': 'normal', 'dim', or 'off'
             'brightness': brightness level (0-100) if dim mode
     """
-    schedule = _load_schedule()
-
-    if schedule:
-        # use new schedule system
-        day_type = "weekend" if _is_weekend() else "weekday"
-        day_schedule = schedule.get(day_type, {})
-
-        # check if in "off" period first (takes priority)
-        off_config = day_schedule.get("off", {})
-        if off_config:
-            start = off_config.get("start")
-            end = off_config.get("end")
-            if start and end and _time_in_range(start, end):
-                return {"mode": "off", "brightness": 0}
-
-        # check if in "dim" period
-        dim_config = day_schedule.get("dim", {})
-        if dim_config:
-            start = dim_config.get("start")
-            end = dim_config.get("end")
-            brightness = dim_config.get("brightness", 30)
-            if start and end and _time_in_range(start, end):
-                return {"mode": "dim", "brightness": brightness}
-
-        return {"mode": "normal", "brightness": 100}
-
-    # fall back to legacy config
-    legacy = _load_legacy_config()
-    if legacy:
-        mode = legacy.get("mode", "off")
-        if mode == "off":
-            return {"mode": "normal", "brightness": 100}
-
-        start = legacy.get("start")
-        end = legacy.get("end")
-        if start and end and _time_in_range(start, end):
-            if mode == "dim":
-                return {"mode": "dim", "brightness": legacy.get("brightness", 30)}
-            else:
-                return {"mode": "off", "brightness": 0}
-
-        return {"mode": "normal", "brightness": 100}
-
-    # no config, return normal
-    return {"mode": "normal", "brightness": 100}
+    return dict(get_schedule().status())
 
 
 def should_display_be_off():
     """Check if display should be completely off."""
-    return get_quiet_status()["mode"] == "off"
+    return get_schedule().mode() == "off"
 
 
 def should_display_be_dim():
     """Check if display should be dimmed."""
-    return get_quiet_status()["mode"] == "dim"
+    return get_schedule().mode() == "dim"
 
 
 def get_brightness():
     """Get current brightness level based on quiet hours."""
-    status = get_quiet_status()
-    return status["brightness"]
+    return get_schedule().status()["brightness"]
@@ -0,0 +1,33 @@
+"""token bucket rate limiter for API calls made from several threads."""
+from threading import Lock
+from time import monotonic, sleep
+
+
+class TokenBucket:
+    """Token bucket shared by threads: rate tokens per second, up to burst saved."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def _reserve(self):
+        # take a token, returning how long to wait before it may be used
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a request may be made."""
+        wait = self._reserve()
+        if wait > 0:
+            sleep(wait)
@@ -0,0 +1,97 @@
+"""
+Prerendered sprites for the framebuffer.
+
+A scene that draws the same bitmap every frame registers it once:
+
+    sprites.register("planeintro.plane", lambda: sprites.render(_draw_plane))
+
+and blits it at the current position each frame:
+
+    sprites.get("planeintro.plane").draw(self.tracked, x, 0)
+
+The first get() builds the sprite. After that it is a cached RGB array
+plus an alpha mask, and drawing is a single clipped blit into the
+current TrackedCanvas pass.
+"""
+import numpy as np
+
+
+class Sprite(object):
+    def __init__(self, rgb, alpha, x=0, y=0):
+        # (h, w, 3) uint8 colours and (h, w) bool mask of opaque pixels
+        self.rgb = rgb
+        self.alpha = alpha
+        # top-left corner relative to the position the sprite is drawn at
+        self.x = x
+        self.y = y
+
+    @property
+    def width(self):
+        return self.rgb.shape[1]
+
+    @property
+    def height(self):
+        return self.rgb.shape[0]
+
+    @classmethod
+    def from_pixels(cls, pixels):
+        """Build a sprite from ((x, y), (r, g, b)) pairs; later pixels win."""
+        pixels = dict(pixels)
+        if not pixels:
+            return cls(np.zeros((0, 0, 3), dtype=np.uint8), np.zeros((0, 0), dtype=bool))
+
+        xs = [x for x, _ in pixels]
+        ys = [y for _, y in pixels]
+        x0, y0 = min(xs), min(ys)
+        shape = (max(ys) - y0 + 1, max(xs) - x0 + 1)
+
+        rgb = np.zeros(shape + (3,), dtype=np.uint8)
+        alpha = np.zeros(shape, dtype=bool)
+        for (x, y), colour in pixels.items():
+            rgb[y - y0, x - x0] = colour
+            alpha[y - y0, x - x0] = True
+        return cls(rgb, alpha, x0, y0)
+
+    @classmethod
+    def from_mask(cls, points, colour):
+        """Build a single-colour sprite from (x, y) points."""
+        return cls.from_pixels(((point, colour) for point in points))
+
+    def draw(self, tracked, x, y, rgb=None):
+        """Blit into the current pass with the anchor at (x, y).
+
+        rgb replaces the cached colours for this draw, e.g. a dimmed copy.
+        """
+        tracked.blit(x + self.x, y + self.y, self.rgb if rgb is None else rgb, self.alpha)
+
+    def scaled(self, factor):
+        """Return the sprite colours multiplied by factor (0.0 - 1.0)."""
+        return (self.rgb * factor).astype(np.uint8)
+
+
+def render(draw):
+    """Build a sprite by running draw(set_pixel), set_pixel(x, y, colour)."""
+    pixels = {}
+
+    def set_pixel(x, y, colour):
+        pixels[(int(x), int(y))] = colour
+
+    draw(set_pixel)
+    return Sprite.from_pixels(pixels.items())
+
+
+_builders = {}
+_sprites = {}
+
+
+def register(name, build):
+    """Register a sprite builder; it runs on the first get(name)."""
+    _builders[name] = build
+    _sprites.pop(name, None)
+
+
+def get(name):
+    sprite = _sprites.get(name)
+    if sprite is None:
+        sprite = _sprites[name] = _builders[name]()
+    return sprite
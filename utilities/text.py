@@ -0,0 +1,303 @@
+"""
+Text metrics and prerendered text strips.
+
+graphics.DrawText rasterises a string glyph by glyph on every call, and
+it is the only way the rgbmatrix bindings say how wide a string is.
+Scenes that redraw the same text every frame ask here instead:
+
+    width = text.width(fonts.regular, plane)
+    text.strip(fonts.regular, plane, colour).draw(self.tracked, x, baseline)
+
+or draw() for a DrawText that renders into the pass directly.
+
+Glyph bitmaps come from the font's BDF file. The first run compiles
+each BDF into a binary atlas next to it (4x6.bdf -> 4x6.bdf.atlas): a
+header, one row of metrics per glyph and a pool of glyph bitmaps. Every
+later start memory-maps the atlas instead of parsing text; the atlas is
+rebuilt whenever the BDF's size or modification time changes. Widths
+and strips are memoized, so scrolling text is one clipped blit of a
+cached Sprite into the current TrackedCanvas pass.
+
+The fonts in setup/fonts.py are BitmapFonts; utilities/graphics.py loads
+the rgbmatrix font behind one for drawing straight onto the canvas.
+"""
+import mmap
+import os
+import struct
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from utilities.sprites import Sprite
+
+# drawn in place of glyphs the font doesn't have, as rgbmatrix does
+REPLACEMENT_CODEPOINT = 0xFFFD
+
+# advance: x step to the next glyph; x, top: where the bitmap goes
+# relative to the pen position on the baseline; bitmap: (h, w) bool
+Glyph = namedtuple("Glyph", "advance x top bitmap")
+
+ATLAS_MAGIC = b"FTATLAS1"
+# magic, BDF size and mtime (ns), font bounding box (w, h, x, y), glyph count
+ATLAS_HEADER = struct.Struct("<8sqq5i")
+# per glyph: codepoint, advance, x, top, height, width, offset into the pool
+ATLAS_COLUMNS = 7
+
+
+def _parse_bdf(path):
+    """Return (font bounding box, {codepoint: Glyph}) read from a BDF file."""
+    bounding_box = None
+    glyphs = {}
+
+    with open(path, encoding="latin-1") as bdf:
+        lines = iter(bdf)
+        for line in lines:
+            words = line.split()
+            if not words:
+                continue
+
+            if words[0] == "FONTBOUNDINGBOX":
+                bounding_box = tuple(int(word) for word in words[1:5])
+            elif words[0] == "STARTCHAR":
+                codepoint = advance = bbx = None
+                for line in lines:
+                    words = line.split()
+                    if not words:
+                        continue
+                    if words[0] == "ENCODING":
+                        codepoint = int(words[1])
+                    elif words[0] == "DWIDTH":
+                        advance = int(words[1])
+                    elif words[0] == "BBX":
+                        bbx = tuple(int(word) for word in words[1:5])
+                    elif words[0] == "BITMAP":
+                        break
+
+                rows = []
+                for line in lines:
+                    line = line.strip()
+                    if line == "ENDCHAR":
+                        break
+                    rows.append(line)
+
+                if codepoint is None or codepoint < 0 or bbx is None:
+                    continue
+                glyphs[codepoint] = _glyph(advance, bbx, rows)
+
+    if bounding_box is None:
+        raise ValueError(f"{path} has no FONTBOUNDINGBOX")
+    return bounding_box, glyphs
+
+
+def _glyph(advance, bbx, rows):
+    width, height, x_offset, y_offset = bbx
+    if advance is None:
+        advance = width
+
+    bitmap = np.zeros((height, width), dtype=bool)
+    for y, row in enumerate(rows[:height]):
+        bits = int(row, 16) if row else 0
+        row_bits = len(row) * 4
+        for x in range(min(width, row_bits)):
+            bitmap[y, x] = (bits >> (row_bits - 1 - x)) & 1
+
+    # rgbmatrix drops pixels past the advance width
+    bitmap = bitmap[:, :max(0, advance - x_offset)]
+    return Glyph(advance, x_offset, -height - y_offset, bitmap)
+
+
+def _pack(glyphs):
+    """Return the (table, pool) arrays of an atlas for parsed glyphs."""
+    table = np.zeros((len(glyphs), ATLAS_COLUMNS), dtype="<i4")
+    bitmaps = []
+    offset = 0
+    for row, codepoint in enumerate(sorted(glyphs)):
+        glyph = glyphs[codepoint]
+        height, width = glyph.bitmap.shape
+        table[row] = (codepoint, glyph.advance, glyph.x, glyph.top, height, width, offset)
+        bitmaps.append(glyph.bitmap.ravel())
+        offset += glyph.bitmap.size
+
+    pool = np.concatenate(bitmaps) if bitmaps else np.zeros(0, dtype=bool)
+    return table, pool.astype(np.uint8)
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def compile_atlas(path, atlas_path):
+    """Parse a BDF file and write its atlas; returns (bounding box, table, pool)."""
+    bounding_box, glyphs = _parse_bdf(path)
+    table, pool = _pack(glyphs)
+
+    header = ATLAS_HEADER.pack(
+        ATLAS_MAGIC, *_source_stamp(path), *bounding_box, len(table)
+    )
+    # write beside the real file and swap it in, so a reader never sees half
+    partial = f"{atlas_path}.{os.getpid()}.tmp"
+    try:
+        with open(partial, "wb") as atlas:
+            atlas.write(header)
+            atlas.write(table.tobytes())
+            atlas.write(pool.tobytes())
+        os.replace(partial, atlas_path)
+    except OSError as e:
+        print(f"Couldn't write font atlas {atlas_path}: {e}", file=sys.stderr)
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+
+    return bounding_box, table, pool
+
+
+def open_atlas(path, atlas_path):
+    """Memory-map an up to date atlas; returns (bounding box, table, pool) or None."""
+    try:
+        with open(atlas_path, "rb") as atlas:
+            data = mmap.mmap(atlas.fileno(), 0, access=mmap.ACCESS_READ)
+        stamp = _source_stamp(path)
+    except (OSError, ValueError):
+        # missing (or empty, which mmap refuses)
+        return None
+
+    if len(data) < ATLAS_HEADER.size:
+        return None
+    magic, size, mtime, *bounding_box, count = ATLAS_HEADER.unpack_from(data)
+    table_bytes = count * ATLAS_COLUMNS * 4
+    if magic != ATLAS_MAGIC or (size, mtime) != stamp:
+        return None
+    if len(data) < ATLAS_HEADER.size + table_bytes:
+        return None
+
+    table = np.frombuffer(
+        data, dtype="<i4", count=count * ATLAS_COLUMNS, offset=ATLAS_HEADER.size
+    ).reshape(count, ATLAS_COLUMNS)
+    pool = np.frombuffer(data, dtype=np.uint8, offset=ATLAS_HEADER.size + table_bytes)
+    if count and len(pool) < int((table[:, 4] * table[:, 5] + table[:, 6]).max()):
+        return None
+    return tuple(bounding_box), table, pool
+
+
+class BitmapFont(object):
+    def __init__(self, path, atlas_path=None):
+        self.path = path
+        self.atlas_path = f"{path}.atlas" if atlas_path is None else atlas_path
+        self._bounding_box = None
+        self._table = None
+        self._pool = None
+        self._rows = None
+        self._glyphs = {}
+
+    def _load(self):
+        if self._rows is not None:
+            return
+
+        atlas = open_atlas(self.path, self.atlas_path)
+        if atlas is None:
+            atlas = compile_atlas(self.path, self.atlas_path)
+        self._bounding_box, self._table, self._pool = atlas
+        self._rows = {
+            codepoint: row for row, codepoint in enumerate(self._table[:, 0].tolist())
+        }
+
+    def _glyph(self, codepoint):
+        glyph = self._glyphs.get(codepoint)
+        if glyph is None:
+            row = self._rows.get(codepoint)
+            if row is None:
+                return None
+            _, advance, x, top, height, width, offset = self._table[row].tolist()
+            bitmap = self._pool[offset:offset + height * width].view(bool)
+            glyph = self._glyphs[codepoint] = Glyph(
+                advance, x, top, bitmap.reshape(height, width)
+            )
+        return glyph
+
+    @property
+    def height(self):
+        self._load()
+        return self._bounding_box[1]
+
+    @property
+    def baseline(self):
+        self._load()
+        return self._bounding_box[1] + self._bounding_box[3]
+
+    def glyph(self, codepoint):
+        """Glyph for a codepoint, the replacement glyph, or None."""
+        self._load()
+        glyph = self._glyph(codepoint)
+        if glyph is None:
+            glyph = self._glyph(REPLACEMENT_CODEPOINT)
+        return glyph
+
+    def character_width(self, codepoint):
+        """Like graphics.Font.CharacterWidth: -1 if the glyph is missing."""
+        self._load()
+        glyph = self._glyph(codepoint)
+        return -1 if glyph is None else glyph.advance
+
+    def width(self, text):
+        glyphs = [self.glyph(ord(ch)) for ch in text]
+        return sum(glyph.advance for glyph in glyphs if glyph is not None)
+
+    def mask(self, text):
+        """Return (mask, left, top): the text's pixels as an (h, w) bool array.
+
+        left and top place the mask relative to the pen position, on the
+        baseline, that the text starts at.
+        """
+        placed = []
+        pen = 0
+        for ch in text:
+            glyph = self.glyph(ord(ch))
+            if glyph is None:
+                continue
+            placed.append((pen + glyph.x, glyph))
+            pen += glyph.advance
+
+        inked = [(x, glyph) for x, glyph in placed if glyph.bitmap.size]
+        if not inked:
+            return np.zeros((0, pen), dtype=bool), 0, 0
+
+        top = min(glyph.top for _, glyph in inked)
+        bottom = max(glyph.top + glyph.bitmap.shape[0] for _, glyph in inked)
+        left = min(0, min(x for x, _ in inked))
+        right = max(pen, max(x + glyph.bitmap.shape[1] for x, glyph in inked))
+
+        mask = np.zeros((bottom - top, right - left), dtype=bool)
+        for x, glyph in inked:
+            h, w = glyph.bitmap.shape
+            y = glyph.top - top
+            mask[y:y + h, x - left:x - left + w] |= glyph.bitmap
+        return mask, left, top
+
+
+@lru_cache(maxsize=512)
+def width(font, text):
+    """Pixel width of text in font; what graphics.DrawText returns."""
+    return font.width(text)
+
+
+def strip(font, text, colour):
+    """Prerendered Sprite of text, anchored at the baseline like DrawText."""
+    return _strip(font, text, (colour.red, colour.green, colour.blue))
+
+
+@lru_cache(maxsize=64)
+def _strip(font, text, rgb):
+    mask, left, top = font.mask(text)
+    pixels = np.zeros(mask.shape + (3,), dtype=np.uint8)
+    pixels[mask] = rgb
+    return Sprite(pixels, mask, left, top)
+
+
+def draw(tracked, font, x, y, colour, string):
+    """graphics.DrawText for the current TrackedCanvas pass; returns the width."""
+    strip(font, string, colour).draw(tracked, x, y)
+    return width(font, string)